@@ -1,32 +1,57 @@
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
 from ..choices import BookingStatusChoices
 
 
+def _update_status(modeladmin, request, queryset, status, message):
+    # Массовое обновление минует save(), поэтому занятые ночи пересчитываем явно
+    from apps.listings.services import sync_booking_nights
+
+    # Фиксируем выбранные id заранее: фильтры changelist могут зависеть от статуса
+    bookings = queryset.model.objects.filter(pk__in=list(queryset.values_list('pk', flat=True)))
+
+    try:
+        with transaction.atomic():
+            # update() не трогает auto_now полей, а по ним строятся ETag и Last-Modified
+            now = timezone.now()
+            bookings.update(status=status, status_changed_at=now, updated_at=now)
+            sync_booking_nights(bookings)
+    except ValidationError:
+        modeladmin.message_user(
+            request, "Selected bookings overlap with other bookings for the same dates.", level=messages.ERROR
+        )
+        return
+
+    modeladmin.message_user(request, message)
+
+
 @admin.action(description='Mark selected bookings as Requested')
 def make_requested(modeladmin, request, queryset):
-    queryset.update(status=BookingStatusChoices.REQUEST)
-    modeladmin.message_user(request, "Selected bookings have been marked as Requested.")
+    _update_status(modeladmin, request, queryset, BookingStatusChoices.REQUEST,
+                   "Selected bookings have been marked as Requested.")
 
 
 @admin.action(description='Confirm selected bookings')
 def make_confirmed(modeladmin, request, queryset):
-    queryset.update(status=BookingStatusChoices.CONFIRMED)
-    modeladmin.message_user(request, "Selected bookings have been confirmed.")
+    _update_status(modeladmin, request, queryset, BookingStatusChoices.CONFIRMED,
+                   "Selected bookings have been confirmed.")
 
 
 @admin.action(description='Complete selected bookings')
 def make_completed(modeladmin, request, queryset):
-    queryset.update(status=BookingStatusChoices.COMPLETED)
-    modeladmin.message_user(request, "Selected bookings have been completed.")
+    _update_status(modeladmin, request, queryset, BookingStatusChoices.COMPLETED,
+                   "Selected bookings have been completed.")
 
 
 @admin.action(description='Cancel selected bookings')
 def make_canceled(modeladmin, request, queryset):
-    queryset.update(status=BookingStatusChoices.CANCELED)
-    modeladmin.message_user(request, "Selected bookings have been canceled.")
+    _update_status(modeladmin, request, queryset, BookingStatusChoices.CANCELED,
+                   "Selected bookings have been canceled.")
 
 
 @admin.action(description='Soft delete selected bookings')
 def make_deleted(modeladmin, request, queryset):
-    queryset.update(status=BookingStatusChoices.DELETED)
-    modeladmin.message_user(request, "Selected bookings have been soft deleted.")
\ No newline at end of file
+    _update_status(modeladmin, request, queryset, BookingStatusChoices.DELETED,
+                   "Selected bookings have been soft deleted.")
@@ -1,6 +1,12 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete
 
 
 class BookingConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.bookings'
+
+    def ready(self):
+        from .models import Booking
+        from .signals import invalidate_calendar_on_delete
+        post_delete.connect(invalidate_calendar_on_delete, sender=Booking)
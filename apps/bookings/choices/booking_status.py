@@ -9,6 +9,11 @@ class BookingStatusChoices(models.IntegerChoices):
     CANCELED = 5, 'Canceled'
     DELETED = 6, 'Deleted'
 
+    @classmethod
+    def blocking_statuses(cls):
+        # Статусы, при которых бронирование занимает даты листинга
+        return [cls.CONFIRMED, cls.REQUEST]
+
 
 class BookingStatusColors(models.IntegerChoices):
     YELLOW = 1, 'yellow'
@@ -1,12 +1,13 @@
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
 from django.utils import timezone
 from datetime import timedelta
 from django.core.exceptions import ValidationError
+from common.mixins import ChangedFieldsSaveMixin
 from ..choices import BookingStatusChoices
 
 
-class Booking(models.Model):
+class Booking(ChangedFieldsSaveMixin, models.Model):
     listing = models.ForeignKey(
         'listings.Listing',
         related_name='bookings',
@@ -17,6 +18,8 @@ class Booking(models.Model):
         related_name='bookings',
         on_delete=models.CASCADE
     )
+    # Копия user.username для списков без join к пользователям; синхронизируется из User.save
+    user_username = models.CharField(max_length=50, blank=True, default='', editable=False)
     start_date = models.DateField(db_index=True)
     end_date = models.DateField(db_index=True)
     total_price = models.DecimalField(max_digits=10, decimal_places=2)
@@ -29,6 +32,8 @@ class Booking(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)  # Новое поле
 
+    _check_availability = True
+
     class Meta:
         indexes = [
             models.Index(fields=['listing', 'start_date', 'end_date', 'status']),
@@ -56,31 +61,54 @@ class Booking(models.Model):
         if self.start_date > max_booking_date:
             raise ValidationError('Start date cannot be more than 90 days from today.')
 
-        # Проверка доступности
-        if not self.listing.is_available(self.start_date, self.end_date, exclude_booking_id=self.id):
+        # Проверка доступности (пропускается, если она уже выполнена под блокировкой листинга)
+        if self._check_availability and not self.listing.is_available(
+                self.start_date, self.end_date, exclude_booking_id=self.id):
             raise ValidationError('Selected dates are not available.')
 
-    def save(self, *args, **kwargs):
-        if self.pk:
-            old_instance = Booking.objects.get(pk=self.pk)
+    def save(self, *args, check_availability=True, **kwargs):
+        nights_changed = True
+        previous_listing_id = None
+
+        if not self._state.adding:
+            # Изменения берем из снимка, сделанного при загрузке, без повторного чтения строки
+            dirty_fields = self.get_dirty_fields(check_relationship=True)
+            dates_changed = 'start_date' in dirty_fields or 'end_date' in dirty_fields
 
             # Проверка изменения статуса
-            if old_instance.status != self.status:
+            if 'status' in dirty_fields:
                 self.status_changed_at = timezone.now()
 
             # Проверка изменения дат или цены
-            if old_instance.start_date != self.start_date or old_instance.end_date != self.end_date:
-                self.listing.refresh_from_db()
+            if dates_changed:
                 num_days = (self.end_date - self.start_date).days
                 self.total_price = self.listing.price * num_days
+
+            # Занятые ночи пересчитываем только при изменении статуса, дат или листинга
+            nights_changed = dates_changed or 'status' in dirty_fields or 'listing' in dirty_fields
+            previous_listing_id = dirty_fields.get('listing')
+            if 'user' in dirty_fields:
+                self.user_username = self.user.username
         else:
             # Новый объект, всегда рассчитываем total_price
             num_days = (self.end_date - self.start_date).days
             self.total_price = self.listing.price * num_days
+            self.user_username = self.user.username
 
         # Проверка и сохранение
-        self.full_clean()
-        super().save(*args, **kwargs)
+        self._check_availability = check_availability
+        try:
+            self.full_clean()
+        finally:
+            self._check_availability = True
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if nights_changed:
+                self._sync_nights()
+            if previous_listing_id is not None:
+                # Бронирование перенесено: календарь прежнего листинга тоже изменился
+                from apps.listings.services import invalidate_listing_calendars
+                invalidate_listing_calendars([previous_listing_id])
 
     def request(self):
         self._change_status(BookingStatusChoices.REQUEST)
@@ -102,4 +130,11 @@ class Booking(models.Model):
         if self.status != new_status:
             self.status = new_status
             self.status_changed_at = timezone.now()  # Обновляем дату изменения статуса
-            super().save(update_fields=['status', 'status_changed_at'])
+            with transaction.atomic():
+                super().save(update_fields=['status', 'status_changed_at'])
+                self._sync_nights()
+
+    def _sync_nights(self):
+        # Импорт внутри метода: сервисы листингов сами зависят от модели бронирования
+        from apps.listings.services import sync_booking_nights
+        sync_booking_nights([self])
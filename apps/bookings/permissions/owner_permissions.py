@@ -1,5 +1,5 @@
 from rest_framework.permissions import BasePermission
-from apps.listings.models import Listing
+from common.utils.ownership import is_owner
 
 
 class IsBookingOwner(BasePermission):
@@ -8,7 +8,7 @@ class IsBookingOwner(BasePermission):
     """
 
     def has_object_permission(self, request, view, obj):
-        return request.user == obj.user or request.user.is_staff
+        return is_owner(request.user, obj, 'user_id') or request.user.is_staff
 
     def has_permission(self, request, view):
         # Проверка для создания бронирования
@@ -20,10 +20,11 @@ class IsListingOwner(BasePermission):
     Дает доступ к бронированиям только владельцу хотя бы одного листинга.
     """
     def has_permission(self, request, view):
-        return request.user.is_authenticated and Listing.objects.filter(owner=request.user).exists()
+        # Флаг хоста денормализован на пользователе и читается из кеша пользователей, без запроса к листингам
+        return request.user.is_authenticated and request.user.is_host
 
     def has_object_permission(self, request, view, obj):
-        return request.user == obj.listing.owner or request.user.is_staff
+        return is_owner(request.user, obj, 'listing.owner_id') or request.user.is_staff
 
 
 class IsAdminOrBookingOwnerOrListingOwner(BasePermission):
@@ -32,8 +33,4 @@ class IsAdminOrBookingOwnerOrListingOwner(BasePermission):
     """
 
     def has_object_permission(self, request, view, obj):
-        return (
-            request.user == obj.user or
-            request.user == obj.listing.owner or
-            request.user.is_staff
-        )
+        return is_owner(request.user, obj, 'user_id', 'listing.owner_id') or request.user.is_staff
@@ -1,14 +1,15 @@
 from rest_framework import serializers
-from django.core.exceptions import PermissionDenied
+from django.core.exceptions import PermissionDenied, ValidationError as DjangoValidationError
 from apps.users.models import User
 from apps.listings.models import Listing
+from common.utils.ownership import is_owner
 from ..models import Booking
+from ..services import reserve_booking
 
 
 class BookingListSerializer(serializers.ModelSerializer):
     listing_title = serializers.ReadOnlyField(source='listing.title')
-    user_id = serializers.ReadOnlyField(source='user.id')
-    user_username = serializers.ReadOnlyField(source='user.username')  # Имя владельца бронирования
+    user_id = serializers.ReadOnlyField()
     status_display = serializers.CharField(source='get_status_display', read_only=True)
 
     class Meta:
@@ -25,12 +26,12 @@ class BookingListSerializer(serializers.ModelSerializer):
 
         # Ограничиваем отображаемые поля
         if not request.user.is_staff:
-            if request.user == instance.user:
+            if is_owner(request.user, instance, 'user_id'):
                 public_fields = [
                     'id', 'listing_id', 'listing_title', 'status_display', 'status_changed_at'
                 ]
                 representation = {key: representation[key] for key in public_fields}
-            elif request.user == instance.listing.owner:
+            elif is_owner(request.user, instance, 'listing.owner_id'):
                 public_fields = [
                     'id', 'user_id', 'user_username', 'status_display', 'status_changed_at'
                 ]
@@ -41,8 +42,7 @@ class BookingListSerializer(serializers.ModelSerializer):
 
 class BookingDetailSerializer(serializers.ModelSerializer):
     listing_title = serializers.ReadOnlyField(source='listing.title')
-    user_id = serializers.ReadOnlyField(source='user.id')
-    user_username = serializers.ReadOnlyField(source='user.username')
+    user_id = serializers.ReadOnlyField()
     status_display = serializers.CharField(source='get_status_display', read_only=True)
 
     class Meta:
@@ -60,14 +60,14 @@ class BookingDetailSerializer(serializers.ModelSerializer):
 
         # Ограничиваем видимость полей для владельца бронирования
         if not request.user.is_staff:
-            if request.user == instance.user:
+            if is_owner(request.user, instance, 'user_id'):
                 public_fields = [
                     'id', 'listing_id', 'listing_title', 'start_date', 'end_date', 'total_price',
                     'status_display', 'status_changed_at'
                 ]
                 representation = {key: representation[key] for key in public_fields}
             # Ограничиваем видимость полей для владельца листинга
-            elif request.user == instance.listing.owner:
+            elif is_owner(request.user, instance, 'listing.owner_id'):
                 public_fields = [
                     'id', 'user_id', 'user_username', 'start_date', 'end_date', 'total_price',
                     'status_display', 'status_changed_at'
@@ -105,13 +105,9 @@ class BookingCreateSerializer(serializers.ModelSerializer):
         except Listing.DoesNotExist:
             raise serializers.ValidationError("Listing not found.")
 
-        # Устанавливаем listing в данных
+        # Устанавливаем listing в данных; доступность проверяется один раз при создании, под блокировкой
         data['listing'] = listing
 
-        # Проверка доступности листинга для указанных дат
-        if not listing.is_available(data['start_date'], data['end_date']):
-            raise serializers.ValidationError('The selected dates are not available for this listing.')
-
         # Если пользователь не администратор, устанавливаем текущего пользователя
         if not user.is_staff:
             data['user'] = user
@@ -122,6 +118,17 @@ class BookingCreateSerializer(serializers.ModelSerializer):
 
         return data
 
+    def create(self, validated_data):
+        try:
+            return reserve_booking(
+                validated_data['listing'].id,
+                validated_data['user'],
+                validated_data['start_date'],
+                validated_data['end_date'],
+            )
+        except DjangoValidationError as e:
+            raise serializers.ValidationError(e.messages)
+
 
 class BookingUpdateSerializer(serializers.ModelSerializer):
     class Meta:
@@ -0,0 +1 @@
+from .booking_service import reserve_booking
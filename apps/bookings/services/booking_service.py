@@ -0,0 +1,42 @@
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import OperationalError, transaction
+from apps.listings.models import Listing
+from ..models import Booking
+
+# Коды MySQL: 1213 — deadlock, 1205 — превышено ожидание блокировки
+RETRYABLE_ERROR_CODES = (1213, 1205)
+
+
+def _is_retryable(error):
+    return bool(error.args) and error.args[0] in RETRYABLE_ERROR_CODES
+
+
+def reserve_booking(listing_id, user, start_date, end_date):
+    """
+    Создает бронирование под блокировкой строки листинга.
+
+    Внутри одной транзакции выполняется ровно одна проверка пересечений и вставка,
+    поэтому параллельные запросы на тот же листинг не могут занять одни и те же даты.
+    При deadlock транзакция повторяется до BOOKING_RESERVATION_RETRIES раз.
+    """
+    retries = getattr(settings, 'BOOKING_RESERVATION_RETRIES', 3)
+
+    for attempt in range(retries + 1):
+        try:
+            with transaction.atomic():
+                try:
+                    listing = Listing.objects.select_for_update().get(pk=listing_id)
+                except Listing.DoesNotExist:
+                    raise ValidationError('Listing not found.')
+
+                if not listing.is_available(start_date, end_date):
+                    raise ValidationError('The selected dates are not available for this listing.')
+
+                booking = Booking(listing=listing, user=user, start_date=start_date, end_date=end_date)
+                # Доступность уже проверена под блокировкой, повторная проверка в clean() не нужна
+                booking.save(check_availability=False)
+                return booking
+        except OperationalError as error:
+            if attempt == retries or not _is_retryable(error):
+                raise
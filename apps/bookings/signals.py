@@ -0,0 +1,6 @@
+from apps.listings.services import invalidate_listing_calendars
+
+
+def invalidate_calendar_on_delete(sender, instance, **kwargs):
+    # post_delete приходит и при каскадном и массовом удалении, которые минуют Booking.delete()
+    invalidate_listing_calendars([instance.listing_id])
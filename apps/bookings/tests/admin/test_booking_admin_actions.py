@@ -132,3 +132,26 @@ class TestBookingAdminActions(TestCase):
         self.booking2.refresh_from_db()
         self.assertEqual(self.booking1.status, BookingStatusChoices.DELETED)
         self.assertEqual(self.booking2.status, BookingStatusChoices.DELETED)
+
+    def test_make_confirmed_action_rejects_overlapping_bookings(self):
+        overlapping = Booking.objects.create(
+            listing=self.listing,
+            user=self.user,
+            start_date=timezone.now().date() + timedelta(days=8),
+            end_date=timezone.now().date() + timedelta(days=12),
+            status=BookingStatusChoices.PENDING,
+            total_price=400.0
+        )
+        url = reverse('admin:bookings_booking_changelist')
+        data = {
+            'action': 'make_confirmed',
+            '_selected_action': [self.booking1.pk, overlapping.pk],
+        }
+        response = self.client.post(url, data, follow=True)
+        self.assertEqual(response.status_code, 200)
+
+        # Пересекающиеся бронирования не подтверждаются, статусы откатываются
+        self.booking1.refresh_from_db()
+        overlapping.refresh_from_db()
+        self.assertEqual(self.booking1.status, BookingStatusChoices.PENDING)
+        self.assertEqual(overlapping.status, BookingStatusChoices.PENDING)
@@ -9,6 +9,8 @@ from django.utils import timezone
 from unittest.mock import patch
 from decimal import Decimal
 from time import sleep
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 User = get_user_model()
 
@@ -146,3 +148,36 @@ class BookingSaveMethodTest(TestCase):
         booking.refresh_from_db()
         self.assertEqual(booking.total_price, old_total_price,
                          "Total price не должен изменяться при сохранении без изменений.")
+
+    @patch('django.utils.timezone.now')
+    def test_save_update_does_not_reread_booking(self, mock_now):
+        """
+        Проверка, что обновление не перечитывает бронирование и листинг из БД.
+        """
+        mock_now.return_value = timezone.make_aware(datetime.combine(self.today, datetime.min.time()))
+        booking = self.create_booking(1, 4)
+        booking.end_date += timedelta(days=1)
+
+        with CaptureQueriesContext(connection) as context:
+            booking.save()
+
+        selects = [query['sql'] for query in context.captured_queries
+                   if query['sql'].startswith('SELECT') and 'FROM "bookings_booking"' in query['sql']
+                   and '"bookings_booking"."end_date" >' not in query['sql']]
+        self.assertEqual(selects, [], "Бронирование не должно перечитываться при сохранении.")
+        self.assertFalse(any('"listings_listing"."price"' in query['sql'] for query in context.captured_queries))
+
+    @patch('django.utils.timezone.now')
+    def test_save_update_writes_only_changed_fields(self, mock_now):
+        mock_now.return_value = timezone.make_aware(datetime.combine(self.today, datetime.min.time()))
+        booking = self.create_booking(1, 4)
+        booking.status = BookingStatusChoices.CANCELED
+
+        with CaptureQueriesContext(connection) as context:
+            booking.save()
+
+        update_sql = next(query['sql'] for query in context.captured_queries if query['sql'].startswith('UPDATE'))
+        self.assertIn('"status"', update_sql)
+        self.assertIn('"status_changed_at"', update_sql)
+        self.assertNotIn('"start_date"', update_sql)
+        self.assertNotIn('"total_price"', update_sql)
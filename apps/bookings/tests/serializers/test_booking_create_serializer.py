@@ -9,6 +9,7 @@ from apps.listings.choices import ListingStatusChoices
 from django.utils import timezone
 from datetime import timedelta
 from unittest.mock import Mock
+from rest_framework.exceptions import ValidationError
 
 
 class TestBookingCreateSerializer(TestCase):
@@ -108,5 +109,8 @@ class TestBookingCreateSerializer(TestCase):
         view_mock = Mock()
         view_mock.kwargs = {'listing_id': self.listing.id}
         serializer = BookingCreateSerializer(data=self.valid_data, context={'request': self.request, 'view': view_mock})
-        self.assertFalse(serializer.is_valid())
-        self.assertIn('non_field_errors', serializer.errors)
+        # Доступность проверяется один раз при создании, под блокировкой листинга
+        self.assertTrue(serializer.is_valid())
+        with self.assertRaises(ValidationError):
+            serializer.save()
+        self.assertEqual(Booking.objects.filter(listing=self.listing).count(), 1)
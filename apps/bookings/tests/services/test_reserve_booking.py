@@ -0,0 +1,93 @@
+from datetime import timedelta
+from unittest.mock import patch
+from django.core.exceptions import ValidationError
+from django.db import OperationalError, connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+from apps.bookings.choices import BookingStatusChoices
+from apps.bookings.models import Booking
+from apps.bookings.services import reserve_booking
+from apps.listings.choices import ListingStatusChoices
+from apps.listings.models import Listing
+
+User = get_user_model()
+
+
+class ReserveBookingTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='testuser@example.com',
+            password='password123',
+            is_business_account=True
+        )
+        self.listing = Listing.objects.create(
+            title='Test Listing',
+            owner=self.user,
+            description='Test description',
+            location='Test Location',
+            address='123 Test St',
+            price=100.0,
+            rooms=3,
+            status=ListingStatusChoices.ACTIVE
+        )
+        self.today = timezone.now().date()
+
+    def day(self, offset):
+        return self.today + timedelta(days=offset)
+
+    def test_creates_booking(self):
+        booking = reserve_booking(self.listing.id, self.user, self.day(5), self.day(8))
+
+        self.assertEqual(booking.listing, self.listing)
+        self.assertEqual(booking.total_price, 300)
+        self.assertEqual(booking.status, BookingStatusChoices.PENDING)
+
+    def test_rejects_overlapping_dates(self):
+        Booking.objects.create(
+            listing=self.listing, user=self.user, start_date=self.day(5), end_date=self.day(10),
+            status=BookingStatusChoices.CONFIRMED
+        )
+
+        with self.assertRaises(ValidationError):
+            reserve_booking(self.listing.id, self.user, self.day(8), self.day(12))
+        self.assertEqual(Booking.objects.count(), 1)
+
+    def test_missing_listing(self):
+        with self.assertRaises(ValidationError):
+            reserve_booking(999999, self.user, self.day(5), self.day(8))
+
+    def test_single_availability_check(self):
+        with CaptureQueriesContext(connection) as context:
+            reserve_booking(self.listing.id, self.user, self.day(5), self.day(8))
+
+        overlap_checks = [query for query in context.captured_queries if 'bookings_booking' in query['sql']
+                          and 'SELECT' in query['sql'] and 'end_date' in query['sql']]
+        self.assertEqual(len(overlap_checks), 1)
+
+    @override_settings(BOOKING_RESERVATION_RETRIES=2)
+    def test_retries_on_deadlock(self):
+        original_save = Booking.save
+        calls = []
+
+        def flaky_save(booking, *args, **kwargs):
+            calls.append(booking)
+            if len(calls) == 1:
+                raise OperationalError(1213, 'Deadlock found when trying to get lock')
+            return original_save(booking, *args, **kwargs)
+
+        with patch.object(Booking, 'save', flaky_save):
+            booking = reserve_booking(self.listing.id, self.user, self.day(5), self.day(8))
+
+        self.assertEqual(len(calls), 2)
+        self.assertTrue(Booking.objects.filter(pk=booking.pk).exists())
+
+    @override_settings(BOOKING_RESERVATION_RETRIES=1)
+    def test_gives_up_after_retries(self):
+        error = OperationalError(1213, 'Deadlock found when trying to get lock')
+
+        with patch.object(Booking, 'save', side_effect=error):
+            with self.assertRaises(OperationalError):
+                reserve_booking(self.listing.id, self.user, self.day(5), self.day(8))
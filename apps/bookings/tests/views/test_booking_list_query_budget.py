@@ -0,0 +1,92 @@
+from datetime import timedelta
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, APITestCase
+from apps.bookings.models import Booking
+from apps.bookings.serializers import BookingListSerializer
+from apps.bookings.views.booking_views import BookingListShapingMixin
+from apps.listings.models import Listing
+from apps.listings.choices import ListingStatusChoices
+from apps.users.models import User
+from common.utils.query_budget import QueryBudgetTestMixin
+
+
+class BookingListQueryBudgetTests(QueryBudgetTestMixin, APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username='owner', email='owner@example.com', password='password123', is_business_account=True
+        )
+        self.admin = User.objects.create_user(
+            username='admin', email='admin@example.com', password='password123', is_staff=True
+        )
+        self.guest = User.objects.create_user(
+            username='guest', email='guest@example.com', password='password123'
+        )
+        self.listing = Listing.objects.create(
+            owner=self.owner,
+            title='Budget Listing',
+            description='Description',
+            location='Berlin',
+            address='Address',
+            price=100,
+            rooms=2,
+            status=ListingStatusChoices.ACTIVE
+        )
+
+        # Каждое бронирование от отдельного пользователя и для отдельного листинга, чтобы N+1 был заметен
+        today = timezone.now().date()
+        for i in range(10):
+            user = User.objects.create_user(
+                username=f'user{i}', email=f'user{i}@example.com', password='password123'
+            )
+            listing = Listing.objects.create(
+                owner=self.owner,
+                title=f'Budget Listing {i}',
+                description='Description',
+                location='Berlin',
+                address='Address',
+                price=100,
+                rooms=2,
+                status=ListingStatusChoices.ACTIVE
+            )
+            for booking_user, booking_listing in ((user, self.listing), (self.guest, listing)):
+                Booking.objects.create(
+                    listing=booking_listing,
+                    user=booking_user,
+                    start_date=today + timedelta(days=i * 3 + 1),
+                    end_date=today + timedelta(days=i * 3 + 3),
+                )
+
+    def test_owner_listing_bookings_list(self):
+        self.client.force_authenticate(user=self.owner)
+        self.assertQueryBudget(reverse('owner-listing-bookings-list'), budget=3)
+
+    def test_owner_listing_bookings_list_staff(self):
+        self.client.force_authenticate(user=self.admin)
+        self.assertQueryBudget(reverse('owner-listing-bookings-list'), budget=3)
+
+    def test_listing_bookings_list(self):
+        self.client.force_authenticate(user=self.owner)
+        self.assertQueryBudget(reverse('listing-bookings-list', args=[self.listing.id]), budget=5)
+
+    def test_user_bookings_list(self):
+        self.client.force_authenticate(user=self.guest)
+        self.assertQueryBudget(reverse('user-bookings-list'), budget=2)
+
+    def test_serialization_loads_no_related_rows(self):
+        # Владельцы сверяются по *_id: после выборки страницы сериализатор не делает запросов ни для одной строки
+        bookings = list(BookingListShapingMixin().shape_queryset(Booking.objects.order_by('id')))
+        self.assertEqual(len(bookings), 20)
+
+        for user in (self.owner, self.guest, self.admin):
+            request = APIRequestFactory().get('/')
+            request.user = user
+            with self.assertNumQueries(0):
+                data = BookingListSerializer(bookings, many=True, context={'request': request}).data
+            self.assertEqual(len(data), 20)
+
+        request.user = self.guest
+        representation = BookingListSerializer(bookings[1], context={'request': request}).data
+        self.assertEqual(
+            set(representation), {'id', 'listing_id', 'listing_title', 'status_display', 'status_changed_at'}
+        )
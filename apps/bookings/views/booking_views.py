@@ -9,11 +9,27 @@ from django.shortcuts import get_object_or_404
 from apps.listings.models import Listing
 from django.core.exceptions import PermissionDenied
 from rest_framework.exceptions import ValidationError
+from common.mixins import QuerySetShapingMixin, ConditionalGetMixin
+from common.pagination import EstimatedCountPagination
+from common.utils.ownership import is_owner
 
 
-class OwnerListingBookingsListView(generics.ListAPIView):
+class BookingListShapingMixin(ConditionalGetMixin, QuerySetShapingMixin):
+    # Название листинга входит в ответ, поэтому его изменение тоже меняет ETag
+    last_modified_fields = ('updated_at', 'status_changed_at', 'listing.updated_at')
+    # Колонки, которые читают BookingListSerializer, его to_representation и валидаторы ETag;
+    # владельцы сверяются по user_id и listing.owner_id, строки пользователей не загружаются
+    select_related_fields = ('listing',)
+    only_fields = (
+        'id', 'status', 'status_changed_at', 'updated_at', 'listing', 'user',
+        'user_username', 'listing__title', 'listing__owner', 'listing__updated_at',
+    )
+
+
+class OwnerListingBookingsListView(BookingListShapingMixin, generics.ListAPIView):
     serializer_class = BookingListSerializer
     permission_classes = [IsAuthenticated, IsListingOwner | IsAdminUser]
+    pagination_class = EstimatedCountPagination
 
     def get_queryset(self):
         user = self.request.user
@@ -26,7 +42,7 @@ class OwnerListingBookingsListView(generics.ListAPIView):
         ).exclude(status=BookingStatusChoices.DELETED).order_by('-created_at')
 
 
-class ListingBookingsListView(generics.ListAPIView):
+class ListingBookingsListView(BookingListShapingMixin, generics.ListAPIView):
     serializer_class = BookingListSerializer
     permission_classes = [IsAuthenticated, IsListingOwner | IsAdminUser]
 
@@ -36,7 +52,7 @@ class ListingBookingsListView(generics.ListAPIView):
 
         # Проверка, что пользователь — владелец листинга или администратор
         listing = get_object_or_404(Listing, id=listing_id)
-        if not (user == listing.owner or user.is_staff):
+        if not (is_owner(user, listing, 'owner_id') or user.is_staff):
             raise PermissionDenied("You do not have permission to view bookings for this listing.")
 
         # Вернуть все бронирования для данного листинга
@@ -49,7 +65,7 @@ class ListingBookingsListView(generics.ListAPIView):
         ).exclude(status=BookingStatusChoices.DELETED).order_by('-created_at')
 
 
-class UserBookingsListView(generics.ListAPIView):
+class UserBookingsListView(BookingListShapingMixin, generics.ListAPIView):
     serializer_class = BookingListSerializer
     permission_classes = [IsAuthenticated]
 
@@ -63,19 +79,21 @@ class UserBookingsListView(generics.ListAPIView):
         return Booking.objects.filter(user=user).exclude(status=BookingStatusChoices.DELETED).order_by('-created_at')
 
 
-class BookingDetailView(generics.RetrieveAPIView):
+class BookingDetailView(ConditionalGetMixin, generics.RetrieveAPIView):
     serializer_class = BookingDetailSerializer
     permission_classes = [IsAuthenticated, IsAdminOrBookingOwnerOrListingOwner]
     lookup_field = 'id'
+    last_modified_fields = ('updated_at', 'status_changed_at', 'listing.updated_at')
 
     def get_queryset(self):
         user = self.request.user
         if user.is_staff:
             # Администратор видит все бронирования, включая удаленные
-            return Booking.objects.all()
+            return Booking.objects.select_related('listing')
 
-        # Обычные пользователи и владельцы видят только бронирования, кроме удаленных
-        return Booking.objects.exclude(status=BookingStatusChoices.DELETED)
+        # Обычные пользователи и владельцы видят только бронирования, кроме удаленных;
+        # листинг загружается тем же запросом, его владельца сверяют пермишены
+        return Booking.objects.exclude(status=BookingStatusChoices.DELETED).select_related('listing')
 
 
 class BookingCreateView(generics.CreateAPIView):
@@ -83,19 +101,8 @@ class BookingCreateView(generics.CreateAPIView):
     permission_classes = [IsAuthenticated]
 
     def perform_create(self, serializer):
-        # Получаем listing_id из URL
-        listing_id = self.kwargs.get('listing_id')
-        listing = get_object_or_404(Listing, id=listing_id)
-
-        # Получаем пользователя из сериализатора или устанавливаем текущего пользователя
-        user = serializer.validated_data.get('user', self.request.user)
-
-        # Проверяем доступность листинга для указанных дат
-        if not listing.is_available(serializer.validated_data['start_date'], serializer.validated_data['end_date']):
-            raise ValidationError('The selected dates are not available for this listing.')
-
-        # Сохраняем бронирование с правильным пользователем и листингом
-        serializer.save(user=user, listing=listing)
+        # Листинг и пользователь установлены в сериализаторе, бронирование создается под блокировкой листинга
+        serializer.save()
 
 
 class BookingUpdateView(generics.UpdateAPIView):
@@ -120,7 +127,8 @@ class BaseBookingStatusUpdateView(generics.UpdateAPIView):
     action = None  # Устанавливается в подклассах
 
     def get_queryset(self):
-        return Booking.objects.all()  # Контроль доступа через пермишены
+        # Контроль доступа через пермишены; владельца листинга они сверяют по загруженному тем же запросом листингу
+        return Booking.objects.select_related('listing')
 
     def perform_update(self, serializer):
         booking = self.get_object()
@@ -1,21 +1,36 @@
 from django.contrib import admin
+from django.utils import timezone
 from ..choices import ListingStatusChoices
+from ..services import index_listings, invalidate_listing_cache
+
+
+def _update_status(modeladmin, request, queryset, status, message):
+    # Фиксируем выбранные id заранее: фильтры changelist могут зависеть от статуса
+    listing_ids = list(queryset.values_list('pk', flat=True))
+    listings = queryset.model.objects.filter(pk__in=listing_ids)
+    # update() не трогает auto_now полей, а по ним строятся ETag и Last-Modified
+    now = timezone.now()
+    listings.update(status=status, status_changed_at=now, updated_at=now)
+
+    # Массовое обновление минует save(), поэтому кеш и поисковый индекс обновляем явно
+    invalidate_listing_cache(listing_ids)
+    index_listings(listings)
+    modeladmin.message_user(request, message)
 
 
 @admin.action(description='Mark selected listings as Active')
 def make_active(modeladmin, request, queryset):
-    queryset.update(status=ListingStatusChoices.ACTIVE)
-    modeladmin.message_user(request, "Selected listings have been marked as Active.")
+    _update_status(modeladmin, request, queryset, ListingStatusChoices.ACTIVE,
+                   "Selected listings have been marked as Active.")
 
 
 @admin.action(description='Mark selected listings as Deactivated')
 def make_deactivated(modeladmin, request, queryset):
-    queryset.update(status=ListingStatusChoices.DEACTIVATED)
-    modeladmin.message_user(request, "Selected listings have been marked as Deactivated.")
+    _update_status(modeladmin, request, queryset, ListingStatusChoices.DEACTIVATED,
+                   "Selected listings have been marked as Deactivated.")
 
 
 @admin.action(description='Soft delete selected listings')
 def make_deleted(modeladmin, request, queryset):
-    queryset.update(status=ListingStatusChoices.DELETED)
-    modeladmin.message_user(request, "Selected listings have been soft deleted.")
-
+    _update_status(modeladmin, request, queryset, ListingStatusChoices.DELETED,
+                   "Selected listings have been soft deleted.")
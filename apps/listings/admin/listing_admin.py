@@ -1,5 +1,8 @@
 from django.contrib import admin
+from django.db import transaction
+from apps.users.services import recalculate_listing_counts
 from ..models import Listing
+from ..services import unindex_listings
 from ..actions import make_active, make_deactivated, make_deleted
 from ..forms import ListingAdminForm
 from ..mixins import StatusMixin, SoftDeleteMixin
@@ -14,10 +17,18 @@ class ListingAdmin(StatusMixin, SoftDeleteMixin, admin.ModelAdmin):
         (None, {'fields': ('title', 'description')}),
         ('Owner', {'fields': ('owner',)}),
         ('Listing Details', {'fields': ('price', 'rooms', 'property_type')}),
-        ('Listing Location', {'fields': ('location', 'address')}),
+        ('Listing Location', {'fields': ('location', 'address', 'latitude', 'longitude')}),
         ('Status', {'fields': ('status_choice', 'is_soft_deleted', 'status_changed_at')}),
         ('Metadata', {'fields': ('created_at', 'updated_at')}),
     )
     search_fields = ('title', 'description', 'owner__username', 'location', 'address')
     actions = [make_active, make_deactivated, make_deleted]
     readonly_fields = ('status_changed_at', 'created_at', 'updated_at')
+
+    def delete_queryset(self, request, queryset):
+        # Массовое удаление минует Listing.delete(): счетчики владельцев и поисковый индекс обновляем явно
+        rows = list(queryset.values_list('id', 'owner_id'))
+        with transaction.atomic():
+            super().delete_queryset(request, queryset)
+            recalculate_listing_counts({owner_id for _listing_id, owner_id in rows})
+            unindex_listings(listing_id for listing_id, _owner_id in rows)
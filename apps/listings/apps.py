@@ -1,6 +1,14 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_migrate
 
 
 class ListingsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.listings'
+
+    def ready(self):
+        from .models import Listing
+        from .search import ensure_fulltext_index
+        from .signals import invalidate_caches_on_delete
+        post_migrate.connect(ensure_fulltext_index, sender=self)
+        post_delete.connect(invalidate_caches_on_delete, sender=Listing)
@@ -0,0 +1,2 @@
+from .listing_filters import ListingFilter
+from .full_text_search_filter import FullTextSearchFilter
@@ -0,0 +1,74 @@
+from functools import reduce
+from operator import or_
+from django.conf import settings
+from django.db.models import Case, FloatField, IntegerField, Q, Value, When
+from django.db.models.expressions import RawSQL
+from rest_framework.filters import SearchFilter
+from ..search import FULLTEXT_FIELDS, InvertedIndex, fulltext_supported, tokenize
+
+# innodb_ft_min_token_size: более короткие термы не попадают в FULLTEXT-индекс
+MIN_FULLTEXT_TOKEN_SIZE = 3
+
+
+class FullTextSearchFilter(SearchFilter):
+    """
+    Полнотекстовый поиск по title, description, location и address.
+
+    На MySQL использует FULLTEXT-индекс (MATCH ... AGAINST в boolean mode) и сортирует по релевантности;
+    на остальных базах сужает queryset по подстрокам термов и ранжирует не больше
+    FULLTEXT_FALLBACK_MAX_ROWS кандидатов инвертированным индексом в памяти.
+    Все термы запроса обязательны и сопоставляются по префиксу.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, '')
+        terms = tokenize(query)
+        if not terms:
+            return queryset
+
+        if fulltext_supported(queryset.db):
+            return self.match_against(queryset, terms)
+        return self.inverted_index_search(queryset, terms)
+
+    def match_against(self, queryset, terms):
+        ordering = queryset.query.order_by
+        fulltext_terms = [term for term in terms if len(term) >= MIN_FULLTEXT_TOKEN_SIZE]
+        short_terms = [term for term in terms if len(term) < MIN_FULLTEXT_TOKEN_SIZE]
+
+        queryset = self.contains_terms(queryset, short_terms)
+
+        if not fulltext_terms:
+            return queryset
+
+        meta = queryset.model._meta
+        columns = ', '.join(f'{meta.db_table}.{meta.get_field(field).column}' for field in FULLTEXT_FIELDS)
+        match = RawSQL(
+            f'MATCH ({columns}) AGAINST (%s IN BOOLEAN MODE)',
+            [' '.join(f'+{term}*' for term in fulltext_terms)],
+            output_field=FloatField()
+        )
+        return queryset.annotate(search_rank=match).filter(search_rank__gt=0).order_by('-search_rank', *ordering)
+
+    def contains_terms(self, queryset, terms):
+        for term in terms:
+            queryset = queryset.filter(reduce(or_, (Q(**{f'{field}__icontains': term}) for field in FULLTEXT_FIELDS)))
+        return queryset
+
+    def inverted_index_search(self, queryset, terms):
+        ordering = queryset.query.order_by
+        # Префикс слова — частный случай подстроки: индекс строится только по кандидатам из базы, и их число ограничено
+        candidates = self.contains_terms(queryset, terms)[:settings.FULLTEXT_FALLBACK_MAX_ROWS]
+        index = InvertedIndex()
+        for pk, *texts in candidates.values_list('pk', *FULLTEXT_FIELDS):
+            index.add(pk, *texts)
+
+        scores = index.search(' '.join(terms))
+        if not scores:
+            return queryset.none()
+
+        search_rank = Case(
+            *[When(pk=pk, then=Value(score)) for pk, score in scores.items()],
+            default=Value(0),
+            output_field=IntegerField()
+        )
+        return queryset.filter(pk__in=scores).annotate(search_rank=search_rank).order_by('-search_rank', *ordering)
@@ -0,0 +1,58 @@
+from django.db.models import Exists, OuterRef
+from django_filters import rest_framework as filters
+from apps.bookings.choices import BookingStatusChoices
+from apps.bookings.models import Booking
+from ..forms import ListingFilterForm
+from ..models import Listing, ListingNight
+from ..services import use_listing_nights, filter_within_bbox, filter_within_radius
+
+
+class ListingFilter(filters.FilterSet):
+    check_in = filters.DateFilter(method='filter_free_dates')
+    check_out = filters.DateFilter(method='filter_free_dates')
+    bbox = filters.CharFilter(method='filter_bbox', help_text='min_lat,min_lng,max_lat,max_lng')
+    lat = filters.NumberFilter(method='filter_radius')
+    lng = filters.NumberFilter(method='filter_radius')
+    radius_km = filters.NumberFilter(method='filter_radius')
+    rating_min = filters.NumberFilter(field_name='rating_avg', lookup_expr='gte')
+    rating_count_min = filters.NumberFilter(field_name='rating_count', lookup_expr='gte')
+
+    class Meta:
+        model = Listing
+        fields = ['price', 'location', 'rooms', 'property_type', 'status']
+        form = ListingFilterForm
+
+    def filter_free_dates(self, queryset, name, value):
+        # Фильтр применяется один раз, на check_in; обе даты уже проверены формой
+        if name != 'check_in':
+            return queryset
+
+        check_out = self.form.cleaned_data['check_out']
+
+        if use_listing_nights():
+            occupied = ListingNight.objects.filter(
+                listing=OuterRef('pk'),
+                night__gte=value,
+                night__lt=check_out,
+            )
+        else:
+            # NOT EXISTS по индексу (listing, start_date, end_date, status) — остается одним запросом
+            occupied = Booking.objects.filter(
+                listing=OuterRef('pk'),
+                status__in=BookingStatusChoices.blocking_statuses(),
+                start_date__lt=check_out,
+                end_date__gt=value,
+            )
+        return queryset.filter(~Exists(occupied))
+
+    def filter_bbox(self, queryset, name, value):
+        # Форма уже разобрала строку в (min_lat, min_lng, max_lat, max_lng)
+        return filter_within_bbox(queryset, *self.form.cleaned_data['bbox'])
+
+    def filter_radius(self, queryset, name, value):
+        # Фильтр применяется один раз, на radius_km; lat и lng уже проверены формой
+        if name != 'radius_km':
+            return queryset
+
+        cleaned_data = self.form.cleaned_data
+        return filter_within_radius(queryset, float(cleaned_data['lat']), float(cleaned_data['lng']), float(value))
@@ -1 +1,2 @@
 from .listing_admin_form import ListingAdminForm
+from .listing_filter_form import ListingFilterForm
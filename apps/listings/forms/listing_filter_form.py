@@ -0,0 +1,66 @@
+from datetime import timedelta
+from django import forms
+from django.utils import timezone
+
+
+MAX_RADIUS_KM = 500
+
+
+class ListingFilterForm(forms.Form):
+    def clean_bbox(self):
+        value = self.cleaned_data.get('bbox')
+        if not value:
+            return value
+
+        try:
+            min_lat, min_lng, max_lat, max_lng = (float(part) for part in value.split(','))
+        except ValueError:
+            raise forms.ValidationError('bbox must be "min_lat,min_lng,max_lat,max_lng".')
+
+        if not (-90 <= min_lat <= max_lat <= 90) or not (-180 <= min_lng <= max_lng <= 180):
+            raise forms.ValidationError('bbox coordinates are out of range.')
+        return min_lat, min_lng, max_lat, max_lng
+
+    def clean(self):
+        cleaned_data = super().clean()
+        self._clean_radius(cleaned_data)
+        return self._clean_dates(cleaned_data)
+
+    def _clean_radius(self, cleaned_data):
+        lat = cleaned_data.get('lat')
+        lng = cleaned_data.get('lng')
+        radius_km = cleaned_data.get('radius_km')
+        values = [value for value in (lat, lng, radius_km) if value is not None]
+
+        if not values:
+            return
+
+        # Центр и радиус передаются только вместе
+        if len(values) != 3:
+            raise forms.ValidationError('lat, lng and radius_km must be provided together.')
+
+        if not (-90 <= lat <= 90) or not (-180 <= lng <= 180):
+            raise forms.ValidationError('lat/lng are out of range.')
+
+        if not (0 < radius_km <= MAX_RADIUS_KM):
+            raise forms.ValidationError(f'radius_km must be between 0 and {MAX_RADIUS_KM}.')
+
+    def _clean_dates(self, cleaned_data):
+        check_in = cleaned_data.get('check_in')
+        check_out = cleaned_data.get('check_out')
+
+        if not check_in and not check_out:
+            return cleaned_data
+
+        # Даты заезда и выезда передаются только вместе
+        if not check_in or not check_out:
+            raise forms.ValidationError('Both check_in and check_out must be provided.')
+
+        if check_in >= check_out:
+            raise forms.ValidationError('check_in must be before check_out.')
+
+        max_booking_date = timezone.now().date() + timedelta(days=90)
+        if check_out > max_booking_date:
+            raise forms.ValidationError('check_out cannot be more than 90 days from today.')
+
+        return cleaned_data
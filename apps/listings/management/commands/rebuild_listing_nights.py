@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from apps.listings.services import rebuild_listing_nights
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the ListingNight occupancy table from blocking bookings.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--listing',
+            type=int,
+            action='append',
+            dest='listing_ids',
+            help='Rebuild only the given listing id (can be repeated).'
+        )
+
+    def handle(self, *args, **options):
+        nights = rebuild_listing_nights(options['listing_ids'])
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt listing nights: {nights} occupied nights.'))
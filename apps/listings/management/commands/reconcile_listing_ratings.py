@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from apps.listings.services import recalculate_listing_ratings
+
+
+class Command(BaseCommand):
+    help = 'Recalculates listing rating aggregates from visible reviews and fixes drifted listings.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--listing',
+            type=int,
+            action='append',
+            dest='listing_ids',
+            help='Reconcile only the given listing id (can be repeated).'
+        )
+
+    def handle(self, *args, **options):
+        fixed = recalculate_listing_ratings(options['listing_ids'])
+        self.stdout.write(self.style.SUCCESS(f'Reconciled listing ratings: {fixed} listings fixed.'))
@@ -1 +1,2 @@
 from .listing import Listing
+from .listing_night import ListingNight
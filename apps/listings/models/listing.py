@@ -1,19 +1,23 @@
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
 from django.utils import timezone
 from datetime import timedelta
-from django.core.validators import MinValueValidator, MinLengthValidator
+from django.core.validators import MinValueValidator, MaxValueValidator, MinLengthValidator
 from ..choices import ListingStatusChoices, PropertyTypeChoices
 from apps.bookings.choices import BookingStatusChoices
+from common.mixins import ChangedFieldsSaveMixin
+from common.utils.geo import geohash_encode
 
 
-class Listing(models.Model):
+class Listing(ChangedFieldsSaveMixin, models.Model):
     owner = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         related_name='listings',
         on_delete=models.CASCADE,
         limit_choices_to={'is_business_account': True}
     )
+    # Копия owner.username для списков без join к пользователям; синхронизируется из User.save
+    owner_username = models.CharField(max_length=50, blank=True, default='', editable=False)
     title = models.CharField(
         max_length=100,
         validators=[MinLengthValidator(10)]
@@ -32,6 +36,26 @@ class Listing(models.Model):
         validators=[MinValueValidator(0.01)]
     )
     rooms = models.PositiveIntegerField(validators=[MinValueValidator(1)])
+    latitude = models.DecimalField(
+        max_digits=9,
+        decimal_places=6,
+        null=True,
+        blank=True,
+        validators=[MinValueValidator(-90), MaxValueValidator(90)]
+    )
+    longitude = models.DecimalField(
+        max_digits=9,
+        decimal_places=6,
+        null=True,
+        blank=True,
+        validators=[MinValueValidator(-180), MaxValueValidator(180)]
+    )
+    # Вычисляется из координат при сохранении; префиксный индекс отсекает кандидатов гео-поиска
+    geohash = models.CharField(max_length=12, blank=True, default='', editable=False)
+    # Агрегаты по видимым отзывам с оценкой; поддерживаются rating_service, сверяются reconcile_listing_ratings
+    rating_count = models.PositiveIntegerField(default=0, editable=False)
+    rating_sum = models.PositiveIntegerField(default=0, editable=False)
+    rating_avg = models.DecimalField(max_digits=3, decimal_places=2, null=True, blank=True, editable=False)
     status = models.PositiveSmallIntegerField(
         choices=ListingStatusChoices.choices,
         default=ListingStatusChoices.DRAFT,
@@ -47,11 +71,78 @@ class Listing(models.Model):
             models.Index(fields=['location']),
             models.Index(fields=['rooms']),
             models.Index(fields=['status', 'created_at']),
+            models.Index(fields=['geohash']),
+            models.Index(fields=['rating_avg']),
+            models.Index(fields=['rating_count']),
         ]
 
+    # Поля, попадающие в поисковый индекс и его выдачу
+    search_index_fields = {'title', 'description', 'location', 'address', 'property_type', 'rooms', 'price',
+                           'latitude', 'longitude', 'status', 'owner'}
+
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        dirty_fields = self.get_dirty_fields(check_relationship=True)
+        if adding or {'latitude', 'longitude'} & dirty_fields.keys():
+            self.update_geohash()
+        owner_changed = not adding and 'owner' in dirty_fields
+        if adding or owner_changed:
+            self.owner_username = self.owner.username
+
+        reindex = adding or bool(self.search_index_fields & dirty_fields.keys())
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if adding or owner_changed:
+                if owner_changed:
+                    self._update_listing_counts(dirty_fields['owner'], -1)
+                self._update_listing_counts(self.owner_id, 1)
+        self._invalidate_cache(adding)
+        if reindex:
+            self._sync_search_index()
+
+    def delete(self, *args, **kwargs):
+        listing_id, owner_id = self.pk, self.owner_id
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            self._update_listing_counts(owner_id, -1)
+            self._remove_from_search_index(listing_id)
+        return result
+
+    @staticmethod
+    def _remove_from_search_index(listing_id):
+        from ..services import unindex_listings
+        unindex_listings([listing_id])
+
+    def _update_listing_counts(self, owner_id, delta):
+        # Импорт внутри метода: сервисы пользователей импортируют модель листинга
+        from apps.users.services import apply_listing_count_delta
+        apply_listing_count_delta(owner_id, delta)
+
+        # Уже загруженный владелец перечитывает счетчик, иначе его следующий save() вернул бы старое значение
+        if Listing.owner.is_cached(self) and self.owner.pk == owner_id:
+            self.owner.refresh_from_db(fields=['listing_count'])
+
+    def update_geohash(self):
+        if self.latitude is None or self.longitude is None:
+            self.geohash = ''
+        else:
+            self.geohash = geohash_encode(self.latitude, self.longitude)
+
+    def _invalidate_cache(self, adding=False):
+        from ..services import invalidate_listing_cache, invalidate_listing_calendars
+        invalidate_listing_cache([self.pk])
+        if adding:
+            # id может быть переиспользован после удаления строки: старый календарь не должен достаться новому листингу
+            invalidate_listing_calendars([self.pk])
+
+    def _sync_search_index(self):
+        # Импорт внутри метода: сервисы листингов зависят от модели
+        from ..services import index_listings
+        index_listings([self])
+
     def soft_delete(self):
         self._change_status(ListingStatusChoices.DELETED)
 
@@ -74,9 +165,19 @@ class Listing(models.Model):
         if end_date > max_booking_date:
             return False
 
+        # Импорт внутри метода: сервисы листингов зависят от модели
+        from ..services import use_listing_nights
+
+        # При включенной таблице ночей проверяем занятость по ней
+        if use_listing_nights():
+            occupied_nights = self.nights.filter(night__gte=start_date, night__lt=end_date)
+            if exclude_booking_id:
+                occupied_nights = occupied_nights.exclude(booking_id=exclude_booking_id)
+            return not occupied_nights.exists()
+
         # Оптимизированный запрос: выбираем только нужные данные
         overlapping_bookings = self.bookings.filter(
-            status__in=[BookingStatusChoices.CONFIRMED, BookingStatusChoices.REQUEST],
+            status__in=BookingStatusChoices.blocking_statuses(),
             start_date__lt=end_date,
             end_date__gt=start_date,
         ).only('id')
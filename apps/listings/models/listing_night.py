@@ -0,0 +1,34 @@
+from django.db import models
+
+
+class ListingNight(models.Model):
+    """
+    Денормализованная занятость листинга: одна строка на каждую занятую ночь.
+
+    Уникальность (listing, night) одновременно защищает от двойного бронирования на уровне БД.
+    """
+
+    listing = models.ForeignKey(
+        'listings.Listing',
+        related_name='nights',
+        on_delete=models.CASCADE
+    )
+    booking = models.ForeignKey(
+        'bookings.Booking',
+        related_name='nights',
+        on_delete=models.CASCADE
+    )
+    night = models.DateField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['listing', 'night'],
+                name='unique_night_per_listing'
+            ),
+        ]
+        verbose_name = 'Listing night'
+        verbose_name_plural = 'Listing nights'
+
+    def __str__(self):
+        return f'{self.night} for listing {self.listing_id}'
@@ -1,4 +1,5 @@
 from rest_framework.permissions import BasePermission, SAFE_METHODS
+from common.utils.ownership import is_owner
 
 
 class IsOwnerOrReadOnly(BasePermission):
@@ -7,5 +8,5 @@ class IsOwnerOrReadOnly(BasePermission):
     def has_object_permission(self, request, view, obj):
         if request.method in SAFE_METHODS:
             return True
-        return obj.owner == request.user
+        return is_owner(request.user, obj, 'owner_id')
     
\ No newline at end of file
@@ -0,0 +1,3 @@
+from .inverted_index import tokenize, InvertedIndex
+from .fulltext_index import FULLTEXT_FIELDS, FULLTEXT_INDEX_NAME, fulltext_supported, ensure_fulltext_index
+from .bm25_index import BM25Index, ListingSearchIndex
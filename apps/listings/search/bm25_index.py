@@ -0,0 +1,217 @@
+import math
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from .inverted_index import tokenize
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+# id моделей — BigAutoField, поэтому массивы id 64-битные
+DOC_ID_TYPECODE = 'Q'
+
+
+def _intersect(left, right):
+    # Пересечение двух отсортированных массивов id за O(len(left) + len(right))
+    result = array(DOC_ID_TYPECODE)
+    i = j = 0
+    while i < len(left) and j < len(right):
+        if left[i] == right[j]:
+            result.append(left[i])
+            i += 1
+            j += 1
+        elif left[i] < right[j]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+class BM25Index:
+    """
+    Поисковый индекс в памяти со скорингом BM25.
+
+    Для каждого терма хранится отсортированный массив id документов и параллельный массив частот.
+    Вместе с документом хранятся его представление для выдачи и значения полей для фасетов.
+    """
+
+    def __init__(self, facet_fields=()):
+        self.facet_fields = tuple(facet_fields)
+        self.postings = {}
+        self.documents = {}
+        self.total_length = 0
+        self.lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.documents)
+
+    def add(self, doc_id, texts, payload=None, facets=None):
+        with self.lock:
+            self.remove(doc_id)
+
+            frequencies = Counter(token for text in texts for token in tokenize(text))
+            for term, frequency in frequencies.items():
+                doc_ids, term_frequencies = self.postings.setdefault(term, (array(DOC_ID_TYPECODE), array('I')))
+                position = bisect_left(doc_ids, doc_id)
+                doc_ids.insert(position, doc_id)
+                term_frequencies.insert(position, frequency)
+
+            length = sum(frequencies.values())
+            self.documents[doc_id] = {
+                'terms': tuple(frequencies),
+                'length': length,
+                'payload': payload,
+                'facets': facets or {},
+            }
+            self.total_length += length
+
+    def remove(self, doc_id):
+        with self.lock:
+            document = self.documents.pop(doc_id, None)
+            if document is None:
+                return
+
+            for term in document['terms']:
+                doc_ids, term_frequencies = self.postings[term]
+                position = bisect_left(doc_ids, doc_id)
+                del doc_ids[position]
+                del term_frequencies[position]
+                if not doc_ids:
+                    del self.postings[term]
+            self.total_length -= document['length']
+
+    def _score(self, terms, doc_ids):
+        count = len(self.documents)
+        average_length = self.total_length / count if count else 0
+        scores = dict.fromkeys(doc_ids, 0.0)
+
+        for term in terms:
+            term_doc_ids, term_frequencies = self.postings[term]
+            idf = math.log(1 + (count - len(term_doc_ids) + 0.5) / (len(term_doc_ids) + 0.5))
+            for doc_id in doc_ids:
+                frequency = term_frequencies[bisect_left(term_doc_ids, doc_id)]
+                length_norm = 1 - BM25_B + BM25_B * self.documents[doc_id]['length'] / average_length
+                scores[doc_id] += idf * frequency * (BM25_K1 + 1) / (frequency + BM25_K1 * length_norm)
+        return scores
+
+    def search(self, query, filters=None, offset=0, limit=10):
+        """
+        Ищет документы, содержащие все термы запроса.
+
+        Возвращает (общее число найденных, срез выдачи [(id, score, payload)], фасеты).
+        Фасеты считаются по всем найденным документам до применения filters.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        with self.lock:
+            if not terms or any(term not in self.postings for term in terms):
+                return 0, [], {field: {} for field in self.facet_fields}
+
+            # Пересекаем начиная с самого короткого списка
+            terms.sort(key=lambda term: len(self.postings[term][0]))
+            doc_ids = self.postings[terms[0]][0]
+            for term in terms[1:]:
+                doc_ids = _intersect(doc_ids, self.postings[term][0])
+
+            facets = {field: Counter() for field in self.facet_fields}
+            matched = []
+            for doc_id in doc_ids:
+                document_facets = self.documents[doc_id]['facets']
+                for field in self.facet_fields:
+                    facets[field][document_facets.get(field)] += 1
+                if all(document_facets.get(field) == value for field, value in (filters or {}).items()):
+                    matched.append(doc_id)
+
+            scores = self._score(terms, matched)
+            ranked = sorted(matched, key=lambda doc_id: (-scores[doc_id], -doc_id))
+            page = [(doc_id, scores[doc_id], self.documents[doc_id]['payload']) for doc_id in ranked[offset:offset + limit]]
+
+        return len(ranked), page, {field: dict(counter) for field, counter in facets.items()}
+
+
+class ListingSearchIndex(BM25Index):
+    """
+    Индекс активных объявлений процесса.
+
+    Строится лениво при первом запросе и перестраивается целиком раз в ttl секунд, чтобы подхватить
+    изменения, сделанные другими процессами; изменения своего процесса применяются сразу.
+
+    Перестройка идет в отдельных структурах без блокировки поиска и подменяет их под lock. Перестраивает
+    один поток: остальные ищут по текущему индексу, а ждут только первого построения.
+    """
+
+    def __init__(self, ttl=None):
+        super().__init__(facet_fields=('property_type', 'rooms'))
+        # ttl 0 или меньше, как и None, отключает периодическую перестройку
+        self.ttl = ttl if ttl is not None and ttl > 0 else None
+        self.built_at = None
+        self.rebuild_lock = threading.Lock()
+        # Изменения, примененные во время перестройки; после подмены структур применяются повторно
+        self._journal = None
+
+    @property
+    def is_stale(self):
+        if self.built_at is None:
+            return True
+        return self.ttl is not None and time.monotonic() - self.built_at > self.ttl
+
+    @property
+    def is_building(self):
+        return self._journal is not None
+
+    @staticmethod
+    def listing_document(listing):
+        from ..serializers import ListingListSerializer
+
+        return (
+            listing.id,
+            [getattr(listing, field) for field in ('title', 'description', 'location', 'address')],
+            ListingListSerializer(listing).data,
+            {'property_type': listing.property_type, 'rooms': listing.rooms},
+        )
+
+    def add_listing(self, listing):
+        doc_id, texts, payload, facets = self.listing_document(listing)
+        with self.lock:
+            self.add(doc_id, texts, payload=payload, facets=facets)
+            if self._journal is not None:
+                self._journal.append((doc_id, (texts, payload, facets)))
+
+    def remove_listing(self, listing_id):
+        with self.lock:
+            self.remove(listing_id)
+            if self._journal is not None:
+                self._journal.append((listing_id, None))
+
+    def refresh(self, get_listings):
+        """Перестраивает устаревший индекс; get_listings вызывается, только если перестраивает этот поток."""
+        if not self.rebuild_lock.acquire(blocking=self.built_at is None):
+            return
+        try:
+            if self.is_stale:
+                self.rebuild(get_listings())
+        finally:
+            self.rebuild_lock.release()
+
+    def rebuild(self, listings):
+        with self.lock:
+            self._journal = []
+        try:
+            fresh = BM25Index(facet_fields=self.facet_fields)
+            for listing in listings:
+                doc_id, texts, payload, facets = self.listing_document(listing)
+                fresh.add(doc_id, texts, payload=payload, facets=facets)
+
+            with self.lock:
+                self.postings, self.documents, self.total_length = fresh.postings, fresh.documents, fresh.total_length
+                # Свежая выборка могла не увидеть изменений, закоммиченных во время перестройки
+                for doc_id, document in self._journal:
+                    if document is None:
+                        self.remove(doc_id)
+                    else:
+                        texts, payload, facets = document
+                        self.add(doc_id, texts, payload=payload, facets=facets)
+                self.built_at = time.monotonic()
+        finally:
+            with self.lock:
+                self._journal = None
@@ -0,0 +1,39 @@
+from django.db import connections
+
+FULLTEXT_INDEX_NAME = 'listing_fulltext_idx'
+FULLTEXT_FIELDS = ('title', 'description', 'location', 'address')
+
+
+def fulltext_supported(using='default'):
+    return connections[using].vendor == 'mysql'
+
+
+def ensure_fulltext_index(sender=None, using='default', **kwargs):
+    """
+    Создает FULLTEXT-индекс по текстовым полям Listing (обработчик post_migrate).
+
+    Миграции генерируются при деплое, поэтому индекс создается здесь, а не в файле миграции.
+    """
+    if not fulltext_supported(using):
+        return
+
+    from ..models import Listing
+
+    connection = connections[using]
+    table = Listing._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT 1 FROM information_schema.STATISTICS '
+            'WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s LIMIT 1',
+            [table, FULLTEXT_INDEX_NAME]
+        )
+        if cursor.fetchone():
+            return
+
+        columns = ', '.join(
+            connection.ops.quote_name(Listing._meta.get_field(field).column) for field in FULLTEXT_FIELDS
+        )
+        cursor.execute(
+            f'CREATE FULLTEXT INDEX {connection.ops.quote_name(FULLTEXT_INDEX_NAME)} '
+            f'ON {connection.ops.quote_name(table)} ({columns})'
+        )
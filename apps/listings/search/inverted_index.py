@@ -0,0 +1,58 @@
+import re
+from bisect import bisect_left
+from collections import defaultdict
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.lower()) if text else []
+
+
+class InvertedIndex:
+    """
+    Инвертированный индекс в памяти: терм -> {id документа: число вхождений}.
+
+    Термы запроса сопоставляются по префиксу, как MATCH ... AGAINST ('+term*' IN BOOLEAN MODE).
+    """
+
+    def __init__(self):
+        self.postings = defaultdict(dict)
+        self._terms = None
+
+    def add(self, doc_id, *texts):
+        for text in texts:
+            for token in tokenize(text):
+                postings = self.postings[token]
+                postings[doc_id] = postings.get(doc_id, 0) + 1
+        self._terms = None
+
+    @property
+    def terms(self):
+        # Отсортированный словарь для поиска по префиксу через bisect
+        if self._terms is None:
+            self._terms = sorted(self.postings)
+        return self._terms
+
+    def match_prefix(self, prefix):
+        scores = defaultdict(int)
+        terms = self.terms
+        position = bisect_left(terms, prefix)
+        while position < len(terms) and terms[position].startswith(prefix):
+            for doc_id, frequency in self.postings[terms[position]].items():
+                scores[doc_id] += frequency
+            position += 1
+        return scores
+
+    def search(self, query):
+        """Возвращает {id документа: релевантность} для документов, содержащих все термы запроса."""
+        result = None
+        for term in tokenize(query):
+            scores = self.match_prefix(term)
+            if result is None:
+                result = dict(scores)
+            else:
+                result = {doc_id: score + scores[doc_id] for doc_id, score in result.items() if doc_id in scores}
+            if not result:
+                return {}
+        return result or {}
@@ -1,2 +1,3 @@
-from .listing_serializers import (ListingListSerializer, ListingDetailSerializer, ListingCreateSerializer,
-                                  ListingUpdateSerializer, ListingStatusActionSerializer)
+from .listing_serializers import (ListingListSerializer, OwnerListingSerializer, ListingDetailSerializer,
+                                  ListingCreateSerializer, ListingUpdateSerializer, ListingStatusActionSerializer,
+                                  DateRangeSerializer, ListingAvailabilityQuerySerializer, ListingSearchQuerySerializer)
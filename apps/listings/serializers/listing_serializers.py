@@ -2,17 +2,30 @@ from decimal import Decimal
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from ..models import Listing
+from ..choices import PropertyTypeChoices
+from common.utils.ownership import is_owner
 
 User = get_user_model()
 
 
+def validate_coordinates(data, instance=None):
+    # Координаты задаются парой: одна без другой не дает точки на карте
+    latitude = data.get('latitude', getattr(instance, 'latitude', None))
+    longitude = data.get('longitude', getattr(instance, 'longitude', None))
+    if (latitude is None) != (longitude is None):
+        raise serializers.ValidationError({'coordinates': 'Latitude and longitude must be provided together.'})
+
+
 class ListingListSerializer(serializers.ModelSerializer):
-    owner = serializers.ReadOnlyField(source='owner.username')
+    owner = serializers.ReadOnlyField(source='owner_username')
     status_display = serializers.CharField(source='get_status_display', read_only=True)
+    # Есть только в выдаче поиска по радиусу
+    distance_km = serializers.FloatField(read_only=True)
 
     class Meta:
         model = Listing
-        fields = ['id', 'title', 'price', 'location', 'rooms', 'property_type', 'owner', 'status_display']
+        fields = ['id', 'title', 'price', 'location', 'rooms', 'property_type', 'latitude', 'longitude', 'owner',
+                  'rating_avg', 'rating_count', 'status_display', 'distance_km']
         read_only_fields = fields
 
     def to_representation(self, instance):
@@ -25,16 +38,34 @@ class ListingListSerializer(serializers.ModelSerializer):
         return representation
 
 
+class OwnerListingSerializer(serializers.ModelSerializer):
+    # Поля сводки приходят аннотациями из annotate_owner_dashboard
+    owner = serializers.ReadOnlyField(source='owner_username')
+    status_display = serializers.CharField(source='get_status_display', read_only=True)
+    bookings_count = serializers.IntegerField(read_only=True)
+    upcoming_bookings_count = serializers.IntegerField(read_only=True)
+    next_check_in = serializers.DateField(read_only=True)
+    average_rating = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = Listing
+        fields = [
+            'id', 'title', 'price', 'location', 'rooms', 'property_type', 'owner', 'status', 'status_display',
+            'bookings_count', 'upcoming_bookings_count', 'next_check_in', 'average_rating'
+        ]
+        read_only_fields = fields
+
+
 class ListingDetailSerializer(serializers.ModelSerializer):
-    owner_id = serializers.ReadOnlyField(source='owner.id')
-    owner = serializers.ReadOnlyField(source='owner.username')
+    owner_id = serializers.ReadOnlyField()
+    owner = serializers.ReadOnlyField(source='owner_username')
     status_display = serializers.CharField(source='get_status_display', read_only=True)
 
     class Meta:
         model = Listing
         fields = [
-            'id', 'title', 'description', 'price', 'location', 'address',
-            'rooms', 'property_type', 'status_display', 'status',
+            'id', 'title', 'description', 'price', 'location', 'address', 'latitude', 'longitude',
+            'rooms', 'property_type', 'rating_avg', 'rating_count', 'status_display', 'status',
             'status_changed_at', 'created_at', 'updated_at', 'owner', 'owner_id'
         ]
         read_only_fields = fields  # Все поля делаются только для чтения
@@ -43,14 +74,14 @@ class ListingDetailSerializer(serializers.ModelSerializer):
         representation = super().to_representation(instance)
         request = self.context.get('request')
 
-        if not request or (request.user != instance.owner and not request.user.is_staff):
+        if not request or not (is_owner(request.user, instance, 'owner_id') or request.user.is_staff):
             public_fields = [
-                'id', 'title', 'description', 'price', 'location', 'address',
-                'rooms', 'property_type', 'owner', 'owner_id'
+                'id', 'title', 'description', 'price', 'location', 'address', 'latitude', 'longitude',
+                'rooms', 'property_type', 'rating_avg', 'rating_count', 'owner', 'owner_id'
             ]
             return {key: representation[key] for key in public_fields}
 
-        if request.user == instance.owner:
+        if is_owner(request.user, instance, 'owner_id'):
             representation.pop('created_at', None)
 
         return representation
@@ -69,7 +100,8 @@ class ListingCreateSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Listing
-        fields = ['title', 'description', 'price', 'rooms', 'location', 'address', 'property_type', 'owner']
+        fields = ['title', 'description', 'price', 'rooms', 'location', 'address', 'latitude', 'longitude',
+                  'property_type', 'owner']
 
     def validate_owner(self, value):
         if not value.is_business_account:
@@ -86,6 +118,7 @@ class ListingCreateSerializer(serializers.ModelSerializer):
             # Если администратор не указал 'owner', устанавливаем текущего пользователя
             data['owner'] = user
 
+        validate_coordinates(data)
         return data
 
 
@@ -98,7 +131,12 @@ class ListingUpdateSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Listing
-        fields = ['title', 'description', 'location', 'address', 'property_type', 'price', 'rooms']
+        fields = ['title', 'description', 'location', 'address', 'latitude', 'longitude', 'property_type', 'price',
+                  'rooms']
+
+    def validate(self, data):
+        validate_coordinates(data, self.instance)
+        return data
 
     def update(self, instance, validated_data):
         for field, value in validated_data.items():
@@ -128,3 +166,34 @@ class ListingStatusActionSerializer(serializers.ModelSerializer):
 
         instance.save()
         return instance
+
+
+class DateRangeSerializer(serializers.Serializer):
+    start_date = serializers.DateField()
+    end_date = serializers.DateField()
+
+    def validate(self, data):
+        if data['start_date'] >= data['end_date']:
+            raise serializers.ValidationError('Start date must be before end date.')
+        return data
+
+
+class ListingAvailabilityQuerySerializer(serializers.Serializer):
+    listing_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=100
+    )
+    date_ranges = serializers.ListField(
+        child=DateRangeSerializer(),
+        allow_empty=False,
+        max_length=10
+    )
+
+
+class ListingSearchQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=200)
+    property_type = serializers.ChoiceField(choices=PropertyTypeChoices.choices, required=False)
+    rooms = serializers.IntegerField(min_value=1, required=False)
+    offset = serializers.IntegerField(min_value=0, default=0)
+    limit = serializers.IntegerField(min_value=1, max_value=50, default=10)
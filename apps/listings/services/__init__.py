@@ -1 +1,13 @@
-from .listing_service import get_available_dates, get_available_dates_by_month
+from .availability_calendar import AvailabilityCalendar
+from .listing_service import (get_availability_calendar, get_available_dates, get_available_dates_by_month,
+                              get_bulk_availability, annotate_owner_dashboard)
+from .occupancy_service import use_listing_nights, sync_booking_nights, rebuild_listing_nights
+from .search_service import (get_listing_search_index, reset_listing_search_index, index_listings, unindex_listings,
+                             search_listings)
+from .facet_service import LISTING_FACETS, get_listing_facets
+from .geo_service import filter_within_bbox, annotate_distance, filter_within_radius
+from .cache_service import (get_listing_cache_version, invalidate_listing_cache, get_cached_public_listing,
+                            cache_public_listing, invalidate_listing_calendars, get_calendar_cache_state,
+                            get_cached_calendar, cache_calendar)
+from .rating_service import (rating_contribution, calculate_rating_avg, apply_rating_delta,
+                             recalculate_listing_ratings)
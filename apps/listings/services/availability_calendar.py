@@ -0,0 +1,102 @@
+from calendar import monthrange
+from datetime import timedelta
+
+CALENDAR_WINDOW_DAYS = 90
+
+
+def _iter_set_bits(mask):
+    # Перебираем установленные биты от младшего к старшему
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+class AvailabilityCalendar:
+    """
+    Календарь занятости листинга в виде битовой маски фиксированной ширины.
+
+    Бит i соответствует ночи start + i дней; установленный бит означает, что ночь занята.
+    """
+
+    __slots__ = ('start', 'days', 'booked')
+
+    def __init__(self, start, days=CALENDAR_WINDOW_DAYS, booked=0):
+        self.start = start
+        self.days = days
+        self.booked = booked
+
+    @classmethod
+    def from_intervals(cls, start, intervals, days=CALENDAR_WINDOW_DAYS):
+        calendar = cls(start, days)
+        for start_date, end_date in intervals:
+            calendar.mark_booked(start_date, end_date)
+        return calendar
+
+    @property
+    def end(self):
+        return self.start + timedelta(days=self.days)
+
+    @property
+    def full_mask(self):
+        return (1 << self.days) - 1
+
+    @property
+    def available(self):
+        return ~self.booked & self.full_mask
+
+    def _range_mask(self, start_date, end_date):
+        # Маска ночей [start_date, end_date), обрезанная по границам окна
+        first = max((start_date - self.start).days, 0)
+        last = min((end_date - self.start).days, self.days)
+        if first >= last:
+            return 0
+        return ((1 << (last - first)) - 1) << first
+
+    def mark_booked(self, start_date, end_date):
+        self.booked |= self._range_mask(start_date, end_date)
+
+    def mark_nights(self, nights):
+        for night in nights:
+            offset = (night - self.start).days
+            if 0 <= offset < self.days:
+                self.booked |= 1 << offset
+
+    def is_free(self, start_date, end_date):
+        if start_date >= end_date or start_date < self.start or end_date > self.end:
+            return False
+        return not self.booked & self._range_mask(start_date, end_date)
+
+    def free_nights(self, start_date, end_date):
+        return (self.available & self._range_mask(start_date, end_date)).bit_count()
+
+    def available_dates(self):
+        return [self.start + timedelta(days=offset) for offset in _iter_set_bits(self.available)]
+
+    def iter_months(self):
+        # Нарезаем окно по календарным месяцам: (год, месяц, смещение от начала окна, длина)
+        offset = 0
+        current = self.start
+        while offset < self.days:
+            days_in_month = monthrange(current.year, current.month)[1]
+            length = min(days_in_month - current.day + 1, self.days - offset)
+            yield current.year, current.month, offset, length
+            offset += length
+            current = self.start + timedelta(days=offset)
+
+    def by_month(self):
+        available = self.available
+        result = []
+
+        for year, month, offset, length in self.iter_months():
+            month_bits = (available >> offset) & ((1 << length) - 1)
+            if not month_bits:
+                continue
+
+            # Строки дат собираем напрямую из битов, без промежуточных объектов date
+            first_day = (self.start + timedelta(days=offset)).day
+            month_key = f'{year:04d}-{month:02d}'
+            dates = [f'{month_key}-{first_day + bit:02d}' for bit in _iter_set_bits(month_bits)]
+            result.append({'month': month_key, 'dates': dates})
+
+        return result
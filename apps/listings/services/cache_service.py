@@ -0,0 +1,66 @@
+import hashlib
+from datetime import datetime, timedelta
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from common.utils.cache_versions import get_cache_version, invalidate_cache_versions
+
+
+def _listing_version_key(listing_id):
+    return f'listing-version:{listing_id}'
+
+
+def get_listing_cache_version(listing_id):
+    return get_cache_version(_listing_version_key(listing_id))
+
+
+def invalidate_listing_cache(listing_ids):
+    """Сбрасывает кешированные публичные представления объявлений, повышая их версию."""
+    invalidate_cache_versions(_listing_version_key(listing_id) for listing_id in listing_ids)
+
+
+def _public_key(listing_id, version):
+    return f'listing-public:{listing_id}:{version}'
+
+
+def get_cached_public_listing(listing_id):
+    """Возвращает (версия, данные); версию нужно передать в cache_public_listing при заполнении кеша."""
+    version = get_listing_cache_version(listing_id)
+    return version, cache.get(_public_key(listing_id, version))
+
+
+def cache_public_listing(listing_id, data, version):
+    cache.set(_public_key(listing_id, version), data, settings.LISTING_DETAIL_CACHE_TIMEOUT)
+
+
+def _calendar_version_key(listing_id):
+    return f'listing-calendar-version:{listing_id}'
+
+
+def invalidate_listing_calendars(listing_ids):
+    """Сбрасывает кешированные календари свободных дат после изменения бронирований листингов."""
+    invalidate_cache_versions(_calendar_version_key(listing_id) for listing_id in listing_ids)
+
+
+def get_calendar_cache_state(listing_id):
+    """
+    Возвращает (ключ кеша, ETag) календаря листинга на сегодня, не обращаясь к базе.
+
+    Дата входит в ключ, поэтому после полуночи UTC календарь пересчитывается сам.
+    """
+    today = timezone.now().date()
+    version = get_cache_version(_calendar_version_key(listing_id))
+    signature = f'{listing_id}:{today.isoformat()}:{version}'
+    etag = '"' + hashlib.md5(signature.encode()).hexdigest() + '"'
+    return f'listing-calendar:{signature}', etag
+
+
+def get_cached_calendar(cache_key):
+    return cache.get(cache_key)
+
+
+def cache_calendar(cache_key, data):
+    # Храним до следующей полуночи UTC: дальше ключ все равно не будет запрошен
+    now = timezone.now()
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), tzinfo=now.tzinfo)
+    cache.set(cache_key, data, max(int((midnight - now).total_seconds()), 1))
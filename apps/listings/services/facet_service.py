@@ -0,0 +1,72 @@
+import hashlib
+from decimal import Decimal
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db.models import Count, F, IntegerField, Value
+from django.db.models.functions import Cast, Floor, Least
+
+LISTING_FACETS = ('property_type', 'rooms', 'location', 'price')
+ROOMS_FACET_MAX = 5
+
+
+def _facet_expressions(facets):
+    price_step = settings.LISTING_PRICE_FACET_STEP
+    expressions = {
+        'property_type': F('property_type'),
+        # Все объявления с ROOMS_FACET_MAX и более комнатами попадают в одну корзину
+        'rooms': Least(F('rooms'), Value(ROOMS_FACET_MAX)),
+        'location': F('location'),
+        'price': Cast(Floor(F('price') / Value(price_step)), output_field=IntegerField()),
+    }
+    return {facet: expressions[facet] for facet in facets}
+
+
+def _facet_buckets(queryset, facet, expression):
+    grouped = queryset.order_by().values(value=expression).annotate(total=Count('id'))
+    if facet == 'location':
+        # Местоположение — свободный текст: возвращаем только самые частые значения
+        grouped = grouped.order_by('-total', 'value')[:settings.LISTING_LOCATION_FACET_LIMIT]
+    return [(row['value'], row['total']) for row in grouped]
+
+
+def _format_facet(facet, buckets):
+    price_step = Decimal(settings.LISTING_PRICE_FACET_STEP)
+    if facet == 'rooms':
+        return [
+            {'value': f'{value}+' if value == ROOMS_FACET_MAX else str(value), 'count': count}
+            for value, count in sorted(buckets)
+        ]
+    if facet == 'price':
+        return [
+            {'min': str(bucket * price_step), 'max': str((bucket + 1) * price_step), 'count': count}
+            for bucket, count in sorted(buckets)
+        ]
+    return [
+        {'value': value, 'count': count}
+        for value, count in sorted(buckets, key=lambda item: (-item[1], item[0]))
+    ]
+
+
+def get_listing_facets(queryset, facets):
+    """
+    Считает фасеты по уже отфильтрованному queryset: по одному небольшому GROUP BY на измерение,
+    число корзин location ограничено LISTING_LOCATION_FACET_LIMIT.
+
+    Результат кешируется по сигнатуре SQL-запроса на LISTING_FACETS_CACHE_TIMEOUT секунд.
+    """
+    facets = [facet for facet in LISTING_FACETS if facet in facets]
+    try:
+        sql, params = queryset.order_by().query.sql_with_params()
+    except EmptyResultSet:
+        return {facet: [] for facet in facets}
+
+    cache_key = 'listing-facets:' + hashlib.md5(f'{sql}{params}{facets}'.encode()).hexdigest()
+    result = cache.get(cache_key)
+    if result is None:
+        result = {
+            facet: _format_facet(facet, _facet_buckets(queryset, facet, expression))
+            for facet, expression in _facet_expressions(facets).items()
+        }
+        cache.set(cache_key, result, settings.LISTING_FACETS_CACHE_TIMEOUT)
+    return result
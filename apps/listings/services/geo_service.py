@@ -0,0 +1,50 @@
+import math
+from functools import reduce
+from operator import or_
+from django.db.models import F, FloatField, Q, Value
+from django.db.models.functions import ASin, Cast, Cos, Power, Radians, Sin, Sqrt
+from common.utils.geo import EARTH_RADIUS_KM, bounding_box, geohash_cover
+
+
+def filter_within_bbox(queryset, min_lat, min_lng, max_lat, max_lng):
+    """
+    Оставляет объявления внутри прямоугольника.
+
+    Сначала отсекает кандидатов по префиксам geohash (индекс по geohash), затем точно по координатам.
+    """
+    cells = geohash_cover(min_lat, min_lng, max_lat, max_lng)
+    if cells:
+        queryset = queryset.filter(reduce(or_, (Q(geohash__startswith=cell) for cell in cells)))
+
+    return queryset.filter(
+        latitude__gte=min_lat,
+        latitude__lte=max_lat,
+        longitude__gte=min_lng,
+        longitude__lte=max_lng,
+    )
+
+
+def _radians(field):
+    return Radians(Cast(F(field), output_field=FloatField()))
+
+
+def annotate_distance(queryset, latitude, longitude):
+    # Формула гаверсинусов на функциях БД: работает на MySQL и SQLite без пространственных расширений
+    lat_rad = Value(math.radians(latitude), output_field=FloatField())
+    lng_rad = Value(math.radians(longitude), output_field=FloatField())
+    half_chord = (
+        Power(Sin((_radians('latitude') - lat_rad) / 2), 2) +
+        Cos(lat_rad) * Cos(_radians('latitude')) * Power(Sin((_radians('longitude') - lng_rad) / 2), 2)
+    )
+    return queryset.annotate(
+        distance_km=Value(2 * EARTH_RADIUS_KM, output_field=FloatField()) * ASin(Sqrt(half_chord))
+    )
+
+
+def filter_within_radius(queryset, latitude, longitude, radius_km):
+    """Объявления в радиусе radius_km от точки, отсортированные по расстоянию."""
+    ordering = queryset.query.order_by
+    queryset = filter_within_bbox(queryset, *bounding_box(latitude, longitude, radius_km))
+    return annotate_distance(queryset, latitude, longitude).filter(
+        distance_km__lte=radius_km
+    ).order_by('distance_km', *ordering)
@@ -1,46 +1,136 @@
+from django.db.models import Avg, Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from datetime import timedelta
-from collections import defaultdict
 from apps.bookings.choices import BookingStatusChoices
+from apps.bookings.models import Booking
+from apps.reviews.choices import ReviewStatusChoices
+from apps.reviews.models import Review
+from ..models import ListingNight
+from .availability_calendar import AvailabilityCalendar, CALENDAR_WINDOW_DAYS
+from .occupancy_service import use_listing_nights
 
 
-def get_available_dates(listing):
+def get_availability_calendar(listing):
     today = timezone.now().date()
-    max_date = today + timedelta(days=90)
+    max_date = today + timedelta(days=CALENDAR_WINDOW_DAYS)
+
+    if use_listing_nights():
+        calendar = AvailabilityCalendar(today)
+        calendar.mark_nights(
+            listing.nights.filter(night__gte=today, night__lt=max_date).values_list('night', flat=True)
+        )
+        return calendar
 
-    booked_bookings = listing.bookings.filter(
-        status__in=[BookingStatusChoices.CONFIRMED, BookingStatusChoices.REQUEST],
+    booked_intervals = listing.bookings.filter(
+        status__in=BookingStatusChoices.blocking_statuses(),
         start_date__lt=max_date,
         end_date__gt=today,
     ).values_list('start_date', 'end_date')
 
-    booked_dates = set()
-    for start, end in booked_bookings:
-        start = max(start, today)
-        end = min(end, max_date)
-        days = (end - start).days
-        booked_dates.update(start + timedelta(days=i) for i in range(days))
+    return AvailabilityCalendar.from_intervals(today, booked_intervals)
 
-    # Создаем полный набор дат и исключаем забронированные
-    all_dates = set(today + timedelta(days=i) for i in range((max_date - today).days))
-    available_dates = sorted(all_dates - booked_dates)
 
-    return available_dates
+def get_available_dates(listing):
+    return get_availability_calendar(listing).available_dates()
 
 
 def get_available_dates_by_month(listing):
-    available_dates = get_available_dates(listing)
-    dates_by_month = defaultdict(list)
+    # Месяцы и даты формируются прямо из битовой маски, уже в отсортированном порядке
+    return get_availability_calendar(listing).by_month()
+
+
+def get_bulk_availability(listing_ids, date_ranges):
+    """
+    Проверяет доступность нескольких листингов для нескольких диапазонов дат одним запросом к бронированиям.
+
+    Возвращает словарь {listing_id: [{'start_date', 'end_date', 'available', 'free_nights'}, ...]}.
+    Правила совпадают с Listing.is_available: блокирующие статусы и горизонт в 90 дней.
+    """
+    today = timezone.now().date()
+    max_booking_date = today + timedelta(days=CALENDAR_WINDOW_DAYS)
+    listing_ids = list(dict.fromkeys(listing_ids))
+    date_ranges = list(date_ranges)
+
+    valid_ranges = [(start, end) for start, end in date_ranges if start < end]
+    calendars = {}
+
+    if listing_ids and valid_ranges:
+        window_start = min(start for start, _ in valid_ranges)
+        window_end = max(end for _, end in valid_ranges)
+        window_days = (window_end - window_start).days
+
+        calendars = {
+            listing_id: AvailabilityCalendar(window_start, window_days)
+            for listing_id in listing_ids
+        }
 
-    for date_obj in available_dates:
-        month_key = date_obj.strftime('%Y-%m')
-        dates_by_month[month_key].append(date_obj.strftime('%Y-%m-%d'))
+        if use_listing_nights():
+            occupied_nights = ListingNight.objects.filter(
+                listing_id__in=listing_ids,
+                night__gte=window_start,
+                night__lt=window_end,
+            ).values_list('listing_id', 'night')
 
-    # Формируем список словарей
-    result = []
-    for month, dates in dates_by_month.items():
-        result.append({'month': month, 'dates': dates})
+            for listing_id, night in occupied_nights:
+                calendars[listing_id].mark_nights([night])
+        else:
+            booked_intervals = Booking.objects.filter(
+                listing_id__in=listing_ids,
+                status__in=BookingStatusChoices.blocking_statuses(),
+                start_date__lt=window_end,
+                end_date__gt=window_start,
+            ).values_list('listing_id', 'start_date', 'end_date')
+
+            for listing_id, start_date, end_date in booked_intervals:
+                calendars[listing_id].mark_booked(start_date, end_date)
+
+    result = {}
+    for listing_id in listing_ids:
+        calendar = calendars.get(listing_id)
+        ranges = []
+
+        for start_date, end_date in date_ranges:
+            in_horizon = start_date < end_date and end_date <= max_booking_date
+            free_nights = calendar.free_nights(start_date, end_date) if calendar and start_date < end_date else 0
+            ranges.append({
+                'start_date': start_date,
+                'end_date': end_date,
+                'available': in_horizon and free_nights == (end_date - start_date).days,
+                'free_nights': free_nights,
+            })
+
+        result[listing_id] = ranges
 
-    # Сортируем результат по месяцам
-    result.sort(key=lambda x: x['month'])
     return result
+
+
+def annotate_owner_dashboard(queryset):
+    """
+    Добавляет к листингам сводку для кабинета владельца: число бронирований, подтвержденных
+    предстоящих заездов, ближайшую дату заезда и средний рейтинг видимых отзывов.
+
+    Каждая метрика считается коррелированным подзапросом, поэтому строки листингов не размножаются
+    и вся страница собирается одним запросом.
+    """
+    today = timezone.now().date()
+    bookings = Booking.objects.filter(listing=OuterRef('pk')).exclude(status=BookingStatusChoices.DELETED)
+    upcoming = Booking.objects.filter(
+        listing=OuterRef('pk'),
+        status=BookingStatusChoices.CONFIRMED,
+        start_date__gte=today,
+    )
+    reviews = Review.objects.filter(listing=OuterRef('pk'), status=ReviewStatusChoices.VISIBLE)
+
+    return queryset.annotate(
+        bookings_count=Coalesce(
+            Subquery(bookings.values('listing').annotate(total=Count('id')).values('total')), 0
+        ),
+        upcoming_bookings_count=Coalesce(
+            Subquery(upcoming.values('listing').annotate(total=Count('id')).values('total')), 0
+        ),
+        next_check_in=Subquery(upcoming.order_by('start_date').values('start_date')[:1]),
+        average_rating=Subquery(
+            reviews.values('listing').annotate(avg=Avg('rating')).values('avg')
+        ),
+    )
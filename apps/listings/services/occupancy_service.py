@@ -0,0 +1,77 @@
+from datetime import timedelta
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from apps.bookings.choices import BookingStatusChoices
+from ..models import ListingNight
+from .cache_service import invalidate_listing_calendars
+
+
+def use_listing_nights():
+    # Чтение занятости из таблицы ночей включается настройкой; запись ведется всегда
+    return getattr(settings, 'USE_LISTING_NIGHTS', False)
+
+
+def _booking_nights(booking, since):
+    # Прошедшие ночи не храним: ни одна проверка занятости их не читает
+    first_night = max(booking.start_date, since)
+    return [
+        ListingNight(listing_id=booking.listing_id, booking_id=booking.pk, night=first_night + timedelta(days=i))
+        for i in range((booking.end_date - first_night).days)
+    ]
+
+
+def sync_booking_nights(bookings):
+    """
+    Приводит занятые ночи бронирований в соответствие с их статусами и датами.
+
+    Пересечение с чужими ночами нарушает уникальный индекс и превращается в ValidationError.
+    """
+    bookings = list(bookings)
+    today = timezone.now().date()
+    nights = []
+    for booking in bookings:
+        if booking.status in BookingStatusChoices.blocking_statuses():
+            nights.extend(_booking_nights(booking, since=today))
+
+    try:
+        with transaction.atomic():
+            ListingNight.objects.filter(booking__in=[booking.pk for booking in bookings]).delete()
+            ListingNight.objects.bulk_create(nights)
+    except IntegrityError:
+        raise ValidationError('Selected dates are not available.')
+
+    # Сюда приходят все переходы бронирований, поэтому здесь же сбрасываем календари свободных дат
+    invalidate_listing_calendars({booking.listing_id for booking in bookings})
+
+
+def rebuild_listing_nights(listing_ids=None):
+    # Полная перестройка по блокирующим бронированиям, по тому же правилу, что и sync_booking_nights
+    from apps.bookings.models import Booking
+
+    today = timezone.now().date()
+    bookings = Booking.objects.filter(
+        status__in=BookingStatusChoices.blocking_statuses(),
+        end_date__gt=today,
+    ).only('id', 'listing_id', 'start_date', 'end_date').order_by('created_at', 'id')
+    nights = ListingNight.objects.all()
+
+    if listing_ids is not None:
+        bookings = bookings.filter(listing_id__in=listing_ids)
+        nights = nights.filter(listing_id__in=listing_ids)
+
+    # Календари сбрасываются у всех листингов, чьи ночи удалены или созданы заново
+    rebuilt_ids = set(listing_ids) if listing_ids is not None else set()
+    with transaction.atomic():
+        if listing_ids is None:
+            rebuilt_ids.update(nights.values_list('listing_id', flat=True).distinct().order_by())
+        nights.delete()
+        for booking in bookings.iterator():
+            rebuilt_ids.add(booking.listing_id)
+            # Более раннее бронирование выигрывает, если в данных уже есть пересечения
+            ListingNight.objects.bulk_create(_booking_nights(booking, since=today), ignore_conflicts=True)
+
+    if rebuilt_ids:
+        invalidate_listing_calendars(rebuilt_ids)
+    return nights.count()
@@ -0,0 +1,89 @@
+from decimal import Decimal, ROUND_HALF_UP
+from django.db.models import Case, Count, DecimalField, ExpressionWrapper, F, FloatField, Sum, Value, When
+from django.db.models.functions import Cast
+from django.utils import timezone
+from apps.reviews.choices import ReviewStatusChoices
+from apps.reviews.models import Review
+from ..models import Listing
+from .cache_service import invalidate_listing_cache
+from .search_service import index_listings
+
+RATING_AVG_FIELD = DecimalField(max_digits=3, decimal_places=2)
+
+
+def rating_contribution(status, rating):
+    """Вклад отзыва в агрегаты листинга: (количество, сумма оценок)."""
+    if status == ReviewStatusChoices.VISIBLE and rating is not None:
+        return 1, rating
+    return 0, 0
+
+
+def calculate_rating_avg(rating_count, rating_sum):
+    if not rating_count:
+        return None
+    return (Decimal(rating_sum) / rating_count).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+
+
+def apply_rating_delta(listing_id, count_delta, sum_delta):
+    """Атомарно сдвигает агрегаты одного листинга без чтения строки."""
+    if not count_delta and not sum_delta:
+        return
+
+    new_count = F('rating_count') + count_delta
+    new_sum = F('rating_sum') + sum_delta
+    # rating_avg стоит первым: MySQL вычисляет SET слева направо и видит уже обновленные колонки,
+    # поэтому среднее должно считаться по тем же старым значениям, что и в остальных СУБД
+    Listing.objects.filter(pk=listing_id).update(
+        rating_avg=Case(
+            When(rating_count=-count_delta, then=Value(None)),
+            default=Cast(ExpressionWrapper(new_sum * 1.0 / new_count, output_field=FloatField()), RATING_AVG_FIELD),
+            output_field=RATING_AVG_FIELD,
+        ),
+        rating_count=new_count,
+        rating_sum=new_sum,
+        # update() не трогает auto_now, а по updated_at строятся ETag списков
+        updated_at=timezone.now(),
+    )
+    _refresh_listings([listing_id])
+
+
+def recalculate_listing_ratings(listing_ids=None):
+    """
+    Пересчитывает агрегаты по отзывам и исправляет разошедшиеся листинги.
+
+    Возвращает количество исправленных листингов.
+    """
+    listings = Listing.objects.only('id', 'rating_count', 'rating_sum', 'rating_avg')
+    reviews = Review.objects.filter(status=ReviewStatusChoices.VISIBLE, rating__isnull=False)
+    if listing_ids is not None:
+        listings = listings.filter(pk__in=listing_ids)
+        reviews = reviews.filter(listing_id__in=listing_ids)
+
+    totals = {
+        row['listing']: (row['count'], row['total'])
+        for row in reviews.values('listing').annotate(count=Count('id'), total=Sum('rating')).order_by()
+    }
+
+    now = timezone.now()
+    changed = []
+    for listing in listings.iterator():
+        rating_count, rating_sum = totals.get(listing.pk, (0, 0))
+        rating_avg = calculate_rating_avg(rating_count, rating_sum)
+        if (listing.rating_count, listing.rating_sum, listing.rating_avg) != (rating_count, rating_sum, rating_avg):
+            listing.rating_count = rating_count
+            listing.rating_sum = rating_sum
+            listing.rating_avg = rating_avg
+            listing.updated_at = now
+            changed.append(listing)
+
+    Listing.objects.bulk_update(changed, ['rating_count', 'rating_sum', 'rating_avg', 'updated_at'], batch_size=500)
+    _refresh_listings([listing.pk for listing in changed])
+    return len(changed)
+
+
+def _refresh_listings(listing_ids):
+    # Агрегаты входят в кешированное представление и в выдачу поискового индекса
+    if not listing_ids:
+        return
+    invalidate_listing_cache(listing_ids)
+    index_listings(Listing.objects.filter(pk__in=listing_ids))
@@ -0,0 +1,79 @@
+from django.conf import settings
+from django.db import transaction
+from ..choices import ListingStatusChoices
+from ..models import Listing
+from ..search import ListingSearchIndex
+
+_listing_search_index = None
+
+
+def get_listing_search_index():
+    global _listing_search_index
+
+    if _listing_search_index is None:
+        _listing_search_index = ListingSearchIndex(ttl=getattr(settings, 'LISTING_SEARCH_INDEX_TTL', None))
+
+    if _listing_search_index.is_stale:
+        _listing_search_index.refresh(
+            lambda: Listing.objects.filter(status=ListingStatusChoices.ACTIVE).iterator()
+        )
+    return _listing_search_index
+
+
+def reset_listing_search_index():
+    global _listing_search_index
+    _listing_search_index = None
+
+
+def _is_unbuilt(index):
+    # Во время первого построения изменения нужны индексу: выборка могла их не увидеть
+    return index is None or (index.built_at is None and not index.is_building)
+
+
+def index_listings(listings):
+    """
+    Применяет изменения объявлений к уже построенному индексу процесса после коммита транзакции.
+
+    Queryset вычисляется только после коммита и только если индекс уже построен.
+    """
+    def apply():
+        index = _listing_search_index
+        if _is_unbuilt(index):
+            # Индекс еще не построен и при построении прочитает актуальные данные
+            return
+        for listing in listings:
+            if listing.status == ListingStatusChoices.ACTIVE:
+                index.add_listing(listing)
+            else:
+                index.remove_listing(listing.id)
+
+    transaction.on_commit(apply)
+
+
+def unindex_listings(listing_ids):
+    """Убирает удаленные из базы объявления из индекса процесса после коммита транзакции."""
+    listing_ids = list(listing_ids)
+
+    def apply():
+        index = _listing_search_index
+        if _is_unbuilt(index):
+            return
+        for listing_id in listing_ids:
+            index.remove_listing(listing_id)
+
+    transaction.on_commit(apply)
+
+
+def search_listings(query, property_type=None, rooms=None, offset=0, limit=10):
+    filters = {}
+    if property_type:
+        filters['property_type'] = property_type
+    if rooms:
+        filters['rooms'] = rooms
+
+    count, page, facets = get_listing_search_index().search(query, filters=filters, offset=offset, limit=limit)
+    return {
+        'count': count,
+        'results': [dict(payload, score=round(score, 4)) for _doc_id, score, payload in page],
+        'facets': facets,
+    }
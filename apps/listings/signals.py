@@ -0,0 +1,7 @@
+from .services import invalidate_listing_cache, invalidate_listing_calendars
+
+
+def invalidate_caches_on_delete(sender, instance, **kwargs):
+    # post_delete приходит и при каскадном удалении вместе с владельцем, которое минует Listing.delete()
+    invalidate_listing_cache([instance.pk])
+    invalidate_listing_calendars([instance.pk])
@@ -152,7 +152,7 @@ class TestListingAdmin(TestCase):
             (None, {'fields': ('title', 'description')}),
             ('Owner', {'fields': ('owner',)}),
             ('Listing Details', {'fields': ('price', 'rooms', 'property_type')}),
-            ('Listing Location', {'fields': ('location', 'address')}),
+            ('Listing Location', {'fields': ('location', 'address', 'latitude', 'longitude')}),
             ('Status', {'fields': ('status_choice', 'is_soft_deleted', 'status_changed_at')}),
             ('Metadata', {'fields': ('created_at', 'updated_at')}),
         )
@@ -2,6 +2,7 @@ from time import sleep
 from decimal import Decimal
 from django.test import TestCase
 from django.core.exceptions import ValidationError
+from django.db.models import F
 from django.utils import timezone
 from apps.listings.models import Listing
 from apps.listings.choices import ListingStatusChoices, PropertyTypeChoices
@@ -378,6 +379,36 @@ class ListingModelTest(TestCase):
         listing._change_status(ListingStatusChoices.ACTIVE)
         self.assertEqual(listing.status, ListingStatusChoices.ACTIVE)
 
+    def create_listing(self):
+        return Listing.objects.create(
+            owner=self.business_user,
+            title='Valid Title Here',
+            description='Valid description',
+            location='Test location',
+            address='Test address',
+            property_type=PropertyTypeChoices.HOUSE,
+            price=100.00,
+            rooms=2
+        )
+
+    def test_save_writes_field_deferred_at_load(self):
+        listing = self.create_listing()
+        deferred = Listing.objects.only('id', 'title').get(pk=listing.pk)
+        deferred.price = Decimal('999.00')
+        deferred.save()
+
+        listing.refresh_from_db()
+        self.assertEqual(listing.price, Decimal('999.00'))
+        self.assertEqual(listing.rooms, 2)
+
+    def test_save_writes_expression_value(self):
+        listing = self.create_listing()
+        listing.rooms = F('rooms') + 1
+        listing.save()
+
+        listing.refresh_from_db()
+        self.assertEqual(listing.rooms, 3)
+
     def test_cascade_delete_on_owner_deletion(self):
         listing = Listing.objects.create(
             owner=self.business_user,
@@ -0,0 +1,100 @@
+from django.test import SimpleTestCase
+from apps.listings.search import BM25Index, ListingSearchIndex
+
+
+class BM25IndexTest(SimpleTestCase):
+    def setUp(self):
+        self.index = BM25Index(facet_fields=('property_type', 'rooms'))
+        self.index.add(1, ['Loft loft loft', 'Berlin'], payload={'id': 1}, facets={'property_type': 'loft', 'rooms': 1})
+        self.index.add(2, ['Big house with a loft', 'Munich garden house'], payload={'id': 2},
+                       facets={'property_type': 'house', 'rooms': 4})
+        self.index.add(3, ['House', 'Berlin'], payload={'id': 3}, facets={'property_type': 'house', 'rooms': 2})
+
+    def test_postings_are_sorted_arrays(self):
+        doc_ids, frequencies = self.index.postings['loft']
+        self.assertEqual(list(doc_ids), [1, 2])
+        self.assertEqual(list(frequencies), [3, 1])
+
+    def test_higher_term_frequency_ranks_first(self):
+        count, page, _facets = self.index.search('loft')
+        self.assertEqual(count, 2)
+        self.assertEqual([doc_id for doc_id, _score, _payload in page], [1, 2])
+
+    def test_all_terms_required(self):
+        count, page, _facets = self.index.search('berlin house')
+        self.assertEqual(count, 1)
+        self.assertEqual(page[0][2], {'id': 3})
+        self.assertEqual(self.index.search('unknown house')[0], 0)
+
+    def test_facets_and_filters(self):
+        count, page, facets = self.index.search('house', filters={'rooms': 4})
+        self.assertEqual(count, 1)
+        self.assertEqual(page[0][0], 2)
+        # Фасеты считаются по всем найденным документам, до фильтров
+        self.assertEqual(facets, {'property_type': {'house': 2}, 'rooms': {4: 1, 2: 1}})
+
+    def test_offset_and_limit(self):
+        count, page, _facets = self.index.search('house', offset=1, limit=1)
+        self.assertEqual(count, 2)
+        self.assertEqual(len(page), 1)
+
+    def test_update_and_remove(self):
+        self.index.add(3, ['Cabin'], payload={'id': 3}, facets={'property_type': 'other', 'rooms': 1})
+        self.assertEqual(self.index.search('house')[0], 1)
+        self.assertEqual(self.index.search('cabin')[0], 1)
+
+        self.index.remove(3)
+        self.assertEqual(self.index.search('cabin')[0], 0)
+        self.assertNotIn('cabin', self.index.postings)
+        self.assertEqual(len(self.index), 2)
+
+    def test_ids_beyond_32_bits(self):
+        big_id = 2 ** 40
+        self.index.add(big_id, ['Loft'], payload={'id': big_id}, facets={'property_type': 'loft', 'rooms': 1})
+        count, page, _facets = self.index.search('loft berlin')
+        self.assertEqual(count, 1)
+        self.assertEqual(self.index.search('loft')[0], 3)
+        self.assertIn(big_id, self.index.postings['loft'][0])
+
+
+class ListingSearchIndexTest(SimpleTestCase):
+    def setUp(self):
+        self.index = ListingSearchIndex()
+        self.index.listing_document = lambda listing: (
+            listing['id'], [listing['title']], {'id': listing['id']}, {'property_type': 'other', 'rooms': 1}
+        )
+
+    def test_search_is_not_blocked_while_rebuilding(self):
+        self.index.rebuild([{'id': 1, 'title': 'Old loft'}])
+
+        def listings():
+            # Во время чтения данных поиск идет по прежним структурам, а изменения попадают в журнал
+            self.assertEqual(self.index.search('old')[0], 1)
+            self.index.add_listing({'id': 3, 'title': 'Changed loft'})
+            yield {'id': 2, 'title': 'New loft'}
+
+        self.index.rebuild(listings())
+        self.assertEqual(self.index.search('old')[0], 0)
+        self.assertEqual(self.index.search('loft')[0], 2)
+        self.assertFalse(self.index.is_building)
+
+    def test_zero_ttl_disables_periodic_rebuilds(self):
+        index = ListingSearchIndex(ttl=0)
+        index.listing_document = self.index.listing_document
+        index.refresh(lambda: [{'id': 1, 'title': 'Loft'}])
+        index.built_at -= 10 ** 6
+
+        self.assertFalse(index.is_stale)
+        index.refresh(lambda: self.fail('The index is built once when periodic rebuilds are disabled.'))
+        self.assertEqual(index.search('loft')[0], 1)
+
+    def test_refresh_skips_while_another_thread_rebuilds(self):
+        self.index.rebuild([{'id': 1, 'title': 'Loft'}])
+        self.index.built_at -= 10 ** 6
+        self.index.ttl = 1
+        self.index.rebuild_lock.acquire()
+        try:
+            self.index.refresh(lambda: self.fail('Only the rebuilding thread reads the listings.'))
+        finally:
+            self.index.rebuild_lock.release()
+        self.assertEqual(self.index.search('loft')[0], 1)
@@ -0,0 +1,31 @@
+from django.test import SimpleTestCase
+from apps.listings.search import InvertedIndex, tokenize
+
+
+class InvertedIndexTest(SimpleTestCase):
+    def setUp(self):
+        self.index = InvertedIndex()
+        self.index.add(1, 'Sunny loft', 'Loft near the river', 'Berlin')
+        self.index.add(2, 'Quiet house', 'Garden house', 'Munich')
+        self.index.add(3, 'Berlin flat', None, 'Berlin')
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize('Loft, near the River!'), ['loft', 'near', 'the', 'river'])
+        self.assertEqual(tokenize(None), [])
+
+    def test_prefix_match(self):
+        self.assertEqual(set(self.index.search('ber')), {1, 3})
+
+    def test_all_terms_required(self):
+        self.assertEqual(set(self.index.search('berlin loft')), {1})
+        self.assertEqual(self.index.search('berlin garden'), {})
+
+    def test_scores_count_occurrences(self):
+        scores = self.index.search('berlin')
+        self.assertEqual(scores[3], 2)
+        self.assertEqual(scores[1], 1)
+
+    def test_index_updates_after_add(self):
+        self.assertEqual(self.index.search('cabin'), {})
+        self.index.add(4, 'Cabin')
+        self.assertEqual(set(self.index.search('cabin')), {4})
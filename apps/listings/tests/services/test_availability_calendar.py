@@ -0,0 +1,60 @@
+from datetime import date, timedelta
+from django.test import SimpleTestCase
+from apps.listings.services import AvailabilityCalendar
+
+
+class AvailabilityCalendarTest(SimpleTestCase):
+    def setUp(self):
+        self.today = date(2024, 2, 28)
+
+    def day(self, offset):
+        return self.today + timedelta(days=offset)
+
+    def test_empty_calendar_is_fully_available(self):
+        calendar = AvailabilityCalendar(self.today)
+        self.assertEqual(calendar.available_dates(), [self.day(i) for i in range(90)])
+
+    def test_mark_booked_sets_range(self):
+        calendar = AvailabilityCalendar.from_intervals(self.today, [(self.day(10), self.day(15))])
+        self.assertEqual(calendar.booked, 0b11111 << 10)
+        self.assertNotIn(self.day(10), calendar.available_dates())
+        self.assertIn(self.day(15), calendar.available_dates())
+
+    def test_intervals_are_clipped_to_window(self):
+        calendar = AvailabilityCalendar.from_intervals(
+            self.today,
+            [(self.day(-5), self.day(2)), (self.day(88), self.day(120))]
+        )
+        available = calendar.available_dates()
+        self.assertEqual(available[0], self.day(2))
+        self.assertEqual(available[-1], self.day(87))
+        self.assertEqual(len(available), 86)
+
+    def test_is_free(self):
+        calendar = AvailabilityCalendar.from_intervals(self.today, [(self.day(10), self.day(15))])
+        self.assertTrue(calendar.is_free(self.day(5), self.day(10)))
+        self.assertTrue(calendar.is_free(self.day(15), self.day(20)))
+        self.assertFalse(calendar.is_free(self.day(14), self.day(16)))
+        # Некорректные диапазоны и выход за окно считаются недоступными
+        self.assertFalse(calendar.is_free(self.day(5), self.day(5)))
+        self.assertFalse(calendar.is_free(self.day(85), self.day(91)))
+
+    def test_free_nights(self):
+        calendar = AvailabilityCalendar.from_intervals(self.today, [(self.day(10), self.day(15))])
+        self.assertEqual(calendar.free_nights(self.day(8), self.day(18)), 5)
+        self.assertEqual(calendar.free_nights(self.day(10), self.day(15)), 0)
+
+    def test_by_month_slices_window(self):
+        calendar = AvailabilityCalendar.from_intervals(self.today, [(self.day(1), self.day(3))])
+        result = calendar.by_month()
+
+        self.assertEqual([entry['month'] for entry in result], ['2024-02', '2024-03', '2024-04', '2024-05'])
+        # 28 февраля свободно, 29 февраля и 1 марта заняты
+        self.assertEqual(result[0]['dates'], ['2024-02-28'])
+        self.assertEqual(result[1]['dates'][0], '2024-03-02')
+        self.assertEqual(result[-1]['dates'][-1], self.day(89).isoformat())
+
+    def test_by_month_skips_fully_booked_months(self):
+        calendar = AvailabilityCalendar.from_intervals(self.today, [(self.day(0), self.day(2))])
+        result = calendar.by_month()
+        self.assertEqual(result[0]['month'], '2024-03')
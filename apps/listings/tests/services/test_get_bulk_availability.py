@@ -0,0 +1,75 @@
+from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from datetime import timedelta
+from apps.bookings.choices import BookingStatusChoices
+from apps.bookings.models import Booking
+from apps.listings.choices import ListingStatusChoices
+from apps.listings.models import Listing
+from apps.listings.services import get_bulk_availability
+from django.contrib.auth import get_user_model
+
+User = get_user_model()
+
+
+class GetBulkAvailabilityTest(TestCase):
+    def setUp(self):
+        self.business_user = User.objects.create_user(
+            email='business@example.com',
+            username='businessuser',
+            password='password123',
+            is_business_account=True
+        )
+        self.listings = [
+            Listing.objects.create(
+                owner=self.business_user,
+                title=f'Test Listing {i}',
+                description='A test listing',
+                location='Test Location',
+                address='123 Test Street',
+                price=100.00,
+                rooms=2,
+                status=ListingStatusChoices.ACTIVE
+            )
+            for i in range(3)
+        ]
+        self.today = timezone.now().date()
+
+    def day(self, offset):
+        return self.today + timedelta(days=offset)
+
+    def create_booking(self, listing, start_offset, end_offset, status=BookingStatusChoices.CONFIRMED):
+        return Booking.objects.create(
+            listing=listing,
+            user=self.business_user,
+            start_date=self.day(start_offset),
+            end_date=self.day(end_offset),
+            status=status
+        )
+
+    def test_matches_is_available(self):
+        self.create_booking(self.listings[0], 10, 15)
+        self.create_booking(self.listings[1], 3, 6, status=BookingStatusChoices.REQUEST)
+        self.create_booking(self.listings[2], 10, 15, status=BookingStatusChoices.CANCELED)
+        date_ranges = [(self.day(5), self.day(12)), (self.day(20), self.day(25)), (self.day(85), self.day(95))]
+
+        result = get_bulk_availability([listing.id for listing in self.listings], date_ranges)
+
+        for listing in self.listings:
+            for (start_date, end_date), entry in zip(date_ranges, result[listing.id]):
+                self.assertEqual(entry['available'], listing.is_available(start_date, end_date))
+
+    def test_free_nights(self):
+        self.create_booking(self.listings[0], 10, 15)
+        result = get_bulk_availability([self.listings[0].id], [(self.day(8), self.day(18))])
+        self.assertEqual(result[self.listings[0].id][0]['free_nights'], 5)
+        self.assertFalse(result[self.listings[0].id][0]['available'])
+
+    def test_single_query_for_many_listings(self):
+        for listing in self.listings:
+            self.create_booking(listing, 10, 15)
+
+        with CaptureQueriesContext(connection) as context:
+            get_bulk_availability([listing.id for listing in self.listings], [(self.day(1), self.day(5))])
+        self.assertEqual(len(context.captured_queries), 1)
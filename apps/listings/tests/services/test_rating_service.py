@@ -0,0 +1,108 @@
+from decimal import Decimal
+from io import StringIO
+from django.contrib.admin.sites import AdminSite
+from django.core.management import call_command
+from django.test import TestCase, RequestFactory
+from apps.listings.models import Listing
+from apps.listings.services import recalculate_listing_ratings
+from apps.reviews.actions import make_shadow_banned
+from apps.reviews.admin import ReviewAdmin
+from apps.reviews.choices import ReviewStatusChoices
+from apps.reviews.models import Review
+from apps.users.models import User
+
+
+class TestListingRatingAggregates(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username='owner', email='owner@example.com', password='password123', is_business_account=True
+        )
+        self.reviewers = [
+            User.objects.create_user(username=f'reviewer{i}', email=f'reviewer{i}@example.com', password='password123')
+            for i in range(3)
+        ]
+        self.listing = self.create_listing('Rated listing')
+
+    def create_listing(self, title):
+        return Listing.objects.create(
+            owner=self.owner, title=title, description='Description', location='Berlin',
+            address='Address', price=100, rooms=2
+        )
+
+    def assertRating(self, count, total, avg, listing=None):
+        listing = listing or self.listing
+        listing.refresh_from_db()
+        self.assertEqual((listing.rating_count, listing.rating_sum, listing.rating_avg), (count, total, avg))
+
+    def test_create_and_update_review(self):
+        review = Review.objects.create(listing=self.listing, reviewer=self.reviewers[0], rating=5)
+        Review.objects.create(listing=self.listing, reviewer=self.reviewers[1], rating=4)
+        self.assertRating(2, 9, Decimal('4.50'))
+
+        review.rating = 2
+        review.save()
+        self.assertRating(2, 6, Decimal('3.00'))
+
+    def test_review_without_rating_is_not_counted(self):
+        Review.objects.create(listing=self.listing, reviewer=self.reviewers[0], comment='No rating')
+        self.assertRating(0, 0, None)
+
+    def test_hidden_reviews_are_subtracted(self):
+        banned = Review.objects.create(listing=self.listing, reviewer=self.reviewers[0], rating=1)
+        deleted = Review.objects.create(listing=self.listing, reviewer=self.reviewers[1], rating=4)
+        Review.objects.create(listing=self.listing, reviewer=self.reviewers[2], rating=5)
+
+        banned.apply_shadow_ban()
+        self.assertRating(2, 9, Decimal('4.50'))
+        deleted.soft_delete()
+        self.assertRating(1, 5, Decimal('5.00'))
+
+        # Повторная смена на тот же статус не меняет агрегаты
+        deleted.soft_delete()
+        self.assertRating(1, 5, Decimal('5.00'))
+
+    def test_last_visible_review_removal_resets_average(self):
+        review = Review.objects.create(listing=self.listing, reviewer=self.reviewers[0], rating=3)
+        review.delete()
+        self.assertRating(0, 0, None)
+
+    def test_review_moved_to_another_listing(self):
+        other = self.create_listing('Other listing')
+        review = Review.objects.create(listing=self.listing, reviewer=self.reviewers[0], rating=4)
+
+        review.listing = other
+        review.save()
+        self.assertRating(0, 0, None)
+        self.assertRating(1, 4, Decimal('4.00'), listing=other)
+
+    def test_admin_actions_recalculate(self):
+        review = Review.objects.create(listing=self.listing, reviewer=self.reviewers[0], rating=2)
+        Review.objects.create(listing=self.listing, reviewer=self.reviewers[1], rating=4)
+
+        admin = ReviewAdmin(Review, AdminSite())
+        admin.message_user = lambda *args, **kwargs: None
+        request = RequestFactory().post('/')
+        make_shadow_banned(admin, request, Review.objects.filter(pk=review.pk))
+        self.assertRating(1, 4, Decimal('4.00'))
+
+        admin.delete_queryset(request, Review.objects.all())
+        self.assertRating(0, 0, None)
+
+    def test_recalculate_fixes_drift(self):
+        Review.objects.create(listing=self.listing, reviewer=self.reviewers[0], rating=5)
+        Review.objects.create(listing=self.listing, reviewer=self.reviewers[1], rating=2,
+                              status=ReviewStatusChoices.SHADOW_BANNED)
+        Listing.objects.filter(pk=self.listing.pk).update(rating_count=7, rating_sum=1, rating_avg=None)
+
+        self.assertEqual(recalculate_listing_ratings(), 1)
+        self.assertRating(1, 5, Decimal('5.00'))
+        self.assertEqual(recalculate_listing_ratings(), 0)
+
+    def test_reconcile_command(self):
+        Review.objects.create(listing=self.listing, reviewer=self.reviewers[0], rating=3)
+        Listing.objects.filter(pk=self.listing.pk).update(rating_count=0, rating_sum=0, rating_avg=None)
+
+        out = StringIO()
+        call_command('reconcile_listing_ratings', '--listing', str(self.listing.pk), stdout=out)
+        self.assertIn('1 listings fixed', out.getvalue())
+        self.assertRating(1, 3, Decimal('3.00'))
@@ -0,0 +1,143 @@
+from datetime import timedelta
+from unittest.mock import patch
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.bookings.models import Booking
+from apps.bookings.choices import BookingStatusChoices
+from apps.listings.models import Listing, ListingNight
+from apps.listings.services import rebuild_listing_nights
+from apps.listings.choices import ListingStatusChoices
+from apps.users.models import User
+
+
+class AvailableDatesCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(
+            username='owner', email='owner@example.com', password='password123', is_business_account=True
+        )
+        self.guest = User.objects.create_user(
+            username='guest', email='guest@example.com', password='password123'
+        )
+        self.superuser = User.objects.create_superuser(
+            username='admin', email='admin@example.com', password='adminpass'
+        )
+        self.listing = Listing.objects.create(
+            owner=self.owner,
+            title='Calendar listing',
+            description='Description',
+            location='Berlin',
+            address='Address',
+            price=100,
+            rooms=2,
+            status=ListingStatusChoices.ACTIVE
+        )
+        self.url = reverse('available-dates-by-month', kwargs={'listing_id': self.listing.id})
+        self.today = timezone.now().date()
+
+    def available_dates(self, response):
+        return [date for month in response.data['available_dates_by_month'] for date in month['dates']]
+
+    def create_booking(self, status=BookingStatusChoices.CONFIRMED):
+        return Booking.objects.create(
+            listing=self.listing,
+            user=self.guest,
+            start_date=self.today + timedelta(days=5),
+            end_date=self.today + timedelta(days=7),
+            status=status
+        )
+
+    def test_repeat_request_served_from_cache(self):
+        first = self.client.get(self.url)
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(first['ETag'], second['ETag'])
+
+    def test_if_none_match_returns_not_modified(self):
+        etag = self.client.get(self.url)['ETag']
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_new_booking_invalidates_calendar(self):
+        etag = self.client.get(self.url)['ETag']
+        self.create_booking()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertNotIn((self.today + timedelta(days=5)).isoformat(), self.available_dates(response))
+
+    def test_status_change_invalidates_calendar(self):
+        booking = self.create_booking()
+        self.client.get(self.url)
+        booking.cancel()
+
+        response = self.client.get(self.url)
+        self.assertIn((self.today + timedelta(days=5)).isoformat(), self.available_dates(response))
+
+    def test_admin_action_invalidates_calendar(self):
+        booking = self.create_booking(status=BookingStatusChoices.PENDING)
+        self.client.get(self.url)
+
+        self.client.login(username='admin@example.com', password='adminpass')
+        self.client.post(reverse('admin:bookings_booking_changelist'), {
+            'action': 'make_confirmed',
+            '_selected_action': [booking.pk],
+        })
+        self.client.logout()
+
+        response = self.client.get(self.url)
+        self.assertNotIn((self.today + timedelta(days=5)).isoformat(), self.available_dates(response))
+
+    def test_booking_hard_delete_invalidates_calendar(self):
+        booking = self.create_booking()
+        etag = self.client.get(self.url)['ETag']
+        booking.delete()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn((self.today + timedelta(days=5)).isoformat(), self.available_dates(response))
+
+    def test_cascade_delete_invalidates_calendar(self):
+        self.create_booking()
+        self.client.get(self.url)
+        # Бронирования гостя удаляются каскадом, минуя Booking.delete()
+        self.guest.delete()
+
+        response = self.client.get(self.url)
+        self.assertIn((self.today + timedelta(days=5)).isoformat(), self.available_dates(response))
+
+    def test_listing_hard_delete_invalidates_calendar(self):
+        self.client.get(self.url)
+        self.listing.delete()
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(USE_LISTING_NIGHTS=True)
+    def test_full_night_rebuild_invalidates_calendar(self):
+        self.create_booking()
+        # Расхождение таблицы ночей: календарь кешируется с занятыми датами как свободными
+        ListingNight.objects.all().delete()
+        etag = self.client.get(self.url)['ETag']
+        self.assertIn((self.today + timedelta(days=5)).isoformat(), self.available_dates(self.client.get(self.url)))
+
+        rebuild_listing_nights()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn((self.today + timedelta(days=5)).isoformat(), self.available_dates(response))
+
+    def test_day_rollover_recomputes_calendar(self):
+        etag = self.client.get(self.url)['ETag']
+
+        tomorrow = timezone.now() + timedelta(days=1)
+        with patch('django.utils.timezone.now', return_value=tomorrow):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn(self.today.isoformat(), self.available_dates(response))
@@ -0,0 +1,85 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.utils import timezone
+from datetime import timedelta
+from apps.listings.models import Listing
+from apps.listings.choices import ListingStatusChoices
+from apps.bookings.models import Booking
+from django.contrib.auth import get_user_model
+
+User = get_user_model()
+
+
+class ListingAvailabilityViewTests(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='testuser@example.com',
+            password='testpass',
+            is_business_account=True
+        )
+        self.active_listing = self.create_listing(ListingStatusChoices.ACTIVE)
+        self.booked_listing = self.create_listing(ListingStatusChoices.ACTIVE)
+        self.draft_listing = self.create_listing(ListingStatusChoices.DRAFT)
+        self.today = timezone.now().date()
+        Booking.objects.create(
+            listing=self.booked_listing,
+            user=self.user,
+            start_date=self.today + timedelta(days=5),
+            end_date=self.today + timedelta(days=10),
+        ).confirm()
+        self.url = reverse('listing-availability')
+
+    def create_listing(self, listing_status):
+        return Listing.objects.create(
+            owner=self.user,
+            title='Test Listing',
+            description='Test description',
+            location='Test City',
+            address='123 Test St',
+            price=100.00,
+            rooms=2,
+            status=listing_status,
+        )
+
+    def test_bulk_availability(self):
+        data = {
+            'listing_ids': [self.active_listing.id, self.booked_listing.id],
+            'date_ranges': [{
+                'start_date': str(self.today + timedelta(days=4)),
+                'end_date': str(self.today + timedelta(days=7)),
+            }],
+        }
+        response = self.client.post(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        availability = response.data['availability']
+        self.assertTrue(availability[self.active_listing.id][0]['available'])
+        self.assertFalse(availability[self.booked_listing.id][0]['available'])
+        self.assertEqual(availability[self.booked_listing.id][0]['free_nights'], 1)
+
+    def test_hidden_listings_are_omitted(self):
+        data = {
+            'listing_ids': [self.draft_listing.id, 999999],
+            'date_ranges': [{
+                'start_date': str(self.today + timedelta(days=1)),
+                'end_date': str(self.today + timedelta(days=2)),
+            }],
+        }
+        response = self.client.post(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['availability'], {})
+
+    def test_invalid_date_range(self):
+        data = {
+            'listing_ids': [self.active_listing.id],
+            'date_ranges': [{
+                'start_date': str(self.today + timedelta(days=5)),
+                'end_date': str(self.today + timedelta(days=5)),
+            }],
+        }
+        response = self.client.post(self.url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
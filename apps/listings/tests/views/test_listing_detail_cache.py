@@ -0,0 +1,86 @@
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.listings.models import Listing
+from apps.listings.choices import ListingStatusChoices
+from apps.users.models import User
+
+
+class TestListingDetailCache(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(
+            username='owner', email='owner@example.com', password='password123', is_business_account=True
+        )
+        self.superuser = User.objects.create_superuser(
+            username='admin', email='admin@example.com', password='adminpass'
+        )
+        self.listing = Listing.objects.create(
+            owner=self.owner,
+            title='Cached listing title',
+            description='Description',
+            location='Berlin',
+            address='Address',
+            price=100,
+            rooms=2,
+            status=ListingStatusChoices.ACTIVE
+        )
+        self.url = reverse('listing-detail', kwargs={'id': self.listing.id})
+
+    def test_public_detail_served_from_cache(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['title'], 'Cached listing title')
+        self.assertEqual(response.data['owner'], 'owner')
+
+    def test_first_request_reads_listing_with_owner_in_one_query(self):
+        with self.assertNumQueries(1):
+            self.client.get(self.url)
+
+    def test_save_invalidates_cache(self):
+        self.client.get(self.url)
+        self.listing.title = 'Updated listing title'
+        self.listing.save()
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['title'], 'Updated listing title')
+
+    def test_status_change_invalidates_cache(self):
+        self.client.get(self.url)
+        self.listing.deactivate()
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_hard_delete_invalidates_cache(self):
+        self.client.get(self.url)
+        self.listing.delete()
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_owner_cascade_delete_invalidates_cache(self):
+        self.client.get(self.url)
+        self.owner.delete()
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_admin_action_invalidates_cache(self):
+        self.client.get(self.url)
+
+        self.client.login(username='admin@example.com', password='adminpass')
+        self.client.post(reverse('admin:listings_listing_changelist'), {
+            'action': 'make_deactivated',
+            '_selected_action': [self.listing.pk],
+        })
+        self.client.logout()
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_owner_gets_full_representation_despite_cache(self):
+        self.client.get(self.url)
+
+        self.client.force_authenticate(user=self.owner)
+        response = self.client.get(self.url)
+        self.assertIn('status', response.data)
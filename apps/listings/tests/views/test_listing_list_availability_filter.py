@@ -0,0 +1,92 @@
+from datetime import timedelta
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.contrib.auth import get_user_model
+from apps.bookings.choices import BookingStatusChoices
+from apps.bookings.models import Booking
+from apps.listings.models import Listing
+from apps.listings.choices import ListingStatusChoices
+
+
+class TestListingListAvailabilityFilter(APITestCase):
+
+    def setUp(self):
+        self.business_user = get_user_model().objects.create_user(
+            username='businessuser', email='business@example.com', password='business123', is_business_account=True
+        )
+        self.listings = [
+            Listing.objects.create(
+                title=f'Listing {i + 1}',
+                owner=self.business_user,
+                description=f'Description {i + 1}',
+                location='Berlin',
+                address=f'Address {i + 1}',
+                price=100 + i,
+                rooms=3,
+                status=ListingStatusChoices.ACTIVE
+            )
+            for i in range(4)
+        ]
+        self.today = timezone.now().date()
+
+        # Листинг 0 занят подтвержденной бронью, листинг 1 — запросом, листинг 2 — отмененной бронью
+        self.create_booking(self.listings[0], 5, 10).confirm()
+        self.create_booking(self.listings[1], 8, 12).request()
+        self.create_booking(self.listings[2], 5, 10).cancel()
+
+    def create_booking(self, listing, start_offset, end_offset):
+        return Booking.objects.create(
+            listing=listing,
+            user=self.business_user,
+            start_date=self.today + timedelta(days=start_offset),
+            end_date=self.today + timedelta(days=end_offset),
+        )
+
+    def get_dates(self, check_in_offset, check_out_offset, **params):
+        params.update({
+            'check_in': str(self.today + timedelta(days=check_in_offset)),
+            'check_out': str(self.today + timedelta(days=check_out_offset)),
+        })
+        return self.client.get(reverse('listing-list'), params)
+
+    def test_excludes_listings_with_blocking_bookings(self):
+        response = self.get_dates(6, 9)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        ids = {item['id'] for item in response.data['results']}
+        self.assertEqual(ids, {self.listings[2].id, self.listings[3].id})
+
+    def test_adjacent_dates_are_free(self):
+        response = self.get_dates(10, 11)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        ids = {item['id'] for item in response.data['results']}
+        self.assertNotIn(self.listings[1].id, ids)
+        self.assertIn(self.listings[0].id, ids)
+
+    def test_combined_with_other_filters(self):
+        response = self.get_dates(6, 9, price=103)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item['id'] for item in response.data['results']], [self.listings[3].id])
+
+    def test_single_query_for_results(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.get_dates(6, 9)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        listing_queries = [query for query in context.captured_queries if 'EXISTS' in query['sql']]
+        # COUNT для пагинации и выборка страницы, оба с подзапросом NOT EXISTS
+        self.assertEqual(len(listing_queries), 2)
+
+    def test_check_in_without_check_out(self):
+        response = self.client.get(reverse('listing-list'), {'check_in': str(self.today)})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_check_out_before_check_in(self):
+        response = self.get_dates(9, 6)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_check_out_beyond_horizon(self):
+        response = self.get_dates(85, 95)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,79 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.listings.models import Listing
+from apps.listings.choices import ListingStatusChoices, PropertyTypeChoices
+from apps.users.models import User
+
+
+class TestListingListFacets(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(
+            username='owner', email='owner@example.com', password='password123', is_business_account=True
+        )
+        self.create_listing(PropertyTypeChoices.HOUSE, 2, 40, 'Berlin')
+        self.create_listing(PropertyTypeChoices.HOUSE, 6, 120, 'Berlin')
+        self.create_listing(PropertyTypeChoices.APARTMENT, 7, 130, 'Munich')
+        self.create_listing(PropertyTypeChoices.APARTMENT, 1, 75, 'Munich', status=ListingStatusChoices.DEACTIVATED)
+        self.url = reverse('listing-list')
+
+    def create_listing(self, property_type, rooms, price, location, status=ListingStatusChoices.ACTIVE):
+        return Listing.objects.create(
+            owner=self.owner,
+            title='Facet test listing',
+            description='Description',
+            location=location,
+            address='Address',
+            property_type=property_type,
+            price=price,
+            rooms=rooms,
+            status=status
+        )
+
+    def test_no_facets_by_default(self):
+        response = self.client.get(self.url)
+        self.assertNotIn('facets', response.data)
+
+    def test_all_facets(self):
+        response = self.client.get(self.url, {'facets': 'property_type,rooms,location,price'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        facets = response.data['facets']
+
+        self.assertEqual(facets['property_type'], [{'value': 'house', 'count': 2}, {'value': 'apartment', 'count': 1}])
+        self.assertEqual(facets['rooms'], [{'value': '2', 'count': 1}, {'value': '5+', 'count': 2}])
+        self.assertEqual(facets['location'], [{'value': 'Berlin', 'count': 2}, {'value': 'Munich', 'count': 1}])
+        self.assertEqual(facets['price'], [
+            {'min': '0', 'max': '50', 'count': 1},
+            {'min': '100', 'max': '150', 'count': 2},
+        ])
+
+    def test_facets_follow_filters(self):
+        response = self.client.get(self.url, {'facets': 'property_type', 'location': 'Munich'})
+        self.assertEqual(response.data['facets'], {'property_type': [{'value': 'apartment', 'count': 1}]})
+
+        response = self.client.get(self.url, {'facets': 'location', 'search': 'berlin'})
+        self.assertEqual(response.data['facets'], {'location': [{'value': 'Berlin', 'count': 2}]})
+
+    def test_facets_computed_per_facet_and_cached(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url, {'facets': 'property_type,rooms,location,price'})
+        grouped = [query for query in queries.captured_queries if 'GROUP BY' in query['sql']]
+        self.assertEqual(len(grouped), 4)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url, {'facets': 'property_type,rooms,location,price'})
+        self.assertFalse(any('GROUP BY' in query['sql'] for query in queries.captured_queries))
+
+    @override_settings(LISTING_LOCATION_FACET_LIMIT=1)
+    def test_location_buckets_are_capped(self):
+        response = self.client.get(self.url, {'facets': 'location'})
+        self.assertEqual(response.data['facets'], {'location': [{'value': 'Berlin', 'count': 2}]})
+
+    def test_unknown_facet(self):
+        response = self.client.get(self.url, {'facets': 'color'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
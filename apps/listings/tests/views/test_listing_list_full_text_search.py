@@ -0,0 +1,53 @@
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.listings.models import Listing
+from apps.listings.choices import ListingStatusChoices
+from apps.users.models import User
+
+
+class TestListingListFullTextSearch(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username='owner', email='owner@example.com', password='password123', is_business_account=True
+        )
+        self.loft = self.create_listing('Sunny loft', 'Loft with a loft bed near the river', 'Berlin')
+        self.house = self.create_listing('Quiet house', 'Garden house', 'Munich')
+        self.flat = self.create_listing('Small flat', 'Close to a loft district', 'Berlin')
+        self.hidden = self.create_listing('Hidden loft', 'Loft', 'Berlin', status=ListingStatusChoices.DEACTIVATED)
+
+    def create_listing(self, title, description, location, status=ListingStatusChoices.ACTIVE):
+        return Listing.objects.create(
+            owner=self.owner,
+            title=title,
+            description=description,
+            location=location,
+            address='Address',
+            price=100,
+            rooms=2,
+            status=status
+        )
+
+    def search(self, query, **params):
+        response = self.client.get(reverse('listing-list'), {'search': query, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [item['id'] for item in response.data['results']]
+
+    def test_results_ranked_by_relevance(self):
+        self.assertEqual(self.search('loft'), [self.loft.id, self.flat.id])
+
+    def test_all_terms_required(self):
+        self.assertEqual(self.search('berl river'), [self.loft.id])
+        self.assertEqual(self.search('munich loft'), [])
+
+    def test_explicit_ordering_overrides_relevance(self):
+        self.assertEqual(self.search('loft', ordering='title'), [self.flat.id, self.loft.id])
+
+    def test_search_respects_other_filters(self):
+        self.assertEqual(self.search('loft', location='Munich'), [])
+        self.assertEqual(self.search('house', location='Munich'), [self.house.id])
+
+    @override_settings(FULLTEXT_FALLBACK_MAX_ROWS=1)
+    def test_fallback_ranks_bounded_candidates(self):
+        self.assertEqual(len(self.search('loft')), 1)
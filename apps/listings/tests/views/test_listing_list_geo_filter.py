@@ -0,0 +1,77 @@
+from decimal import Decimal
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.listings.models import Listing
+from apps.listings.choices import ListingStatusChoices
+from apps.users.models import User
+
+
+class TestListingListGeoFilter(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username='owner', email='owner@example.com', password='password123', is_business_account=True
+        )
+        self.mitte = self.create_listing('Berlin Mitte', '52.520008', '13.404954')
+        self.kreuzberg = self.create_listing('Berlin Kreuzberg', '52.497900', '13.403700')
+        self.potsdam = self.create_listing('Potsdam', '52.390600', '13.065300')
+        self.munich = self.create_listing('Munich', '48.137154', '11.576124')
+        self.no_coordinates = self.create_listing('No coordinates', None, None)
+        self.url = reverse('listing-list')
+
+    def create_listing(self, title, latitude, longitude):
+        return Listing.objects.create(
+            owner=self.owner,
+            title=f'{title} listing',
+            description='Description',
+            location=title,
+            address='Address',
+            price=100,
+            rooms=2,
+            latitude=latitude,
+            longitude=longitude,
+            status=ListingStatusChoices.ACTIVE
+        )
+
+    def get_ids(self, params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        return [item['id'] for item in response.data['results']], response
+
+    def test_geohash_is_computed_on_save(self):
+        self.assertTrue(self.mitte.geohash.startswith('u33d'))
+        self.assertEqual(self.no_coordinates.geohash, '')
+
+        self.mitte.latitude = Decimal('48.137154')
+        self.mitte.longitude = Decimal('11.576124')
+        self.mitte.save()
+        self.mitte.refresh_from_db()
+        self.assertEqual(self.mitte.geohash, self.munich.geohash)
+
+    def test_bbox_filter(self):
+        ids, _response = self.get_ids({'bbox': '52.4,13.2,52.6,13.6'})
+        self.assertEqual(set(ids), {self.mitte.id, self.kreuzberg.id})
+
+    def test_radius_filter_ranks_by_distance(self):
+        ids, response = self.get_ids({'lat': '52.4979', 'lng': '13.4037', 'radius_km': '40'})
+        self.assertEqual(ids, [self.kreuzberg.id, self.mitte.id, self.potsdam.id])
+        self.assertLess(response.data['results'][0]['distance_km'], 0.1)
+        self.assertAlmostEqual(response.data['results'][1]['distance_km'], 2.5, delta=0.2)
+
+    def test_radius_excludes_points_in_bbox_corners(self):
+        ids, _response = self.get_ids({'lat': '52.4979', 'lng': '13.4037', 'radius_km': '2'})
+        self.assertEqual(ids, [self.kreuzberg.id])
+
+    def test_radius_requires_all_parameters(self):
+        response = self.client.get(self.url, {'lat': '52.5', 'radius_km': '10'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_invalid_bbox(self):
+        response = self.client.get(self.url, {'bbox': '52.6,13.2,52.4'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(self.url, {'bbox': '52.6,13.2,52.4,13.6'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_distance_absent_without_radius(self):
+        response = self.client.get(self.url)
+        self.assertNotIn('distance_km', response.data['results'][0])
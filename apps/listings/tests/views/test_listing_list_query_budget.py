@@ -0,0 +1,67 @@
+from datetime import timedelta
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from apps.listings.models import Listing
+from apps.listings.choices import ListingStatusChoices
+from apps.users.models import User
+from apps.bookings.models import Booking
+from common.utils.query_budget import QueryBudgetTestMixin
+
+
+class ListingListQueryBudgetTests(QueryBudgetTestMixin, APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            username='admin', email='admin@example.com', password='password123', is_staff=True
+        )
+
+        self.owner = User.objects.create_user(
+            username='owner', email='owner@example.com', password='password123', is_business_account=True
+        )
+
+        # У каждого объявления свой владелец, чтобы N+1 по owner был заметен
+        for i in range(10):
+            owner = User.objects.create_user(
+                username=f'owner{i}', email=f'owner{i}@example.com', password='password123',
+                is_business_account=True
+            )
+            Listing.objects.create(
+                owner=owner,
+                title=f'Budget Listing {i}',
+                description='Description',
+                location='Berlin',
+                address='Address',
+                price=100 + i,
+                rooms=2,
+                status=ListingStatusChoices.ACTIVE
+            )
+            Listing.objects.create(
+                owner=self.owner,
+                title=f'Owner Listing {i}',
+                description='Description',
+                location='Berlin',
+                address='Address',
+                price=100 + i,
+                rooms=2,
+                status=ListingStatusChoices.ACTIVE
+            )
+
+    def test_listing_list_anonymous(self):
+        self.assertQueryBudget(reverse('listing-list'), budget=2)
+
+    def test_listing_list_staff(self):
+        self.client.force_authenticate(user=self.admin)
+        self.assertQueryBudget(reverse('listing-list'), budget=2)
+
+    def test_listing_list_with_filters_and_search(self):
+        # Без MySQL поиск строит инвертированный индекс отдельным запросом
+        self.assertQueryBudget(reverse('listing-list'), budget=3, data={'search': 'Budget', 'ordering': 'price'})
+
+    def test_my_listings_dashboard(self):
+        listing = Listing.objects.filter(owner=self.owner).first()
+        Booking.objects.create(
+            listing=listing, user=self.admin, start_date=timezone.now().date() + timedelta(days=5),
+            end_date=timezone.now().date() + timedelta(days=7)
+        )
+        self.client.force_authenticate(user=self.owner)
+        self.assertQueryBudget(reverse('my-listings'), budget=2)
@@ -0,0 +1,54 @@
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.listings.choices import ListingStatusChoices
+from apps.listings.models import Listing
+from apps.reviews.models import Review
+from apps.users.models import User
+
+
+class TestListingListRating(APITestCase):
+    def setUp(self):
+        cache.clear()
+        owner = User.objects.create_user(
+            username='owner', email='owner@example.com', password='password123', is_business_account=True
+        )
+        reviewers = [
+            User.objects.create_user(username=f'reviewer{i}', email=f'reviewer{i}@example.com', password='password123')
+            for i in range(3)
+        ]
+        self.listings = {}
+        for title, ratings in (('Top rated flat', [5, 5]), ('Average flat one', [3, 4, 2]), ('Unrated flat', [])):
+            listing = Listing.objects.create(
+                owner=owner, title=title, description='Description', location='Berlin', address='Address',
+                price=100, rooms=2, status=ListingStatusChoices.ACTIVE
+            )
+            for reviewer, rating in zip(reviewers, ratings):
+                Review.objects.create(listing=listing, reviewer=reviewer, rating=rating)
+            self.listings[title] = listing.id
+
+    def get_ids(self, **params):
+        response = self.client.get(reverse('listing-list'), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [item['id'] for item in response.data['results']]
+
+    def test_rating_fields_in_response(self):
+        response = self.client.get(reverse('listing-list'), {'ordering': '-rating_avg'})
+        top = response.data['results'][0]
+        self.assertEqual(top['id'], self.listings['Top rated flat'])
+        self.assertEqual((top['rating_avg'], top['rating_count']), ('5.00', 2))
+
+    def test_ordering_by_rating_count(self):
+        self.assertEqual(self.get_ids(ordering='-rating_count'), [
+            self.listings['Average flat one'], self.listings['Top rated flat'], self.listings['Unrated flat']
+        ])
+
+    def test_rating_filters(self):
+        self.assertEqual(self.get_ids(rating_min='4'), [self.listings['Top rated flat']])
+        self.assertEqual(set(self.get_ids(rating_count_min='1')), {
+            self.listings['Top rated flat'], self.listings['Average flat one']
+        })
+
+    def test_unknown_ordering_field_is_ignored(self):
+        self.assertEqual(len(self.get_ids(ordering='rating_sum')), 3)
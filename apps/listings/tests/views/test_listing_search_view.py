@@ -0,0 +1,97 @@
+from django.contrib.admin.sites import AdminSite
+from django.test import RequestFactory
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.listings.admin import ListingAdmin
+from apps.listings.models import Listing
+from apps.listings.choices import ListingStatusChoices, PropertyTypeChoices
+from apps.listings.services import reset_listing_search_index
+from apps.users.models import User
+
+
+class TestListingSearchView(APITestCase):
+    def setUp(self):
+        reset_listing_search_index()
+        self.addCleanup(reset_listing_search_index)
+
+        self.owner = User.objects.create_user(
+            username='owner', email='owner@example.com', password='password123', is_business_account=True
+        )
+        self.loft = self.create_listing('Sunny loft in Berlin', 'Loft near the river', PropertyTypeChoices.APARTMENT, 1)
+        self.house = self.create_listing('Quiet house in Berlin', 'Garden house', PropertyTypeChoices.HOUSE, 4)
+        self.hidden = self.create_listing('Hidden loft in Berlin', 'Loft', PropertyTypeChoices.APARTMENT, 1,
+                                          status=ListingStatusChoices.DEACTIVATED)
+        self.url = reverse('listing-search')
+
+    def create_listing(self, title, description, property_type, rooms, status=ListingStatusChoices.ACTIVE):
+        return Listing.objects.create(
+            owner=self.owner,
+            title=title,
+            description=description,
+            location='Berlin',
+            address='Address',
+            property_type=property_type,
+            price=100,
+            rooms=rooms,
+            status=status
+        )
+
+    def search(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_search_returns_active_listings_with_facets(self):
+        data = self.search(q='berlin')
+        self.assertEqual(data['count'], 2)
+        self.assertEqual({item['id'] for item in data['results']}, {self.loft.id, self.house.id})
+        self.assertEqual(data['results'][0]['owner'], 'owner')
+        self.assertEqual(data['facets']['property_type'], {'apartment': 1, 'house': 1})
+        self.assertEqual(data['facets']['rooms'], {1: 1, 4: 1})
+
+    def test_search_with_facet_filter(self):
+        data = self.search(q='berlin', property_type=PropertyTypeChoices.HOUSE)
+        self.assertEqual([item['id'] for item in data['results']], [self.house.id])
+
+    def test_query_is_required(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_search_is_served_without_queries_after_build(self):
+        self.search(q='berlin')
+        with self.assertNumQueries(0):
+            self.search(q='loft')
+
+    def test_index_follows_status_changes(self):
+        self.search(q='loft')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.hidden.activate()
+            self.loft.deactivate()
+
+        data = self.search(q='loft')
+        self.assertEqual([item['id'] for item in data['results']], [self.hidden.id])
+
+    def test_index_follows_edits(self):
+        self.search(q='berlin')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.house.title = 'Quiet cottage in Berlin'
+            self.house.save()
+
+        self.assertEqual(self.search(q='cottage')['count'], 1)
+        self.assertEqual(self.search(q='house')['count'], 1)  # description все еще содержит house
+
+    def test_index_follows_hard_deletes(self):
+        self.search(q='berlin')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.loft.delete()
+        self.assertEqual([item['id'] for item in self.search(q='berlin')['results']], [self.house.id])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ListingAdmin(Listing, AdminSite()).delete_queryset(
+                RequestFactory().post('/'), Listing.objects.filter(pk=self.house.pk)
+            )
+        self.assertEqual(self.search(q='berlin')['count'], 0)
@@ -3,7 +3,12 @@ from rest_framework import status
 from rest_framework.test import APITestCase
 from apps.listings.models import Listing
 from apps.listings.choices import ListingStatusChoices, PropertyTypeChoices
+from apps.bookings.models import Booking
+from apps.bookings.choices import BookingStatusChoices
+from apps.reviews.models import Review
 from django.contrib.auth import get_user_model
+from django.utils import timezone
+from datetime import timedelta
 
 User = get_user_model()
 
@@ -106,3 +111,37 @@ class TestMyListingsView(APITestCase):
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['count'], 0)
+
+    def test_my_listings_dashboard_summary(self):
+        # Сводка по бронированиям и отзывам приходит вместе со списком
+        today = timezone.now().date()
+        Booking.objects.create(
+            listing=self.listing1, user=self.regular_user, start_date=today + timedelta(days=10),
+            end_date=today + timedelta(days=12), status=BookingStatusChoices.CONFIRMED)
+        Booking.objects.create(
+            listing=self.listing1, user=self.regular_user, start_date=today + timedelta(days=3),
+            end_date=today + timedelta(days=5), status=BookingStatusChoices.CONFIRMED)
+        Booking.objects.create(
+            listing=self.listing1, user=self.other_business_user, start_date=today + timedelta(days=20),
+            end_date=today + timedelta(days=22), status=BookingStatusChoices.COMPLETED)
+        Review.objects.create(listing=self.listing1, reviewer=self.other_business_user, rating=4)
+
+        self.client.login(email='business@example.com', password='password')
+        response = self.client.get(reverse('my-listings'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        result = response.data['results'][0]
+        self.assertEqual(result['status'], ListingStatusChoices.ACTIVE)
+        self.assertEqual(result['bookings_count'], 3)
+        self.assertEqual(result['upcoming_bookings_count'], 2)
+        self.assertEqual(result['next_check_in'], (today + timedelta(days=3)).isoformat())
+        self.assertEqual(result['average_rating'], 4.0)
+
+    def test_my_listings_dashboard_without_bookings(self):
+        self.client.login(email='business@example.com', password='password')
+        response = self.client.get(reverse('my-listings'))
+        result = response.data['results'][0]
+        self.assertEqual(result['bookings_count'], 0)
+        self.assertEqual(result['upcoming_bookings_count'], 0)
+        self.assertIsNone(result['next_check_in'])
+        self.assertIsNone(result['average_rating'])
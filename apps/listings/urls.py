@@ -8,13 +8,17 @@ from .views import (
     ListingActivateView,
     ListingDeactivateView,
     ListingSoftDeleteView,
-    AvailableDatesByMonthView
+    AvailableDatesByMonthView,
+    ListingAvailabilityView,
+    ListingSearchView
 )
 
 urlpatterns = [
     path('', ListingListView.as_view(), name='listing-list'),
     path('<int:id>/', ListingDetailView.as_view(), name='listing-detail'),
     path('<int:listing_id>/available-dates/', AvailableDatesByMonthView.as_view(), name='available-dates-by-month'),
+    path('availability/', ListingAvailabilityView.as_view(), name='listing-availability'),
+    path('search/', ListingSearchView.as_view(), name='listing-search'),
     path('create/', ListingCreateView.as_view(), name='listing-create'),
     path('<int:id>/update/', ListingUpdateView.as_view(), name='listing-update'),
     path('my/', MyListingsView.as_view(), name='my-listings'),
@@ -1,2 +1,3 @@
 from .listng_views import (ListingListView, MyListingsView, ListingDetailView, ListingCreateView, ListingUpdateView,
-                           ListingActivateView, ListingDeactivateView, ListingSoftDeleteView, AvailableDatesByMonthView)
+                           ListingActivateView, ListingDeactivateView, ListingSoftDeleteView, AvailableDatesByMonthView,
+                           ListingAvailabilityView, ListingSearchView)
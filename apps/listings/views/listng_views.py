@@ -2,29 +2,45 @@ from rest_framework import generics
 from rest_framework.permissions import IsAdminUser, IsAuthenticated, AllowAny
 from ..models import Listing
 from ..choices import ListingStatusChoices
-from ..serializers import (ListingListSerializer, ListingDetailSerializer, ListingCreateSerializer,
-                           ListingUpdateSerializer, ListingStatusActionSerializer)
+from ..serializers import (ListingListSerializer, OwnerListingSerializer, ListingDetailSerializer, ListingCreateSerializer,
+                           ListingUpdateSerializer, ListingStatusActionSerializer, ListingAvailabilityQuerySerializer,
+                           ListingSearchQuerySerializer)
 from ..permissions import IsOwnerOrReadOnly, IsBusinessAccount
+from ..filters import ListingFilter, FullTextSearchFilter
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.filters import SearchFilter, OrderingFilter
+from rest_framework.filters import OrderingFilter
 from rest_framework import status
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
+from django.utils.http import parse_etags
 from django.contrib.auth import get_user_model
 from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.views import APIView
-from ..services import get_available_dates_by_month
-from ..models import Listing
+from ..services import (get_available_dates_by_month, get_bulk_availability, annotate_owner_dashboard, search_listings,
+                        LISTING_FACETS, get_listing_facets, get_cached_public_listing, cache_public_listing,
+                        get_calendar_cache_state, get_cached_calendar, cache_calendar)
+from common.mixins import QuerySetShapingMixin, ConditionalGetMixin
+from common.pagination import EstimatedCountPagination
+from common.utils.ownership import is_owner
 
 User = get_user_model()
 
 
-class ListingListView(generics.ListAPIView):
+class ListingListShapingMixin(QuerySetShapingMixin):
+    # Колонки, которые читают ListingListSerializer и валидаторы ETag; имя владельца денормализовано, join не нужен
+    only_fields = (
+        'id', 'title', 'price', 'location', 'rooms', 'property_type', 'latitude', 'longitude', 'status',
+        'rating_count', 'rating_avg', 'updated_at', 'owner_username',
+    )
+
+
+class ListingListView(ConditionalGetMixin, ListingListShapingMixin, generics.ListAPIView):
     serializer_class = ListingListSerializer
     permission_classes = [AllowAny]
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ['price', 'location', 'rooms', 'property_type', 'status']
-    search_fields = ['title', 'description', 'location', 'address']
+    pagination_class = EstimatedCountPagination
+    filter_backends = [DjangoFilterBackend, FullTextSearchFilter, OrderingFilter]
+    filterset_class = ListingFilter
+    facets = None
 
     def get_queryset(self):
         user = self.request.user
@@ -32,14 +48,45 @@ class ListingListView(generics.ListAPIView):
             return Listing.objects.all().order_by('-created_at')
         return Listing.objects.filter(status=ListingStatusChoices.ACTIVE).order_by('-created_at')
 
+    @property
+    def ordering_fields(self):
+        # OrderingFilter читает атрибут вьюшки; набор полей зависит от пользователя
+        return self.get_ordering_fields(self.request)
+
     def get_ordering_fields(self, request):
         user = self.request.user
+        fields = ['price', 'created_at', 'title', 'rating_avg', 'rating_count']
         if user.is_authenticated and user.is_staff:
-            return ['status', 'price', 'created_at']
-        return ['price', 'created_at']
+            return ['status', *fields]
+        return fields
+
+    def get_requested_facets(self):
+        facets = [facet for facet in self.request.query_params.get('facets', '').split(',') if facet]
+        unknown = set(facets) - set(LISTING_FACETS)
+        if unknown:
+            raise ValidationError({'facets': f"Unknown facets: {', '.join(sorted(unknown))}."})
+        return facets
+
+    def get_list_validator_parts(self):
+        # Фасеты считаются по тому же отфильтрованному queryset, что и страница, и входят в ETag:
+        # строки страницы могут не измениться, когда меняются фасеты
+        self.facets = None
+        requested = self.get_requested_facets()
+        if requested:
+            self.facets = get_listing_facets(self.filter_queryset(self.get_queryset()), requested)
+        return (self.facets,)
+
+    def list(self, request, *args, **kwargs):
+        # Неизвестные фасеты отклоняются до выборки страницы
+        self.get_requested_facets()
+        response = super().list(request, *args, **kwargs)
+        if self.facets is not None and response.status_code == status.HTTP_200_OK:
+            response.data['facets'] = self.facets
+        return response
 
 
-class ListingDetailView(generics.RetrieveAPIView):
+class ListingDetailView(ConditionalGetMixin, generics.RetrieveAPIView):
+    last_modified_fields = ('updated_at', 'status_changed_at')
     serializer_class = ListingDetailSerializer
     permission_classes = [AllowAny]
     lookup_field = 'id'
@@ -50,11 +97,34 @@ class ListingDetailView(generics.RetrieveAPIView):
             if user.is_staff:
                 return Listing.objects.all()
 
-            return Listing.objects.filter(owner=user).exclude(status=ListingStatusChoices.DELETED) | \
-                Listing.objects.filter(status=ListingStatusChoices.ACTIVE)
+            # Имя владельца денормализовано, а права проверяются по owner_id: join к пользователям не нужен
+            return (Listing.objects.filter(owner=user).exclude(status=ListingStatusChoices.DELETED) |
+                    Listing.objects.filter(status=ListingStatusChoices.ACTIVE))
 
         return Listing.objects.filter(status=ListingStatusChoices.ACTIVE)
 
+    def retrieve(self, request, *args, **kwargs):
+        # Персонал и владелец видят расширенное представление, его не кешируем
+        if request.user.is_staff:
+            return super().retrieve(request, *args, **kwargs)
+
+        listing_id = self.kwargs[self.lookup_field]
+        version, cached = get_cached_public_listing(listing_id)
+        if cached is not None and cached['data']['owner_id'] != request.user.id:
+            etag = self.make_etag(Listing._meta.label, cached['data']['id'], cached['last_modified'])
+            return self.conditional_response(etag, cached['last_modified'], lambda: cached['data'])
+
+        instance = self.get_object()
+        last_modified = self.get_last_modified(instance)
+        etag = self.make_etag(Listing._meta.label, instance.pk, last_modified)
+        if self.is_not_modified(etag, last_modified):
+            return self.set_validators(Response(status=status.HTTP_304_NOT_MODIFIED), etag, last_modified)
+
+        data = self.get_serializer(instance).data
+        if instance.status == ListingStatusChoices.ACTIVE and not is_owner(request.user, instance, 'owner_id'):
+            cache_public_listing(listing_id, {'data': data, 'last_modified': last_modified}, version)
+        return self.set_validators(Response(data), etag, last_modified)
+
 
 # Создание объявления
 class ListingCreateView(generics.CreateAPIView):
@@ -84,8 +154,8 @@ class ListingUpdateView(generics.UpdateAPIView):
         serializer.save()
 
 
-class MyListingsView(generics.ListAPIView):
-    serializer_class = ListingListSerializer
+class MyListingsView(ListingListShapingMixin, generics.ListAPIView):
+    serializer_class = OwnerListingSerializer
     permission_classes = [IsAuthenticated, IsAdminUser | IsBusinessAccount]
 
     def get_queryset(self):
@@ -103,16 +173,9 @@ class MyListingsView(generics.ListAPIView):
 
         return Listing.objects.filter(owner=user).exclude(status=ListingStatusChoices.DELETED).order_by('-created_at')
 
-    def list(self, request, *args, **kwargs):
-        response = super().list(request, *args, **kwargs)
-
-        for result in response.data['results']:
-            if 'status' not in result:
-                listing_id = result['id']
-                listing = Listing.objects.get(id=listing_id)
-                result['status'] = listing.status
-
-        return response
+    def filter_queryset(self, queryset):
+        # Сводка для кабинета владельца считается подзапросами в том же запросе страницы
+        return annotate_owner_dashboard(super().filter_queryset(queryset))
 
 
 class BaseListingStatusUpdateView(generics.UpdateAPIView):
@@ -158,13 +221,61 @@ class ListingSoftDeleteView(BaseListingStatusUpdateView):
 class AvailableDatesByMonthView(APIView):
     permission_classes = [AllowAny]
     def get(self, request, listing_id):
-        try:
-            listing = Listing.objects.get(id=listing_id)
-        except Listing.DoesNotExist:
-            return Response({'error': 'Listing not found'}, status=status.HTTP_404_NOT_FOUND)
+        # ETag строится из версии календаря в кеше, поэтому повторный просмотр не обращается к базе
+        cache_key, etag = get_calendar_cache_state(listing_id)
+        if etag in parse_etags(request.headers.get('If-None-Match', '')):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+
+        available_dates_by_month = get_cached_calendar(cache_key)
+        if available_dates_by_month is None:
+            try:
+                listing = Listing.objects.get(id=listing_id)
+            except Listing.DoesNotExist:
+                return Response({'error': 'Listing not found'}, status=status.HTTP_404_NOT_FOUND)
 
-        # Получаем доступные даты по месяцам
-        available_dates_by_month = get_available_dates_by_month(listing)
+            # Получаем доступные даты по месяцам
+            available_dates_by_month = get_available_dates_by_month(listing)
+            cache_calendar(cache_key, available_dates_by_month)
 
         # Возвращаем ответ в формате JSON
-        return Response({'available_dates_by_month': available_dates_by_month})
+        return Response({'available_dates_by_month': available_dates_by_month}, headers={'ETag': etag})
+
+
+class ListingAvailabilityView(APIView):
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        serializer = ListingAvailabilityQuerySerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        # Оставляем только листинги, видимые пользователю, в порядке запроса
+        listings = Listing.objects.filter(id__in=serializer.validated_data['listing_ids'])
+        if not (request.user.is_authenticated and request.user.is_staff):
+            listings = listings.filter(status=ListingStatusChoices.ACTIVE)
+        visible_ids = set(listings.values_list('id', flat=True))
+        listing_ids = [listing_id for listing_id in serializer.validated_data['listing_ids'] if listing_id in visible_ids]
+
+        date_ranges = [
+            (date_range['start_date'], date_range['end_date'])
+            for date_range in serializer.validated_data['date_ranges']
+        ]
+        availability = get_bulk_availability(listing_ids, date_ranges)
+
+        return Response({'availability': availability})
+
+
+class ListingSearchView(APIView):
+    # Поиск по активным объявлениям обслуживается из индекса в памяти, без запросов к базе
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        serializer = ListingSearchQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        return Response(search_listings(
+            data['q'],
+            property_type=data.get('property_type'),
+            rooms=data.get('rooms'),
+            offset=data['offset'],
+            limit=data['limit'],
+        ))
@@ -1,14 +1,31 @@
 from django.contrib import admin
+from django.db import transaction
+from django.utils import timezone
+from apps.listings.services import recalculate_listing_ratings
 from ..choices import ReviewStatusChoices
 
 
+def _update_status(modeladmin, request, queryset, status, message):
+    # Фиксируем выбранные id заранее: фильтры changelist могут зависеть от статуса
+    review_ids = list(queryset.values_list('pk', flat=True))
+    reviews = queryset.model.objects.filter(pk__in=review_ids)
+    listing_ids = set(reviews.values_list('listing_id', flat=True))
+    now = timezone.now()
+
+    with transaction.atomic():
+        reviews.update(status=status, status_changed_at=now, updated_at=now)
+        # Массовое обновление минует save(), поэтому агрегаты рейтинга пересчитываем по затронутым листингам
+        recalculate_listing_ratings(listing_ids)
+    modeladmin.message_user(request, message)
+
+
 @admin.action(description='Mark selected listings as Shadow Banned')
 def make_shadow_banned(modeladmin, request, queryset):
-    queryset.update(status=ReviewStatusChoices.SHADOW_BANNED)
-    modeladmin.message_user(request, "Selected listings have been marked as Shadow Banned.")
+    _update_status(modeladmin, request, queryset, ReviewStatusChoices.SHADOW_BANNED,
+                   "Selected listings have been marked as Shadow Banned.")
 
 
 @admin.action(description='Soft delete selected listings')
 def make_deleted(modeladmin, request, queryset):
-    queryset.update(status=ReviewStatusChoices.DELETED)
-    modeladmin.message_user(request, "Selected listings have been soft deleted.")
+    _update_status(modeladmin, request, queryset, ReviewStatusChoices.DELETED,
+                   "Selected listings have been soft deleted.")
@@ -1,4 +1,6 @@
 from django.contrib import admin
+from django.db import transaction
+from apps.listings.services import recalculate_listing_ratings
 from ..models import Review
 from ..forms import ReviewAdminForm
 from ..mixins import StatusMixin, SoftDeleteMixin
@@ -18,3 +20,10 @@ class ReviewAdmin(StatusMixin, SoftDeleteMixin, admin.ModelAdmin):
     search_fields = ('reviewer__username', 'listing__title', 'comment')
     actions = [make_shadow_banned, make_deleted]
     readonly_fields = ('status_changed_at', 'created_at', 'updated_at')
+
+    def delete_queryset(self, request, queryset):
+        # Массовое удаление минует Review.delete(), поэтому агрегаты рейтинга пересчитываем явно
+        listing_ids = set(queryset.values_list('listing_id', flat=True))
+        with transaction.atomic():
+            super().delete_queryset(request, queryset)
+            recalculate_listing_ratings(listing_ids)
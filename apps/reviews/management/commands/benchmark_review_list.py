@@ -0,0 +1,90 @@
+from time import perf_counter
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from apps.listings.choices import ListingStatusChoices
+from apps.listings.models import Listing
+from apps.users.models import User
+from ...choices import ReviewStatusChoices
+from ...models import Review
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = ('Compares the UNION and OR plans of the review list for an authenticated user '
+            'on generated reviews. All generated rows are rolled back.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reviews', type=int, default=100000, help='Number of generated reviews.')
+        parser.add_argument('--listings', type=int, default=20, help='Listings the reviews are spread over.')
+        parser.add_argument('--repeat', type=int, default=5, help='Runs per plan; the best time is reported.')
+        parser.add_argument('--page-size', type=int, default=10)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                listing, viewer = self.seed(options['reviews'], options['listings'])
+                for name, queryset in self.plans(listing, viewer).items():
+                    self.report(name, queryset, options['repeat'], options['page_size'])
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def seed(self, reviews_count, listings_count):
+        self.stdout.write(f'Generating {reviews_count} reviews over {listings_count} listings...')
+        owner = User.objects.create_user(
+            username='benchmark-owner', email='benchmark-owner@example.com', password=None, is_business_account=True
+        )
+        listings = Listing.objects.bulk_create(
+            Listing(owner=owner, title=f'Benchmark listing {i}', description='Benchmark', location='Benchmark',
+                    address='Benchmark', price=100, rooms=1, status=ListingStatusChoices.ACTIVE)
+            for i in range(listings_count)
+        )
+        reviewers = User.objects.bulk_create(
+            (User(username=f'benchmark-{i}', email=f'benchmark-{i}@example.com', password='!')
+             for i in range(reviews_count)),
+            batch_size=1000
+        )
+
+        # Примерно 90% видимых, остальные поровну скрыты и удалены
+        statuses = [ReviewStatusChoices.VISIBLE] * 18 + [ReviewStatusChoices.SHADOW_BANNED, ReviewStatusChoices.DELETED]
+        Review.objects.bulk_create(
+            (Review(listing=listings[i % listings_count], reviewer=reviewer, rating=i % 5 + 1,
+                    status=statuses[i % len(statuses)])
+             for i, reviewer in enumerate(reviewers)),
+            batch_size=1000
+        )
+
+        # Пользователь со скрытым отзывом на первом листинге: ему видна и эта запись
+        viewer = Review.objects.filter(
+            listing=listings[0], status=ReviewStatusChoices.SHADOW_BANNED
+        ).values_list('reviewer', flat=True).first()
+        return listings[0], User.objects.get(pk=viewer)
+
+    def plans(self, listing, user):
+        return {
+            'union': Review.objects.filter(
+                listing=listing, status=ReviewStatusChoices.VISIBLE
+            ).union(
+                Review.objects.filter(listing=listing, reviewer=user).exclude(status=ReviewStatusChoices.DELETED)
+            ).order_by('-created_at'),
+            'or': Review.objects.filter(
+                Review.visible_to_user_q(user), listing=listing
+            ).select_related('reviewer').order_by('-created_at'),
+        }
+
+    def report(self, name, queryset, repeat, page_size):
+        timings = []
+        for _ in range(repeat):
+            started = perf_counter()
+            # Как во вьюшке: количество для пагинации и первая страница
+            count = queryset.count()
+            list(queryset[:page_size])
+            timings.append(perf_counter() - started)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{name}: {count} rows, best {min(timings) * 1000:.1f} ms, worst {max(timings) * 1000:.1f} ms'
+        ))
+        self.stdout.write(queryset.explain())
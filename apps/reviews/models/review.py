@@ -2,10 +2,10 @@ from django.db import models
 from django.conf import settings
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.db.models import Q
 from django.utils import timezone
 from dirtyfields import DirtyFieldsMixin
-from apps.bookings.choices import BookingStatusChoices
 from apps.listings.models import Listing
 from ..choices import ReviewStatusChoices
 
@@ -21,6 +21,8 @@ class Review(DirtyFieldsMixin, models.Model):
         related_name='reviews',
         on_delete=models.CASCADE
     )
+    # Копия reviewer.username для списков без join к пользователям; синхронизируется из User.save
+    reviewer_username = models.CharField(max_length=50, blank=True, default='', editable=False)
     rating = models.PositiveSmallIntegerField(
         validators=[
             MinValueValidator(1),
@@ -54,7 +56,8 @@ class Review(DirtyFieldsMixin, models.Model):
             models.Index(fields=['rating']),
             models.Index(fields=['created_at']),
             models.Index(fields=['status']),
-            models.Index(fields=['listing', 'status']),
+            # Лента отзывов листинга: фильтр по статусу и сортировка по дате без filesort
+            models.Index(fields=['listing', 'status', 'created_at']),
         ]
         verbose_name = 'Review'
         verbose_name_plural = 'Reviews'
@@ -68,13 +71,50 @@ class Review(DirtyFieldsMixin, models.Model):
             raise ValidationError('Either a rating or a comment is required.')
 
     def save(self, *args, **kwargs):
-        dirty_fields = self.get_dirty_fields()
+        adding = self._state.adding
+        dirty_fields = self.get_dirty_fields(check_relationship=True)
 
         # Проверяем, изменился ли статус
         if 'status' in dirty_fields:
             self.status_changed_at = timezone.now()
+        if adding or 'reviewer' in dirty_fields:
+            self.reviewer_username = self.reviewer.username
 
-        super().save(*args, **kwargs)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if adding:
+                self._apply_rating_delta(None, None, None)
+            elif {'listing', 'status', 'rating'} & set(dirty_fields):
+                self._apply_rating_delta(
+                    dirty_fields.get('listing', self.listing_id),
+                    dirty_fields.get('status', self.status),
+                    dirty_fields.get('rating', self.rating),
+                )
+
+    def delete(self, *args, **kwargs):
+        # Агрегаты листинга вычитают сохраненное в базе состояние, а не правки в памяти
+        dirty_fields = self.get_dirty_fields(check_relationship=True)
+        listing_id = dirty_fields.get('listing', self.listing_id)
+        status = dirty_fields.get('status', self.status)
+        rating = dirty_fields.get('rating', self.rating)
+
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            self._apply_rating_delta(listing_id, status, rating, removed=True)
+        return result
+
+    def _apply_rating_delta(self, old_listing_id, old_status, old_rating, removed=False):
+        # Импорт внутри метода: сервисы листингов сами импортируют модель отзывов
+        from apps.listings.services import rating_contribution, apply_rating_delta
+
+        old_count, old_sum = rating_contribution(old_status, old_rating)
+        new_count, new_sum = (0, 0) if removed else rating_contribution(self.status, self.rating)
+
+        if old_listing_id is not None and old_listing_id != self.listing_id:
+            # Отзыв перенесен на другой листинг: вклад уходит со старого целиком
+            apply_rating_delta(old_listing_id, -old_count, -old_sum)
+            old_count, old_sum = 0, 0
+        apply_rating_delta(self.listing_id, new_count - old_count, new_sum - old_sum)
 
     def apply_shadow_ban(self):
         self._change_status(ReviewStatusChoices.SHADOW_BANNED)
@@ -85,18 +125,17 @@ class Review(DirtyFieldsMixin, models.Model):
     def _change_status(self, new_status):
         if self.status != new_status:
             self.status = new_status
-            self.status_changed_at = timezone.now()  # Обновляем дату изменения статуса
-            super().save(update_fields=['status', 'status_changed_at'])
+            # save() обновляет дату изменения статуса и агрегаты рейтинга листинга
+            self.save(update_fields=['status', 'status_changed_at'])
+
+    @classmethod
+    def visible_to_user_q(cls, user):
+        """Условие видимости отзывов для пользователя: все видимые и его собственные, кроме удаленных."""
+        return Q(status=ReviewStatusChoices.VISIBLE) | (Q(reviewer=user) & ~Q(status=ReviewStatusChoices.DELETED))
 
     @classmethod
     def can_user_review(cls, user, listing):
         """Проверяет, может ли пользователь оставить отзыв для данного листинга."""
-        has_completed_booking = user.bookings.filter(
-            listing=listing,
-            status=BookingStatusChoices.COMPLETED
-        ).exists()
-        has_reviewed = cls.objects.filter(
-            listing=listing,
-            reviewer=user
-        ).exists()
-        return has_completed_booking and not has_reviewed
+        # Импорт внутри метода: сервис отзывов сам импортирует модель
+        from ..services import get_reviewable_listing_ids
+        return listing.pk in get_reviewable_listing_ids(user, [listing.pk])
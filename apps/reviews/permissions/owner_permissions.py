@@ -1,5 +1,6 @@
 from rest_framework.permissions import BasePermission
 from apps.listings.choices import ListingStatusChoices
+from common.utils.ownership import is_owner
 from ..choices import ReviewStatusChoices
 
 
@@ -8,8 +9,8 @@ class IsReviewerOrAdmin(BasePermission):
         if obj.listing.status != ListingStatusChoices.ACTIVE:
             return False
 
-        # Проверяем, что статус отзыва не 'DELETE'
-        if obj.status == ReviewStatusChoices.DELETE:
+        # Проверяем, что отзыв не удален
+        if obj.status == ReviewStatusChoices.DELETED:
             return False
 
-        return obj.reviewer == request.user or request.user.is_staff
+        return is_owner(request.user, obj, 'reviewer_id') or request.user.is_staff
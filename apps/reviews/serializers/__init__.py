@@ -1,2 +1,2 @@
 from .review_serializers import (ReviewListSerializer, ReviewDetailSerializer, ReviewCreateSerializer,
-                                 ReviewUpdateSerializer, ReviewStatusActionSerializer)
+                                 ReviewUpdateSerializer, ReviewStatusActionSerializer, ReviewEligibilityQuerySerializer)
@@ -5,7 +5,7 @@ from apps.listings.choices import ListingStatusChoices
 
 
 class ReviewListSerializer(serializers.ModelSerializer):
-    reviewer = serializers.ReadOnlyField(source='reviewer.username')
+    reviewer = serializers.ReadOnlyField(source='reviewer_username')
     reviewer_id = serializers.PrimaryKeyRelatedField(read_only=True)
 
     class Meta:
@@ -45,7 +45,7 @@ class ReviewDetailSerializer(serializers.ModelSerializer):
         if request and request.user.is_staff:
             # Добавляем дополнительные поля для администратора
             admin_fields = {
-                'reviewer': instance.reviewer.username,
+                'reviewer': instance.reviewer_username,
                 'status': instance.status,
                 'status_changed_at': instance.status_changed_at,
                 'created_at': instance.created_at,
@@ -58,7 +58,8 @@ class ReviewDetailSerializer(serializers.ModelSerializer):
 
 class ReviewCreateSerializer(serializers.ModelSerializer):
     reviewer_id = serializers.ReadOnlyField(source='reviewer.id')
-    listing_id = serializers.IntegerField(write_only=True)
+    # Листинг берется из URL; поле оставлено для совместимости и должно с ним совпадать
+    listing_id = serializers.IntegerField(write_only=True, required=False)
 
     class Meta:
         model = Review
@@ -72,11 +73,14 @@ class ReviewCreateSerializer(serializers.ModelSerializer):
         user = self.context['request'].user
         listing = self.context['listing']
 
+        if data.pop('listing_id', listing.pk) != listing.pk:
+            raise serializers.ValidationError({'listing_id': 'Does not match the listing in the URL.'})
+
         # Проверка статуса листинга
         if listing.status != ListingStatusChoices.ACTIVE:
             raise serializers.ValidationError('Cannot review a listing that is not active.')
 
-        # Проверка возможности оставить отзыв
+        # Проверка возможности оставить отзыв: один запрос по бронированиям и отзывам
         if not Review.can_user_review(user, listing):
             raise serializers.ValidationError('You can only review a listing if you have completed a booking for it and have not reviewed it yet.')
 
@@ -88,6 +92,15 @@ class ReviewCreateSerializer(serializers.ModelSerializer):
         return Review.objects.create(**validated_data)
 
 
+class ReviewEligibilityQuerySerializer(serializers.Serializer):
+    listing_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        allow_empty=False,
+        max_length=100
+    )
+
+
 class ReviewUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Review
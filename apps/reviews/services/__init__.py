@@ -0,0 +1 @@
+from .eligibility_service import get_reviewable_listing_ids
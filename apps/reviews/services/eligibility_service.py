@@ -0,0 +1,28 @@
+from django.db.models import Exists, OuterRef
+from apps.bookings.choices import BookingStatusChoices
+from apps.bookings.models import Booking
+from apps.listings.choices import ListingStatusChoices
+from ..models import Review
+
+
+def get_reviewable_listing_ids(user, listing_ids=None):
+    """
+    Возвращает множество id листингов, на которые пользователь может оставить отзыв.
+
+    Один запрос: завершенные бронирования пользователя по активным листингам, для которых нет его отзыва.
+    Без listing_ids проверяется вся история бронирований пользователя.
+    """
+    if not user.is_authenticated:
+        return set()
+
+    bookings = Booking.objects.filter(
+        user=user,
+        status=BookingStatusChoices.COMPLETED,
+        listing__status=ListingStatusChoices.ACTIVE,
+    )
+    if listing_ids is not None:
+        bookings = bookings.filter(listing_id__in=listing_ids)
+
+    # NOT EXISTS по уникальному индексу (listing, reviewer) — анти-join без дублей от нескольких бронирований
+    own_review = Review.objects.filter(listing=OuterRef('listing_id'), reviewer=user)
+    return set(bookings.filter(~Exists(own_review)).values_list('listing_id', flat=True).distinct())
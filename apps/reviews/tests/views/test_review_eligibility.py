@@ -0,0 +1,79 @@
+from datetime import timedelta
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.bookings.choices import BookingStatusChoices
+from apps.bookings.models import Booking
+from apps.listings.choices import ListingStatusChoices
+from apps.listings.models import Listing
+from apps.reviews.models import Review
+from apps.users.models import User
+
+
+class TestReviewEligibility(APITestCase):
+    def setUp(self):
+        owner = User.objects.create_user(
+            username='owner', email='owner@example.com', password='password123', is_business_account=True
+        )
+        self.user = User.objects.create_user(username='guest', email='guest@example.com', password='password123')
+        self.listings = [
+            Listing.objects.create(
+                owner=owner, title=f'Eligibility listing {i}', description='Description', location='Berlin',
+                address='Address', price=100, rooms=2, status=ListingStatusChoices.ACTIVE
+            )
+            for i in range(4)
+        ]
+        today = timezone.now().date()
+        for offset, (listing, booking_status) in enumerate((
+            (self.listings[0], BookingStatusChoices.COMPLETED),
+            (self.listings[0], BookingStatusChoices.COMPLETED),
+            (self.listings[1], BookingStatusChoices.COMPLETED),
+            (self.listings[2], BookingStatusChoices.CONFIRMED),
+            (self.listings[3], BookingStatusChoices.COMPLETED),
+        )):
+            start_date = today + timedelta(days=1 + offset * 3)
+            booking = Booking.objects.create(
+                listing=listing, user=self.user, start_date=start_date, end_date=start_date + timedelta(days=2)
+            )
+            Booking.objects.filter(pk=booking.pk).update(status=booking_status)
+
+        # На второй листинг отзыв уже есть, четвертый неактивен
+        Review.objects.create(listing=self.listings[1], reviewer=self.user, rating=4)
+        Listing.objects.filter(pk=self.listings[3].pk).update(status=ListingStatusChoices.DEACTIVATED)
+        self.client.force_authenticate(user=self.user)
+
+    def test_eligible_listing_ids_in_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('review-eligible'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['listing_ids'], [self.listings[0].id])
+
+    def test_eligibility_for_given_listings(self):
+        listing_ids = [self.listings[1].id, self.listings[2].id]
+        response = self.client.get(reverse('review-eligible'), {'listing_ids': listing_ids})
+        self.assertEqual(response.data['listing_ids'], [])
+
+    def test_requires_authentication(self):
+        self.client.force_authenticate(user=None)
+        response = self.client.get(reverse('review-eligible'))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_create_review_for_eligible_listing(self):
+        url = reverse('review-create', kwargs={'listing_id': self.listings[0].id})
+        response = self.client.post(url, {'rating': 5, 'comment': 'Great'})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(Review.objects.filter(listing=self.listings[0], reviewer=self.user).exists())
+
+        # Повторный отзыв на тот же листинг запрещен
+        self.assertEqual(self.client.post(url, {'rating': 4}).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_create_review_rejected_without_completed_booking(self):
+        url = reverse('review-create', kwargs={'listing_id': self.listings[2].id})
+        self.assertEqual(self.client.post(url, {'rating': 5}).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_create_review_with_mismatched_listing_id(self):
+        url = reverse('review-create', kwargs={'listing_id': self.listings[0].id})
+        response = self.client.post(url, {'rating': 5, 'listing_id': self.listings[1].id})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('listing_id', response.data)
@@ -0,0 +1,69 @@
+from io import StringIO
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.listings.choices import ListingStatusChoices
+from apps.listings.models import Listing
+from apps.reviews.choices import ReviewStatusChoices
+from apps.reviews.models import Review
+from apps.users.models import User
+
+
+class TestReviewListView(APITestCase):
+    def setUp(self):
+        owner = User.objects.create_user(
+            username='owner', email='owner@example.com', password='password123', is_business_account=True
+        )
+        self.listing = Listing.objects.create(
+            owner=owner, title='Reviewed listing', description='Description', location='Berlin',
+            address='Address', price=100, rooms=2, status=ListingStatusChoices.ACTIVE
+        )
+        self.user = User.objects.create_user(username='viewer', email='viewer@example.com', password='password123')
+        self.reviews = {}
+        for name, reviewer_status in (('visible', ReviewStatusChoices.VISIBLE),
+                                      ('banned', ReviewStatusChoices.SHADOW_BANNED),
+                                      ('deleted', ReviewStatusChoices.DELETED)):
+            reviewer = User.objects.create_user(username=name, email=f'{name}@example.com', password='password123')
+            self.reviews[name] = Review.objects.create(
+                listing=self.listing, reviewer=reviewer, rating=4, status=reviewer_status
+            )
+        self.url = reverse('review-list', kwargs={'listing_id': self.listing.id})
+
+    def get_ids(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [item['id'] for item in response.data['results']]
+
+    def test_anonymous_sees_only_visible(self):
+        self.assertEqual(self.get_ids(), [self.reviews['visible'].id])
+
+    def test_reviewer_sees_own_hidden_review(self):
+        own = Review.objects.create(
+            listing=self.listing, reviewer=self.user, rating=2, status=ReviewStatusChoices.SHADOW_BANNED
+        )
+        self.client.force_authenticate(user=self.user)
+        self.assertEqual(self.get_ids(), [own.id, self.reviews['visible'].id])
+
+        own.soft_delete()
+        self.assertEqual(self.get_ids(), [self.reviews['visible'].id])
+
+    def test_single_query_with_reviewer_join(self):
+        Review.objects.create(listing=self.listing, reviewer=self.user, rating=2)
+        self.client.force_authenticate(user=self.user)
+        # Листинг, количество и страница с ревьюерами
+        with self.assertNumQueries(3):
+            self.assertEqual(len(self.get_ids()), 2)
+
+    def test_cursor_pagination(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(self.url, {'pagination': 'cursor'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('count', response.data)
+
+    def test_benchmark_command(self):
+        out = StringIO()
+        call_command('benchmark_review_list', reviews=40, listings=2, repeat=1, stdout=out)
+        self.assertIn('union:', out.getvalue())
+        self.assertIn('or:', out.getvalue())
+        self.assertFalse(Review.objects.filter(reviewer__username__startswith='benchmark-').exists())
@@ -3,6 +3,7 @@ from .views.review_views import (
     ReviewListView,
     ReviewDetailView,
     ReviewCreateView,
+    ReviewEligibilityView,
     ReviewUpdateView,
     ReviewApplyShadowBanView,
     ReviewSoftDeleteView,
@@ -19,6 +20,11 @@ urlpatterns = [
         ReviewCreateView.as_view(),
         name='review-create'
     ),
+    path(
+        'eligible/',
+        ReviewEligibilityView.as_view(),
+        name='review-eligible'
+    ),
     path(
         '<int:id>/',
         ReviewDetailView.as_view(),
@@ -1,4 +1,6 @@
 from rest_framework import generics
+from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework.serializers import ValidationError
 from rest_framework.permissions import AllowAny, IsAuthenticated, IsAdminUser
 from django.shortcuts import get_object_or_404
@@ -7,13 +9,22 @@ from apps.listings.models import Listing
 from apps.listings.choices import ListingStatusChoices
 from ..choices import ReviewStatusChoices
 from ..permissions import IsReviewerOrAdmin
+from common.mixins import QuerySetShapingMixin, ConditionalGetMixin
+from common.utils.ownership import is_owner
 from ..serializers import (ReviewListSerializer, ReviewDetailSerializer, ReviewCreateSerializer, ReviewUpdateSerializer,
-                           ReviewStatusActionSerializer)
+                           ReviewStatusActionSerializer, ReviewEligibilityQuerySerializer)
+from ..services import get_reviewable_listing_ids
 
 
-class ReviewListView(generics.ListAPIView):
+class ReviewListView(ConditionalGetMixin, QuerySetShapingMixin, generics.ListAPIView):
     serializer_class = ReviewListSerializer
     permission_classes = [AllowAny]
+    last_modified_fields = ('updated_at', 'status_changed_at')
+    # Имя ревьюера денормализовано: список читается из одной таблицы отзывов
+    only_fields = (
+        'id', 'rating', 'comment', 'status', 'status_changed_at', 'created_at', 'updated_at',
+        'reviewer', 'reviewer_username',
+    )
 
     def get_queryset(self):
         # Получаем listing_id из URL
@@ -27,34 +38,32 @@ class ReviewListView(generics.ListAPIView):
         # Для обычных пользователей проверяем, что листинг существует и имеет статус "активен"
         listing = get_object_or_404(Listing, id=listing_id, status=ListingStatusChoices.ACTIVE)
 
-        # Если пользователь - ревьюер, возвращаем все видимые отзывы и свои отзывы, кроме удаленных
+        # Если пользователь - ревьюер, возвращаем все видимые отзывы и свои отзывы, кроме удаленных.
+        # Одно условие OR вместо UNION: запрос идет по индексу (listing, status, created_at)
+        # и остается обычным queryset для фильтров, select_related и курсорной пагинации
         if self.request.user.is_authenticated:
             return Review.objects.filter(
+                Review.visible_to_user_q(self.request.user),
                 listing=listing
-            ).filter(
-                status=ReviewStatusChoices.VISIBLE
-            ).union(
-                Review.objects.filter(
-                    listing=listing,
-                    reviewer=self.request.user
-                ).exclude(status=ReviewStatusChoices.DELETED)
             ).order_by('-created_at')
 
         # Возвращаем только видимые отзывы для анонимных пользователей
         return Review.objects.filter(listing=listing, status=ReviewStatusChoices.VISIBLE).order_by('-created_at')
 
 
-class ReviewDetailView(generics.RetrieveAPIView):
+class ReviewDetailView(ConditionalGetMixin, generics.RetrieveAPIView):
     serializer_class = ReviewDetailSerializer
     permission_classes = [AllowAny]
     lookup_field = 'id'
+    last_modified_fields = ('updated_at', 'status_changed_at')
 
     def get_object(self):
         # Получаем review_id из URL
         review_id = self.kwargs.get('id')
 
         # Получаем отзыв
-        review = get_object_or_404(Review, id=review_id)
+        # Статус листинга проверяется ниже: загружаем его тем же запросом
+        review = get_object_or_404(Review.objects.select_related('listing'), id=review_id)
 
         # Если пользователь - администратор, возвращаем отзыв независимо от статуса
         if self.request.user.is_staff:
@@ -62,7 +71,7 @@ class ReviewDetailView(generics.RetrieveAPIView):
 
         # Если пользователь - ревьюер, возвращаем отзыв, если листинг активен и отзыв не удален
         if (
-            self.request.user == review.reviewer and
+            is_owner(self.request.user, review, 'reviewer_id') and
             review.listing.status == ListingStatusChoices.ACTIVE and
             review.status != ReviewStatusChoices.DELETED
         ):
@@ -86,14 +95,31 @@ class ReviewCreateView(generics.CreateAPIView):
         except Listing.DoesNotExist:
             raise ValidationError('Listing not found.')
 
+    def get_serializer_context(self):
+        # Листинг читается один раз и используется и валидацией, и созданием
+        context = super().get_serializer_context()
+        context['listing'] = self.get_listing()
+        return context
+
     def perform_create(self, serializer):
-        listing = self.get_listing()
-        serializer.save(reviewer=self.request.user, listing=listing)
+        serializer.save()
+
+
+class ReviewEligibilityView(APIView):
+    # Id листингов, на которые текущий пользователь может оставить отзыв, одним запросом
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        serializer = ReviewEligibilityQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        listing_ids = get_reviewable_listing_ids(request.user, serializer.validated_data.get('listing_ids'))
+        return Response({'listing_ids': sorted(listing_ids)})
 
 
 class ReviewUpdateView(generics.UpdateAPIView):
     serializer_class = ReviewUpdateSerializer
-    queryset = Review.objects.all()
+    # Пермишен проверяет статус листинга: загружаем его тем же запросом
+    queryset = Review.objects.select_related('listing')
     permission_classes = [IsAuthenticated, IsReviewerOrAdmin]
     lookup_field = 'id'
 
@@ -110,7 +136,7 @@ class BaseReviewStatusUpdateView(generics.UpdateAPIView):
     action = None
 
     def get_queryset(self):
-        return Review.objects.all()
+        return Review.objects.select_related('listing')
 
     def perform_update(self, serializer):
         review = self.get_object()
@@ -1,29 +1,45 @@
+from django.db import transaction
+from django.utils import timezone
+from ..authentication import REVOKING_STATUSES, revoke_user_tokens
 from ..choices import UserStatusChoices
+from ..services import invalidate_cached_users
+
+
+def _update_status(queryset, status):
+    # Фиксируем выбранные id заранее: фильтры changelist могут зависеть от статуса
+    user_ids = list(queryset.values_list('pk', flat=True))
+    now = timezone.now()
+    queryset.model.objects.filter(pk__in=user_ids).update(status=status, status_changed_at=now)
+
+    # Массовое обновление минует save(), поэтому кеш пользователей сбрасываем и токены отзываем явно
+    invalidate_cached_users(user_ids)
+    if status in REVOKING_STATUSES:
+        transaction.on_commit(lambda: revoke_user_tokens(user_ids, now))
 
 
 def make_active(modeladmin, request, queryset):
-    queryset.update(status=UserStatusChoices.ACTIVE)
+    _update_status(queryset, UserStatusChoices.ACTIVE)
 
 
 make_active.short_description = 'Mark selected users as Active'
 
 
 def make_pending(modeladmin, request, queryset):
-    queryset.update(status=UserStatusChoices.PENDING)
+    _update_status(queryset, UserStatusChoices.PENDING)
 
 
 make_pending.short_description = 'Mark selected users as Pending'
 
 
 def make_deactivated(modeladmin, request, queryset):
-    queryset.update(status=UserStatusChoices.DEACTIVATED)
+    _update_status(queryset, UserStatusChoices.DEACTIVATED)
 
 
 make_deactivated.short_description = 'Mark selected users as Deactivated'
 
 
 def make_deleted(modeladmin, request, queryset):
-    queryset.update(status=UserStatusChoices.DELETED)
+    _update_status(queryset, UserStatusChoices.DELETED)
 
 
 make_deleted.short_description = 'Mark selected users as Deleted (Soft Delete)'
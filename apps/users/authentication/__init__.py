@@ -0,0 +1,4 @@
+from .tokens import (USER_CLAIMS, STATUS_CHANGED_CLAIM, REVOKING_STATUSES, set_user_claims, UserClaimsRefreshToken,
+                     revoke_user_tokens, is_token_revoked, has_user_claims)
+from .token_user import TokenUser
+from .jwt_authentication import ClaimsJWTAuthentication
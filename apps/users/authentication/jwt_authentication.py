@@ -0,0 +1,41 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from .token_user import TokenUser
+from .tokens import has_user_claims, is_token_revoked
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    JWT-аутентификация без SELECT пользователя на каждый запрос.
+
+    Пользователь строится из claims токена; отозванные токены отклоняются по записи в кеше.
+    Токены, выпущенные до появления claims, получают пользователя из кеша процесса (LRU с TTL),
+    который сверяет версию пользователя в общем кеше вместо SELECT.
+    """
+
+    def get_user(self, validated_token):
+        if is_token_revoked(validated_token):
+            raise AuthenticationFailed('Token has been revoked.', code='token_revoked')
+
+        if not has_user_claims(validated_token):
+            return self.get_cached_user(validated_token)
+
+        return TokenUser(validated_token.payload)
+
+    def get_cached_user(self, validated_token):
+        # Повторяет проверки JWTAuthentication.get_user, но читает пользователя через кеш
+        from ..services import get_cached_user
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+
+        user = get_cached_user(user_id)
+        if user is None:
+            raise AuthenticationFailed(_('User not found'), code='user_not_found')
+        if not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+        return user
@@ -0,0 +1,83 @@
+from django.db import router
+from django.db.models import Model
+from django.db.models.base import ModelState
+from django.utils.functional import SimpleLazyObject
+from rest_framework_simplejwt.settings import api_settings
+from ..models import User
+
+
+class TokenUser(SimpleLazyObject):
+    """
+    Пользователь запроса, собранный из claims access-токена.
+
+    id и status читаются из токена. Для ORM объект выглядит как экземпляр User (фильтры, сравнение,
+    присваивание FK без запроса: у объекта свой _state), а строка из базы загружается только
+    при обращении к остальным атрибутам, через кеш пользователей процесса.
+
+    Флаги прав (is_staff, is_business_account) и username в токен не попадают: они меняются без
+    перевыпуска токенов, поэтому всегда читаются из кеша пользователей, который сбрасывается при сохранении.
+    """
+
+    _meta = User._meta
+    is_authenticated = True
+    is_anonymous = False
+    is_active = True
+
+    def __init__(self, claims):
+        super().__init__(self._load_user)
+        self.__dict__['_claims'] = claims
+        # ORM читает _state при присваивании FK; без него объект загрузил бы пользователя из базы
+        state = ModelState()
+        state.db = router.db_for_read(User)
+        state.adding = False
+        self.__dict__['_state'] = state
+
+    def _load_user(self):
+        # Импорт внутри метода: сервисы пользователей зависят от моделей других приложений
+        from ..services import get_cached_user
+        user = get_cached_user(self.pk)
+        if user is None:
+            raise User.DoesNotExist('User from the token no longer exists.')
+        return user
+
+    @property
+    def __class__(self):
+        return User
+
+    @property
+    def pk(self):
+        return self._claims[api_settings.USER_ID_CLAIM]
+
+    id = pk
+
+    @property
+    def status(self):
+        return self._claims['status']
+
+    def __getattr__(self, name):
+        # hasattr() со стороны ORM и DRF не должен загружать пользователя ради атрибутов, которых у User нет
+        if not name.startswith('_') and not hasattr(User, name):
+            raise AttributeError(name)
+        return super().__getattr__(name)
+
+    def __bool__(self):
+        return True
+
+    def __eq__(self, other):
+        if isinstance(other, Model):
+            return other._meta.concrete_model is User and other.pk == self.pk
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.pk)
+
+    def __str__(self):
+        return self.username
+
+    def __copy__(self):
+        return type(self)(self._claims)
+
+    def __deepcopy__(self, memo):
+        result = type(self)(self._claims)
+        memo[id(self)] = result
+        return result
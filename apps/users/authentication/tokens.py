@@ -0,0 +1,51 @@
+from django.core.cache import cache
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from ..choices import UserStatusChoices
+
+# Поля пользователя, которые переносятся в токен и читаются без запроса к базе. Только status: его смена
+# на отзывающий статус отзывает токены. Права и username меняются без перевыпуска токенов и в claims не входят
+USER_CLAIMS = ('status',)
+STATUS_CHANGED_CLAIM = 'status_changed_at'
+# Смена статуса на один из этих отзывает все ранее выданные токены пользователя
+REVOKING_STATUSES = (UserStatusChoices.DEACTIVATED, UserStatusChoices.DELETED)
+
+
+def set_user_claims(token, user):
+    for claim in USER_CLAIMS:
+        token[claim] = getattr(user, claim)
+    token[STATUS_CHANGED_CLAIM] = user.status_changed_at.timestamp() if user.status_changed_at else 0
+    return token
+
+
+class UserClaimsRefreshToken(RefreshToken):
+    """Refresh-токен с данными пользователя; access-токен копирует их при выпуске."""
+
+    @classmethod
+    def for_user(cls, user):
+        return set_user_claims(super().for_user(user), user)
+
+
+def _revoked_key(user_id):
+    return f'user-tokens-revoked:{user_id}'
+
+
+def revoke_user_tokens(user_ids, status_changed_at):
+    """
+    Отзывает токены, выданные до смены статуса.
+
+    В кеше хранится момент смены статуса; токены несут его значение на момент выпуска, поэтому токены,
+    полученные после смены (например, для повторной активации), остаются действительными.
+    Запись живет столько же, сколько refresh-токен, после этого старые токены истекают сами.
+    """
+    timeout = int(api_settings.REFRESH_TOKEN_LIFETIME.total_seconds())
+    cache.set_many({_revoked_key(user_id): status_changed_at.timestamp() for user_id in user_ids}, timeout)
+
+
+def is_token_revoked(token):
+    revoked_at = cache.get(_revoked_key(token[api_settings.USER_ID_CLAIM]))
+    return revoked_at is not None and token.get(STATUS_CHANGED_CLAIM, 0) < revoked_at
+
+
+def has_user_claims(token):
+    return all(claim in token for claim in USER_CLAIMS)
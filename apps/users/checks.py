@@ -0,0 +1,18 @@
+from django.conf import settings
+from django.core.checks import Warning
+
+LOCMEM_BACKEND = 'django.core.cache.backends.locmem.LocMemCache'
+
+
+def check_token_revocation_cache(app_configs, **kwargs):
+    """
+    Отзыв токенов хранит метку в CACHES['default']. Локальный кеш виден только своему процессу,
+    поэтому при нескольких воркерах отозванные токены продолжают действовать в остальных.
+    """
+    if settings.CACHES['default']['BACKEND'] != LOCMEM_BACKEND:
+        return []
+    return [Warning(
+        'Token revocation uses a local-memory cache.',
+        hint='Set CACHE_URL to a shared cache (Redis, Memcached) so revoked tokens are rejected by every process.',
+        id='users.W001',
+    )]
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+from apps.users.services import rebuild_username_columns
+
+
+class Command(BaseCommand):
+    help = 'Fills the denormalized owner/user/reviewer username columns from the users table.'
+
+    def handle(self, *args, **options):
+        updated = rebuild_username_columns()
+        summary = ', '.join(f'{count} {name}' for name, count in updated.items())
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt username columns: {summary}.'))
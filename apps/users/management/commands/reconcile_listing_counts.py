@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from apps.users.services import recalculate_listing_counts
+
+
+class Command(BaseCommand):
+    help = 'Recalculates the listing counters of users from the listings table and fixes drifted users.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            type=int,
+            action='append',
+            dest='user_ids',
+            help='Reconcile only the given user id (can be repeated).'
+        )
+
+    def handle(self, *args, **options):
+        fixed = recalculate_listing_counts(options['user_ids'])
+        self.stdout.write(self.style.SUCCESS(f'Reconciled listing counts: {fixed} users fixed.'))
@@ -1,6 +1,7 @@
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
-from django.db import models
+from django.db import models, transaction
 from django.core.validators import MinLengthValidator
+from common.mixins import ChangedFieldsSaveMixin
 from ..choices import UserStatusChoices
 from ..validators import validate_alphanumeric
 
@@ -29,7 +30,7 @@ class UserManager(BaseUserManager):
         return self.create_user(email, username, password, **extra_fields)
 
 
-class User(AbstractBaseUser, PermissionsMixin):
+class User(ChangedFieldsSaveMixin, AbstractBaseUser, PermissionsMixin):
     username = models.CharField(
         max_length=50,
         unique=True,
@@ -48,6 +49,8 @@ class User(AbstractBaseUser, PermissionsMixin):
     )
     status_changed_at = models.DateTimeField(auto_now=True)
     is_staff = models.BooleanField(default=False)
+    # Количество листингов пользователя; поддерживается из Listing.save/delete, сверяется reconcile_listing_counts
+    listing_count = models.PositiveIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     last_login = models.DateTimeField(null=True, blank=True)
 
@@ -68,6 +71,51 @@ class User(AbstractBaseUser, PermissionsMixin):
     def __str__(self):
         return self.username
 
+    @property
+    def is_host(self):
+        return self.listing_count > 0
+
+    def save(self, *args, **kwargs):
+        dirty_fields = {} if self._state.adding else self.get_dirty_fields()
+        # Поле, не попавшее в update_fields, в базу не пишется: переносить его в другие таблицы нельзя
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            dirty_fields = {field: value for field, value in dirty_fields.items() if field in update_fields}
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            # Новый пользователь тоже повышает версию: id может достаться ему от удаленной строки
+            self._invalidate_cache(self.pk)
+            if 'username' in dirty_fields:
+                self._sync_username()
+            if 'status' in dirty_fields:
+                self._revoke_tokens()
+
+    def delete(self, *args, **kwargs):
+        user_id = self.pk
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            self._invalidate_cache(user_id)
+        return result
+
+    @staticmethod
+    def _invalidate_cache(user_id):
+        # Импорт внутри метода: сервисы пользователей импортируют модель
+        from ..services import invalidate_cached_users
+        invalidate_cached_users([user_id])
+
+    def _sync_username(self):
+        # Импорт внутри метода: сервис зависит от моделей других приложений, а они — от пользователя
+        from ..services import sync_username
+        sync_username(self.pk, self.username)
+
+    def _revoke_tokens(self):
+        from ..authentication import REVOKING_STATUSES, revoke_user_tokens
+        if self.status in REVOKING_STATUSES:
+            # Кеш не участвует в транзакции: отзываем только после коммита смены статуса
+            user_ids, status_changed_at = [self.pk], self.status_changed_at
+            transaction.on_commit(lambda: revoke_user_tokens(user_ids, status_changed_at))
+
     class Meta:
         verbose_name = "User"
         verbose_name_plural = "Users"
@@ -1,3 +1,4 @@
 from .user_serializers import (CreateUserSerializer, UpdateUserSerializer, UserDetailSerializer,
                                ChangePasswordSerializer, UserListSerializer, ActivateUserSerializer,
                                DeactivateUserSerializer, DeleteUserSerializer)
+from .token_serializers import UserTokenObtainPairSerializer, UserTokenRefreshSerializer
@@ -0,0 +1,51 @@
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from ..authentication import (UserClaimsRefreshToken, STATUS_CHANGED_CLAIM, REVOKING_STATUSES, set_user_claims,
+                              is_token_revoked)
+from ..models import User
+
+
+class UserTokenObtainPairSerializer(TokenObtainPairSerializer):
+    token_class = UserClaimsRefreshToken
+
+
+class UserTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Обновление токенов с перечитыванием пользователя: новый access-токен получает актуальные claims.
+
+    Это единственное место, где токен сверяется с базой, поэтому отзыв проверяется и по статусу в ней,
+    на случай если запись в кеше уже вытеснена.
+    """
+
+    token_class = UserClaimsRefreshToken
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs['refresh'])
+        user = User.objects.filter(pk=refresh[api_settings.USER_ID_CLAIM]).first()
+        if user is None or is_token_revoked(refresh) or self.is_revoked_by_status(refresh, user):
+            raise AuthenticationFailed('Token has been revoked.', code='token_revoked')
+
+        set_user_claims(refresh, user)
+        data = {'access': str(refresh.access_token)}
+
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION:
+                try:
+                    refresh.blacklist()
+                except AttributeError:
+                    # Приложение token_blacklist не установлено
+                    pass
+
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            data['refresh'] = str(refresh)
+
+        return data
+
+    @staticmethod
+    def is_revoked_by_status(refresh, user):
+        if user.status not in REVOKING_STATUSES or user.status_changed_at is None:
+            return False
+        return refresh.get(STATUS_CHANGED_CLAIM, 0) < user.status_changed_at.timestamp()
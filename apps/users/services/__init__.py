@@ -0,0 +1,3 @@
+from .username_service import sync_username, rebuild_username_columns
+from .user_cache_service import get_user_cache, reset_user_cache, invalidate_cached_users, get_cached_user
+from .host_service import apply_listing_count_delta, recalculate_listing_counts
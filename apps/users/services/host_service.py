@@ -0,0 +1,43 @@
+from django.db.models import Count, F
+from django.db.models.functions import Greatest
+from apps.listings.models import Listing
+from ..models import User
+from .user_cache_service import invalidate_cached_users
+
+
+def apply_listing_count_delta(user_id, delta):
+    """Атомарно сдвигает счетчик листингов пользователя без чтения строки."""
+    if not delta:
+        return
+    # Счетчик беззнаковый: после расхождения уменьшение ниже нуля упало бы на MySQL, поэтому значение
+    # ограничивается нулем, а точное значение восстанавливает recalculate_listing_counts
+    User.objects.filter(pk=user_id).update(listing_count=Greatest(F('listing_count') + delta, 0))
+    # Флаг хоста читается из кеша пользователей процесса
+    invalidate_cached_users([user_id])
+
+
+def recalculate_listing_counts(user_ids=None):
+    """
+    Пересчитывает счетчики листингов по таблице листингов и исправляет разошедшихся пользователей.
+
+    Возвращает количество исправленных пользователей.
+    """
+    users = User.objects.only('id', 'listing_count')
+    listings = Listing.objects.all()
+    if user_ids is not None:
+        users = users.filter(pk__in=user_ids)
+        listings = listings.filter(owner_id__in=user_ids)
+
+    counts = dict(listings.values('owner').annotate(count=Count('id')).values_list('owner', 'count').order_by())
+
+    changed = []
+    for user in users.iterator():
+        listing_count = counts.get(user.pk, 0)
+        if user.listing_count != listing_count:
+            user.listing_count = listing_count
+            changed.append(user)
+
+    User.objects.bulk_update(changed, ['listing_count'], batch_size=500)
+    if changed:
+        invalidate_cached_users(user.pk for user in changed)
+    return len(changed)
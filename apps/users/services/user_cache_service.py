@@ -0,0 +1,52 @@
+from django.conf import settings
+from common.utils.cache_versions import get_cache_version, invalidate_cache_versions
+from common.utils.lru_cache import LRUCache
+from ..models import User
+
+_user_cache = None
+
+
+def get_user_cache():
+    global _user_cache
+
+    if _user_cache is None:
+        _user_cache = LRUCache(maxsize=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL)
+    return _user_cache
+
+
+def reset_user_cache():
+    global _user_cache
+    _user_cache = None
+
+
+def _user_version_key(user_id):
+    return f'user-version:{user_id}'
+
+
+def invalidate_cached_users(user_ids):
+    """Повышает версии пользователей в общем кеше, чтобы все процессы перечитали их из базы."""
+    user_ids = list(user_ids)
+    invalidate_cache_versions(_user_version_key(user_id) for user_id in user_ids)
+    for user_id in user_ids:
+        get_user_cache().pop(user_id)
+
+
+def get_cached_user(user_id):
+    """
+    Возвращает пользователя из кеша процесса, если его версия не менялась, иначе читает из базы.
+
+    В кеше хранятся значения колонок, а не экземпляр: каждый вызов получает свой объект,
+    и изменения в одном запросе не попадают в другие. Возвращает None, если пользователя нет.
+    """
+    # Версию читаем до базы: изменение между ними оставит в кеше запись со старой версией
+    version = get_cache_version(_user_version_key(user_id))
+    field_names = [field.attname for field in User._meta.concrete_fields]
+
+    entry = get_user_cache().get(user_id)
+    if entry is not None and entry[0] == version:
+        return User.from_db(User.objects.db, field_names, entry[1])
+
+    user = User.objects.filter(pk=user_id).first()
+    if user is not None:
+        get_user_cache().set(user_id, (version, [getattr(user, name) for name in field_names]))
+    return user
@@ -0,0 +1,36 @@
+from django.db.models import OuterRef, Subquery
+from django.utils import timezone
+from apps.bookings.models import Booking
+from apps.listings.models import Listing
+from apps.listings.services import invalidate_listing_cache, index_listings
+from apps.reviews.models import Review
+from ..models import User
+
+
+def sync_username(user_id, username):
+    """Переносит новое имя пользователя в денормализованные колонки листингов, бронирований и отзывов."""
+    # update() не трогает auto_now, а по updated_at строятся ETag списков
+    now = timezone.now()
+    listings = Listing.objects.filter(owner_id=user_id)
+    listing_ids = list(listings.values_list('pk', flat=True))
+    listings.update(owner_username=username, updated_at=now)
+    Booking.objects.filter(user_id=user_id).update(user_username=username, updated_at=now)
+    Review.objects.filter(reviewer_id=user_id).update(reviewer_username=username, updated_at=now)
+
+    # Имя владельца входит в кешированное представление листинга и в выдачу поиска
+    if listing_ids:
+        invalidate_listing_cache(listing_ids)
+        index_listings(Listing.objects.filter(pk__in=listing_ids))
+
+
+def rebuild_username_columns():
+    """Заполняет денормализованные колонки из таблицы пользователей; возвращает число обновленных строк по моделям."""
+    return {
+        'listings': Listing.objects.update(owner_username=_username_of('owner_id')),
+        'bookings': Booking.objects.update(user_username=_username_of('user_id')),
+        'reviews': Review.objects.update(reviewer_username=_username_of('reviewer_id')),
+    }
+
+
+def _username_of(field):
+    return Subquery(User.objects.filter(pk=OuterRef(field)).values('username')[:1])
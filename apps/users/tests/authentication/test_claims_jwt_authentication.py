@@ -0,0 +1,144 @@
+from datetime import date, timedelta
+from django.contrib.admin.sites import AdminSite
+from django.core.cache import cache
+from django.test import RequestFactory, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+from apps.bookings.models import Booking
+from apps.users.actions import make_deleted
+from apps.listings.choices import PropertyTypeChoices
+from apps.listings.models import Listing
+from apps.users.admin import UserAdmin
+from apps.users.authentication import TokenUser
+from apps.users.checks import check_token_revocation_cache
+from apps.users.choices import UserStatusChoices
+from apps.users.models import User
+
+
+class TestClaimsJWTAuthentication(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='claims', email='claims@example.com', password='password123', status=UserStatusChoices.ACTIVE
+        )
+
+    def obtain(self, email='claims@example.com', password='password123'):
+        response = self.client.post(reverse('token_obtain_pair'), {'email': email, 'password': password})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def authenticate(self, access):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access}')
+
+    def test_tokens_carry_user_claims(self):
+        token = AccessToken(self.obtain()['access'])
+        self.assertEqual(token['status'], UserStatusChoices.ACTIVE)
+        # Права и username меняются без перевыпуска токенов, поэтому в claims не входят
+        for claim in ('username', 'is_staff', 'is_business_account'):
+            self.assertNotIn(claim, token)
+
+        response = self.client.post(reverse('user-register'), {
+            'username': 'registered', 'email': 'registered@example.com',
+            'password': 'Str0ngPassw0rd!', 'confirm_password': 'Str0ngPassw0rd!'
+        })
+        self.assertEqual(AccessToken(response.data['access'])['status'], UserStatusChoices.PENDING)
+
+    def test_request_does_not_load_user(self):
+        self.authenticate(self.obtain()['access'])
+        # Только выборка бронирований для фильтра по пользователю
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('review-eligible'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_token_user_loads_row_on_demand(self):
+        token_user = TokenUser(AccessToken(self.obtain()['access']).payload)
+        with self.assertNumQueries(0):
+            self.assertEqual(token_user, self.user)
+            self.assertEqual(self.user, token_user)
+            self.assertIsInstance(token_user, User)
+            self.assertFalse(hasattr(token_user, 'resolve_expression'))
+        # Фильтр по пользователю строится из id в токене
+        with self.assertNumQueries(1):
+            self.assertFalse(Booking.objects.filter(user=token_user).exists())
+        with self.assertNumQueries(1):
+            self.assertEqual(token_user.email, 'claims@example.com')
+
+    def test_fk_assignment_does_not_load_user(self):
+        owner = User.objects.create_user(username='owner', email='owner@example.com', password='password123')
+        listing = Listing.objects.create(
+            owner=owner, title='Flat', description='Flat', location='Berlin', address='Address 1',
+            property_type=PropertyTypeChoices.APARTMENT, price=100, rooms=1
+        )
+        token_user = TokenUser(AccessToken(self.obtain()['access']).payload)
+        booking = Booking(listing=listing, start_date=date.today() + timedelta(days=1),
+                          end_date=date.today() + timedelta(days=2))
+        with self.assertNumQueries(0):
+            booking.user = token_user
+        self.assertEqual(booking.user_id, self.user.id)
+
+    def test_business_upgrade_applies_to_issued_tokens(self):
+        self.authenticate(self.obtain()['access'])
+        response = self.client.patch(
+            reverse('user-update', args=[self.user.id]), {'is_business_account': True}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # Токен выдан до смены флага, но права читаются из пользователя, а не из claims
+        response = self.client.post(reverse('listing-create'), {
+            'title': 'Test Listing', 'description': 'Description of the listing', 'location': 'Berlin',
+            'address': 'Address 1', 'property_type': PropertyTypeChoices.APARTMENT, 'price': 500000, 'rooms': 3
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_local_memory_cache_warning(self):
+        with override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}):
+            self.assertEqual([message.id for message in check_token_revocation_cache(None)], ['users.W001'])
+        with override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}):
+            self.assertEqual(check_token_revocation_cache(None), [])
+
+    def test_deactivation_revokes_issued_tokens(self):
+        tokens = self.obtain()
+        self.authenticate(tokens['access'])
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.put(reverse('user-deactivate', args=[self.user.id]), {}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(reverse('user-detail', args=[self.user.id]))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        response = self.client.post(reverse('token_refresh'), {'refresh': tokens['refresh']})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        # Новый вход после деактивации выдает действующий токен, например для повторной активации
+        self.authenticate(self.obtain()['access'])
+        response = self.client.get(reverse('user-detail', args=[self.user.id]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_refresh_checks_database_when_cache_is_lost(self):
+        refresh = self.obtain()['refresh']
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.status = UserStatusChoices.DELETED
+            self.user.save()
+        cache.clear()
+
+        response = self.client.post(reverse('token_refresh'), {'refresh': refresh})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_refresh_reloads_claims(self):
+        refresh = self.obtain()['refresh']
+        self.user.status = UserStatusChoices.PENDING
+        self.user.save()
+
+        response = self.client.post(reverse('token_refresh'), {'refresh': refresh})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(AccessToken(response.data['access'])['status'], UserStatusChoices.PENDING)
+
+    def test_admin_action_revokes_tokens(self):
+        self.authenticate(self.obtain()['access'])
+        admin = UserAdmin(User, AdminSite())
+        with self.captureOnCommitCallbacks(execute=True):
+            make_deleted(admin, RequestFactory().post('/'), User.objects.filter(pk=self.user.pk))
+
+        response = self.client.get(reverse('user-detail', args=[self.user.id]))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,132 @@
+from datetime import timedelta
+from django.contrib.admin.sites import AdminSite
+from django.core.cache import cache
+from django.test import RequestFactory
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.bookings.models import Booking
+from apps.listings.admin import ListingAdmin
+from apps.listings.choices import ListingStatusChoices
+from apps.listings.models import Listing
+from apps.users.authentication import UserClaimsRefreshToken
+from apps.users.choices import UserStatusChoices
+from apps.users.models import User
+from apps.users.services import apply_listing_count_delta, get_cached_user, recalculate_listing_counts, reset_user_cache
+
+
+class TestListingCount(APITestCase):
+    def setUp(self):
+        cache.clear()
+        reset_user_cache()
+        self.host = User.objects.create_user(
+            username='host', email='host@example.com', password='password123', is_business_account=True,
+            status=UserStatusChoices.ACTIVE
+        )
+        self.guest = User.objects.create_user(
+            username='guest', email='guest@example.com', password='password123', status=UserStatusChoices.ACTIVE
+        )
+
+    def create_listing(self, owner, **kwargs):
+        return Listing.objects.create(
+            owner=owner, title='Host Listing', description='Description', location='Berlin', address='Address',
+            price=100, rooms=2, status=ListingStatusChoices.ACTIVE, **kwargs
+        )
+
+    def listing_count(self, user):
+        return User.objects.values_list('listing_count', flat=True).get(pk=user.pk)
+
+    def test_create_and_delete_update_counter(self):
+        self.assertFalse(self.host.is_host)
+        first = self.create_listing(self.host)
+        self.create_listing(self.host)
+        self.assertEqual(self.listing_count(self.host), 2)
+        # Загруженный владелец видит то же значение без перечитывания
+        self.assertEqual(self.host.listing_count, 2)
+
+        first.delete()
+        self.assertEqual(self.listing_count(self.host), 1)
+        self.assertTrue(get_cached_user(self.host.pk).is_host)
+
+    def test_soft_delete_keeps_counter(self):
+        listing = self.create_listing(self.host)
+        listing.soft_delete()
+        self.assertEqual(self.listing_count(self.host), 1)
+
+    def test_owner_change_moves_counter(self):
+        listing = self.create_listing(self.host)
+        listing.owner = self.guest
+        listing.save()
+
+        self.assertEqual(self.listing_count(self.host), 0)
+        self.assertEqual(self.listing_count(self.guest), 1)
+
+    def test_counter_change_invalidates_cached_user(self):
+        self.assertFalse(get_cached_user(self.host.pk).is_host)
+        self.create_listing(self.host)
+        self.assertTrue(get_cached_user(self.host.pk).is_host)
+
+    def test_admin_bulk_delete_recalculates(self):
+        self.create_listing(self.host)
+        self.create_listing(self.host)
+        ListingAdmin(Listing, AdminSite()).delete_queryset(RequestFactory().post('/'), Listing.objects.all())
+        self.assertEqual(self.listing_count(self.host), 0)
+
+    def test_delta_does_not_go_below_zero(self):
+        listing = self.create_listing(self.host)
+        # Расхождение счетчика: уменьшение не должно опускать беззнаковое значение ниже нуля
+        User.objects.filter(pk=self.host.pk).update(listing_count=0)
+        listing.delete()
+        self.assertEqual(self.listing_count(self.host), 0)
+
+        apply_listing_count_delta(self.host.pk, -3)
+        self.assertEqual(self.listing_count(self.host), 0)
+
+    def test_recalculate_fixes_drift(self):
+        self.create_listing(self.host)
+        User.objects.filter(pk__in=[self.host.pk, self.guest.pk]).update(listing_count=5)
+
+        self.assertEqual(recalculate_listing_counts(), 2)
+        self.assertEqual(self.listing_count(self.host), 1)
+        self.assertEqual(self.listing_count(self.guest), 0)
+        self.assertEqual(recalculate_listing_counts(), 0)
+
+
+class TestOwnerPermissionQueries(APITestCase):
+    def setUp(self):
+        cache.clear()
+        reset_user_cache()
+        self.host = User.objects.create_user(
+            username='host', email='host@example.com', password='password123', is_business_account=True,
+            status=UserStatusChoices.ACTIVE
+        )
+        self.guest = User.objects.create_user(
+            username='guest', email='guest@example.com', password='password123', status=UserStatusChoices.ACTIVE
+        )
+        listing = Listing.objects.create(
+            owner=self.host, title='Host Listing', description='Description', location='Berlin', address='Address',
+            price=100, rooms=2, status=ListingStatusChoices.ACTIVE
+        )
+        today = timezone.now().date()
+        Booking.objects.create(
+            listing=listing, user=self.guest, start_date=today + timedelta(days=1), end_date=today + timedelta(days=3)
+        )
+
+    def authenticate(self, user):
+        token = UserClaimsRefreshToken.for_user(user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def test_host_check_is_served_from_user_cache(self):
+        self.authenticate(self.host)
+        url = reverse('owner-listing-bookings-list')
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+
+        # Повторный запрос не читает ни пользователя, ни листинги ради проверки прав
+        with self.assertNumQueries(2):
+            self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+
+    def test_guest_is_not_host(self):
+        self.authenticate(self.guest)
+        response = self.client.get(reverse('owner-listing-bookings-list'))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
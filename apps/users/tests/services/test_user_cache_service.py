@@ -0,0 +1,75 @@
+from django.contrib.admin.sites import AdminSite
+from django.core.cache import cache
+from django.test import RequestFactory
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+from apps.users.actions import make_deactivated
+from apps.users.admin import UserAdmin
+from apps.users.choices import UserStatusChoices
+from apps.users.models import User
+from apps.users.services import get_cached_user, reset_user_cache
+
+
+class TestUserCache(APITestCase):
+    def setUp(self):
+        cache.clear()
+        reset_user_cache()
+        self.user = User.objects.create_user(
+            username='cached', email='cached@example.com', password='password123', status=UserStatusChoices.ACTIVE
+        )
+
+    def test_second_lookup_skips_database(self):
+        with self.assertNumQueries(1):
+            get_cached_user(self.user.pk)
+        with self.assertNumQueries(0):
+            user = get_cached_user(self.user.pk)
+        self.assertEqual(user.email, 'cached@example.com')
+        self.assertEqual(user.get_dirty_fields(), {})
+
+    def test_instances_are_not_shared(self):
+        get_cached_user(self.user.pk)
+        first = get_cached_user(self.user.pk)
+        first.username = 'changedlocally'
+        self.assertEqual(get_cached_user(self.user.pk).username, 'cached')
+
+    def test_save_invalidates(self):
+        get_cached_user(self.user.pk)
+        self.user.is_business_account = True
+        self.user.save()
+
+        with self.assertNumQueries(1):
+            self.assertTrue(get_cached_user(self.user.pk).is_business_account)
+
+    def test_admin_status_action_invalidates(self):
+        get_cached_user(self.user.pk)
+        make_deactivated(UserAdmin(User, AdminSite()), RequestFactory().post('/'), User.objects.filter(pk=self.user.pk))
+        self.assertEqual(get_cached_user(self.user.pk).status, UserStatusChoices.DEACTIVATED)
+
+    def test_missing_user(self):
+        self.assertIsNone(get_cached_user(self.user.pk + 1000))
+
+    def test_token_without_claims_uses_cache(self):
+        # Токен старого формата, без данных пользователя
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}')
+        url = reverse('user-detail', args=[self.user.pk])
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+
+        with self.assertNumQueries(1):
+            # Загружается только просматриваемый профиль, пользователь запроса берется из кеша
+            self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+
+    def test_change_password_invalidates(self):
+        credentials = {'email': 'cached@example.com', 'password': 'password123'}
+        response = self.client.post(reverse('token_obtain_pair'), credentials)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+        get_cached_user(self.user.pk)
+
+        response = self.client.put(reverse('user-change-password', args=[self.user.pk]), {
+            'current_password': 'password123',
+            'new_password': 'N3wStr0ngPass!',
+            'confirm_new_password': 'N3wStr0ngPass!',
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(get_cached_user(self.user.pk).check_password('N3wStr0ngPass!'))
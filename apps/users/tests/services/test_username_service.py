@@ -0,0 +1,88 @@
+from datetime import timedelta
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from apps.bookings.models import Booking
+from apps.listings.choices import ListingStatusChoices
+from apps.listings.models import Listing
+from apps.reviews.models import Review
+from apps.users.models import User
+from apps.users.serializers import UpdateUserSerializer
+
+
+class TestUsernameColumns(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(
+            username='owner', email='owner@example.com', password='password123', is_business_account=True
+        )
+        self.guest = User.objects.create_user(username='guest', email='guest@example.com', password='password123')
+        self.listing = Listing.objects.create(
+            owner=self.owner, title='Denormalized listing', description='Description', location='Berlin',
+            address='Address', price=100, rooms=2, status=ListingStatusChoices.ACTIVE
+        )
+        start_date = timezone.now().date() + timedelta(days=3)
+        self.booking = Booking.objects.create(
+            listing=self.listing, user=self.guest, start_date=start_date, end_date=start_date + timedelta(days=2)
+        )
+        self.review = Review.objects.create(listing=self.listing, reviewer=self.guest, rating=5)
+
+    def test_columns_filled_on_create(self):
+        self.assertEqual(self.listing.owner_username, 'owner')
+        self.assertEqual(self.booking.user_username, 'guest')
+        self.assertEqual(self.review.reviewer_username, 'guest')
+
+    def test_unsaved_username_is_not_propagated(self):
+        self.guest.username = 'renamedguest'
+        self.guest.is_business_account = True
+        self.guest.save(update_fields=['is_business_account'])
+
+        self.booking.refresh_from_db()
+        self.assertEqual(self.booking.user_username, 'guest')
+        self.assertEqual(User.objects.get(pk=self.guest.pk).username, 'guest')
+
+        # Имя осталось измененным в памяти и переносится при сохранении, которое его пишет
+        self.guest.save()
+        self.booking.refresh_from_db()
+        self.assertEqual(self.booking.user_username, 'renamedguest')
+
+    def test_rename_through_serializer_propagates(self):
+        serializer = UpdateUserSerializer(self.guest, data={'username': 'renamed'}, partial=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        self.booking.refresh_from_db()
+        self.review.refresh_from_db()
+        self.assertEqual(self.booking.user_username, 'renamed')
+        self.assertEqual(self.review.reviewer_username, 'renamed')
+
+    def test_owner_rename_refreshes_cached_listing(self):
+        url = reverse('listing-detail', kwargs={'id': self.listing.id})
+        self.assertEqual(self.client.get(url).data['owner'], 'owner')
+
+        self.owner.username = 'newowner'
+        self.owner.save()
+        self.assertEqual(self.client.get(url).data['owner'], 'newowner')
+        self.assertEqual(self.client.get(reverse('listing-list')).data['results'][0]['owner'], 'newowner')
+
+    def test_listing_list_without_users_join(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('listing-list'))
+        self.assertEqual(response.data['results'][0]['owner'], 'owner')
+        self.assertFalse([query for query in queries.captured_queries if 'users_user' in query['sql']])
+
+    def test_rebuild_command(self):
+        Listing.objects.update(owner_username='')
+        Review.objects.update(reviewer_username='')
+
+        out = StringIO()
+        call_command('rebuild_username_columns', stdout=out)
+        self.assertIn('1 listings', out.getvalue())
+        self.listing.refresh_from_db()
+        self.review.refresh_from_db()
+        self.assertEqual((self.listing.owner_username, self.review.reviewer_username), ('owner', 'guest'))
@@ -1,12 +1,14 @@
 from rest_framework import generics, status, permissions
 from rest_framework.response import Response
 from rest_framework.exceptions import PermissionDenied, NotFound
-from rest_framework_simplejwt.tokens import RefreshToken
 from ..serializers import (CreateUserSerializer, UserListSerializer, UserDetailSerializer, UpdateUserSerializer,
                            ChangePasswordSerializer, ActivateUserSerializer, DeactivateUserSerializer,
                            DeleteUserSerializer)
 from ..models import User
 from ..choices import UserStatusChoices
+from ..authentication import UserClaimsRefreshToken
+from common.pagination import EstimatedCountPagination
+from common.mixins import ConditionalGetMixin
 
 
 class CreateUserView(generics.CreateAPIView):
@@ -20,7 +22,7 @@ class CreateUserView(generics.CreateAPIView):
 
         user = serializer.save()
 
-        refresh = RefreshToken.for_user(user)
+        refresh = UserClaimsRefreshToken.for_user(user)
 
         response_data = {
             'id': user.id,
@@ -31,16 +33,22 @@ class CreateUserView(generics.CreateAPIView):
         return Response(response_data, status=status.HTTP_201_CREATED)
 
 
-class UserListView(generics.ListAPIView):
+class UserListView(ConditionalGetMixin, generics.ListAPIView):
     queryset = User.objects.all().order_by('email')
     serializer_class = UserListSerializer
     permission_classes = [permissions.IsAdminUser]
+    pagination_class = EstimatedCountPagination
+    # email уникален и проиндексирован, поэтому служит ключом курсора
+    cursor_ordering = ('email',)
+    # status_changed_at обновляется при каждом сохранении пользователя
+    last_modified_fields = ('status_changed_at',)
 
 
-class UserDetailView(generics.RetrieveAPIView):
+class UserDetailView(ConditionalGetMixin, generics.RetrieveAPIView):
     queryset = User.objects.all()
     serializer_class = UserDetailSerializer
     permission_classes = [permissions.IsAuthenticated]
+    last_modified_fields = ('status_changed_at',)
 
     def get_object(self):
         obj = super().get_object()
@@ -0,0 +1,2 @@
+from .model_mixins import ChangedFieldsSaveMixin
+from .view_mixins import QuerySetShapingMixin, ConditionalGetMixin
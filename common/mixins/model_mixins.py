@@ -0,0 +1,40 @@
+from dirtyfields import DirtyFieldsMixin
+from django.db.models.expressions import BaseExpression, Combinable
+
+
+class ChangedFieldsSaveMixin(DirtyFieldsMixin):
+    """
+    Отслеживает изменения полей в памяти и сохраняет существующие объекты только по измененным колонкам.
+
+    Поля auto_now (updated_at и т.п.) добавляются в update_fields всегда, как при обычном save().
+    """
+
+    def get_changed_update_fields(self):
+        auto_now_fields = {
+            field.name for field in self._meta.concrete_fields if getattr(field, 'auto_now', False)
+        }
+        return set(self.get_dirty_fields(check_relationship=True)) | self.get_untracked_fields() | auto_now_fields
+
+    def get_untracked_fields(self):
+        # Снимок dirtyfields не содержит полей, отложенных при загрузке, и полей со значением-выражением (F()):
+        # такие поля, если они заданы на экземпляре, сохраняем всегда
+        deferred_fields = self.get_deferred_fields()
+        fields = set()
+        for field in self._meta.concrete_fields:
+            if field.primary_key or field.attname in deferred_fields:
+                continue
+            value = self.__dict__.get(field.attname)
+            if field.name not in self._original_state or isinstance(value, (BaseExpression, Combinable)):
+                fields.add(field.name)
+        return fields
+
+    def save(self, *args, **kwargs):
+        if (
+            not self._state.adding and
+            kwargs.get('update_fields') is None and
+            not kwargs.get('force_insert') and
+            not args
+        ):
+            kwargs['update_fields'] = self.get_changed_update_fields()
+
+        super().save(*args, **kwargs)
@@ -0,0 +1,119 @@
+import hashlib
+from operator import attrgetter
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+from rest_framework import status
+from rest_framework.response import Response
+
+
+class QuerySetShapingMixin:
+    """
+    Декларативная форма queryset для списков: join'ы связанных моделей и проекция колонок.
+
+    Применяется в filter_queryset, поэтому работает поверх любого get_queryset вьюшки.
+    """
+
+    select_related_fields = ()
+    prefetch_related_fields = ()
+    only_fields = ()
+
+    def shape_queryset(self, queryset):
+        # Объединенные запросы (union) не поддерживают select_related и only
+        if queryset.query.combinator:
+            return queryset
+
+        if self.select_related_fields:
+            queryset = queryset.select_related(*self.select_related_fields)
+        if self.prefetch_related_fields:
+            queryset = queryset.prefetch_related(*self.prefetch_related_fields)
+        if self.only_fields:
+            queryset = queryset.only(*self.only_fields)
+        return queryset
+
+    def filter_queryset(self, queryset):
+        return super().filter_queryset(self.shape_queryset(queryset))
+
+
+class ConditionalGetMixin:
+    """
+    Валидаторы HTTP (ETag / Last-Modified) для retrieve и list.
+
+    Для объекта они берутся из полей last_modified_fields, для списка — из id и этих полей у строк страницы,
+    из состояния пагинатора и из get_list_validator_parts. Поля могут указывать на связанные строки,
+    данные которых попадают в ответ ('listing.updated_at'). При совпадении с If-None-Match или
+    If-Modified-Since ответ 304 отдается до сериализации. ETag зависит от пользователя, формата ответа
+    и строки запроса.
+
+    Списки отдают только ETag: Last-Modified по строкам страницы не меняется, когда строка уходит из списка.
+    """
+
+    last_modified_fields = ('updated_at',)
+
+    def get_modified_timestamps(self, instance):
+        return [attrgetter(field)(instance) for field in self.last_modified_fields]
+
+    def get_last_modified(self, instance):
+        timestamps = [timestamp for timestamp in self.get_modified_timestamps(instance) if timestamp is not None]
+        return max(timestamps) if timestamps else None
+
+    def make_etag(self, *parts):
+        request = self.request
+        accepted = getattr(request, 'accepted_media_type', '')
+        signature = ':'.join(str(part) for part in (request.user.pk, accepted, request.get_full_path(), *parts))
+        return '"' + hashlib.md5(signature.encode()).hexdigest() + '"'
+
+    def is_not_modified(self, etag, last_modified):
+        if_none_match = self.request.headers.get('If-None-Match')
+        if if_none_match:
+            return etag in parse_etags(if_none_match) or if_none_match.strip() == '*'
+
+        if_modified_since = parse_http_date_safe(self.request.headers.get('If-Modified-Since', ''))
+        return bool(last_modified and if_modified_since and int(last_modified.timestamp()) <= if_modified_since)
+
+    def set_validators(self, response, etag, last_modified):
+        response['ETag'] = etag
+        if last_modified:
+            response['Last-Modified'] = http_date(last_modified.timestamp())
+        return response
+
+    def conditional_response(self, etag, last_modified, get_data):
+        if self.is_not_modified(etag, last_modified):
+            return self.set_validators(Response(status=status.HTTP_304_NOT_MODIFIED), etag, last_modified)
+        return self.set_validators(Response(get_data()), etag, last_modified)
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        last_modified = self.get_last_modified(instance)
+        # Каждая метка входит в ETag отдельно: изменение связанной строки может не превысить максимум
+        etag = self.make_etag(instance._meta.label, instance.pk, *self.get_modified_timestamps(instance))
+        return self.conditional_response(etag, last_modified, lambda: self.get_serializer(instance).data)
+
+    def get_list_validator_parts(self):
+        """Части ETag списка, которые не выводятся из строк страницы (например, блоки по всему queryset)."""
+        return ()
+
+    def get_list_etag(self, rows):
+        # Отдельный агрегирующий COUNT/MAX по таблице свел бы на нет курсорную и оценочную пагинацию,
+        # поэтому ETag строится по уже выбранной странице и состоянию пагинатора
+        parts = [(row.pk, *self.get_modified_timestamps(row)) for row in rows]
+
+        get_validator_parts = getattr(self.paginator, 'get_validator_parts', None)
+        if get_validator_parts:
+            parts.append(get_validator_parts())
+        parts.extend(self.get_list_validator_parts())
+        return self.make_etag(*parts)
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        rows = page if page is not None else list(queryset)
+
+        etag = self.get_list_etag(rows)
+        if self.is_not_modified(etag, None):
+            return self.set_validators(Response(status=status.HTTP_304_NOT_MODIFIED), etag, None)
+
+        serializer = self.get_serializer(rows, many=True)
+        if page is not None:
+            response = self.get_paginated_response(serializer.data)
+        else:
+            response = Response(serializer.data)
+        return self.set_validators(response, etag, None)
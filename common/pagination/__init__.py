@@ -0,0 +1,2 @@
+from .hybrid_pagination import KeysetCursorPagination, HybridPagination
+from .estimated_count_pagination import EstimatedCountPaginator, EstimatedCountPagination
@@ -0,0 +1,125 @@
+import hashlib
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator as DjangoPaginator
+from django.db import connections
+from django.utils.functional import cached_property
+from rest_framework.response import Response
+from .hybrid_pagination import HybridPagination
+
+
+def _is_unfiltered(queryset):
+    query = queryset.query
+    return not query.where and not query.combinator and not query.distinct and not query.low_mark and \
+        query.high_mark is None
+
+
+def estimate_table_rows(queryset):
+    # Оценка числа строк из статистики InnoDB; доступна только на MySQL
+    connection = connections[queryset.db]
+    if connection.vendor != 'mysql':
+        return None
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT TABLE_ROWS FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s',
+            [queryset.model._meta.db_table]
+        )
+        row = cursor.fetchone()
+    return row[0] if row else None
+
+
+class EstimatedCountPage(Page):
+    def __init__(self, object_list, number, paginator, has_next):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
+
+
+class EstimatedCountPaginator(DjangoPaginator):
+    """
+    Paginator, который не выполняет COUNT(*) по большим таблицам.
+
+    Для нефильтрованного queryset выше порога возвращает оценку из information_schema,
+    иначе точный COUNT(*), который кешируется, если он не меньше порога.
+
+    count только сообщается клиенту: оценка и кешированное значение могут расходиться с таблицей,
+    поэтому существование страницы и has_next определяются по строкам, выбранным с запасом в одну.
+    """
+
+    approximate = False
+
+    def validate_number(self, number):
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages['invalid_page'])
+        if number < 1:
+            raise EmptyPage(self.error_messages['min_page'])
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage(self.error_messages['no_results'])
+        return EstimatedCountPage(rows[:self.per_page], number, self, has_next=len(rows) > self.per_page)
+
+    @cached_property
+    def count(self):
+        threshold = settings.PAGINATION_ESTIMATE_THRESHOLD
+
+        if _is_unfiltered(self.object_list):
+            estimate = estimate_table_rows(self.object_list)
+            if estimate is not None and estimate >= threshold:
+                self.approximate = True
+                return estimate
+
+        try:
+            sql, params = self.object_list.query.sql_with_params()
+        except EmptyResultSet:
+            # Пустой queryset (.none()) не компилируется в SQL, строк в нем нет
+            return 0
+        cache_key = 'pagination-count:' + hashlib.md5(f'{sql}{params}'.encode()).hexdigest()
+        count = cache.get(cache_key)
+        if count is not None:
+            # Значение из кеша не видит строк, добавленных за время его жизни
+            self.approximate = True
+            return count
+
+        count = super().count
+        if count >= threshold:
+            cache.set(cache_key, count, settings.PAGINATION_COUNT_CACHE_TIMEOUT)
+        return count
+
+
+class EstimatedCountPagination(HybridPagination):
+    """Постраничная пагинация с оценочным count для больших staff-списков; ответ содержит флаг approximate."""
+
+    django_paginator_class = EstimatedCountPaginator
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+
+        return Response({
+            'count': self.page.paginator.count,
+            'approximate': self.page.paginator.approximate,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema['properties']['approximate'] = {
+            'type': 'boolean',
+            'example': False,
+        }
+        return response_schema
@@ -0,0 +1,84 @@
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    Keyset-пагинация по индексированным колонкам: без COUNT(*) и без OFFSET-сканирования.
+
+    Порядок берется из атрибута вьюшки cursor_ordering; параметр ordering в этом режиме не учитывается,
+    так как курсор должен опираться на индекс.
+    """
+
+    ordering = ('-created_at', '-id')
+
+    def get_ordering(self, request, queryset, view):
+        return tuple(getattr(view, 'cursor_ordering', None) or self.ordering)
+
+
+class HybridPagination(PageNumberPagination):
+    """
+    Постраничная пагинация с переключением на курсорную.
+
+    Курсорный режим выбирается запросом (?pagination=cursor или переданный ?cursor=)
+    либо вьюшкой через pagination_mode = 'cursor'. Ответ в курсорном режиме не содержит count.
+    """
+
+    mode_query_param = 'pagination'
+    cursor_query_param = 'cursor'
+    cursor_class = KeysetCursorPagination
+
+    def __init__(self):
+        self.cursor_paginator = None
+
+    def use_cursor(self, queryset, request, view):
+        # Объединенные запросы (union) нельзя дофильтровать по ключу курсора
+        if queryset.query.combinator:
+            return False
+
+        mode = request.query_params.get(self.mode_query_param) or getattr(view, 'pagination_mode', 'page')
+        return mode == 'cursor' or self.cursor_query_param in request.query_params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.use_cursor(queryset, request, view):
+            self.cursor_paginator = self.cursor_class()
+            self.cursor_paginator.page_size = self.page_size
+            self.cursor_paginator.cursor_query_param = self.cursor_query_param
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+
+        self.cursor_paginator = None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_validator_parts(self):
+        # Состояние пагинатора, от которого зависит ответ помимо строк страницы (для ETag)
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.has_next, self.cursor_paginator.has_previous
+        return self.page.paginator.count, self.page.number, self.page.has_next()
+
+    def to_html(self):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.to_html()
+        return super().to_html()
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        return parameters + [
+            {
+                'name': self.mode_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Pagination mode: "page" (default) or "cursor".',
+                'schema': {'type': 'string', 'enum': ['page', 'cursor']},
+            },
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Opaque cursor returned in next/previous links.',
+                'schema': {'type': 'string'},
+            },
+        ]
@@ -0,0 +1,164 @@
+from datetime import timedelta
+from unittest.mock import patch
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.bookings.models import Booking
+from apps.listings.models import Listing
+from apps.listings.choices import ListingStatusChoices
+from apps.reviews.models import Review
+from apps.users.models import User
+from common.pagination import EstimatedCountPagination
+
+
+class TestConditionalGet(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(
+            username='owner', email='owner@example.com', password='password123', is_business_account=True
+        )
+        self.guest = User.objects.create_user(
+            username='guest', email='guest@example.com', password='password123'
+        )
+        self.admin = User.objects.create_user(
+            username='admin', email='admin@example.com', password='password123', is_staff=True
+        )
+        self.listing = Listing.objects.create(
+            owner=self.owner,
+            title='Conditional listing',
+            description='Description',
+            location='Berlin',
+            address='Address',
+            price=100,
+            rooms=2,
+            status=ListingStatusChoices.ACTIVE
+        )
+        today = timezone.now().date()
+        self.booking = Booking.objects.create(
+            listing=self.listing,
+            user=self.guest,
+            start_date=today + timedelta(days=5),
+            end_date=today + timedelta(days=7),
+        )
+
+    def assertNotModified(self, url, **headers):
+        response = self.client.get(url, **headers)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertFalse(response.content)
+        return response
+
+    def test_listing_detail_etag(self):
+        url = reverse('listing-detail', kwargs={'id': self.listing.id})
+        response = self.client.get(url)
+        self.assertIn('Last-Modified', response)
+
+        # Второй запрос обслуживается из кеша представления и отдает тот же ETag
+        self.assertEqual(self.client.get(url)['ETag'], response['ETag'])
+        self.assertNotModified(url, HTTP_IF_NONE_MATCH=response['ETag'])
+
+        self.listing.title = 'Changed listing title'
+        self.listing.save()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag']).status_code, status.HTTP_200_OK)
+
+    def test_etag_varies_by_user(self):
+        url = reverse('listing-detail', kwargs={'id': self.listing.id})
+        anonymous_etag = self.client.get(url)['ETag']
+
+        self.client.force_authenticate(user=self.owner)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=anonymous_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], anonymous_etag)
+
+    def test_booking_detail_if_modified_since(self):
+        self.client.force_authenticate(user=self.guest)
+        url = reverse('booking-detail', kwargs={'id': self.booking.id})
+        response = self.client.get(url)
+        self.assertNotModified(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+
+    def test_not_modified_skips_serialization_queries(self):
+        self.client.force_authenticate(user=self.guest)
+        url = reverse('booking-detail', kwargs={'id': self.booking.id})
+        etag = self.client.get(url)['ETag']
+        # Только выборка бронирования вместе с листингом: права проверяются по id, сериализатор не вызывается
+        with self.assertNumQueries(1):
+            self.assertNotModified(url, HTTP_IF_NONE_MATCH=etag)
+
+    def test_booking_list_changes_with_status(self):
+        self.client.force_authenticate(user=self.guest)
+        url = reverse('user-bookings-list')
+        etag = self.client.get(url)['ETag']
+        self.assertNotModified(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.booking.cancel()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_200_OK)
+
+    def test_listing_list_changes_when_row_leaves_page(self):
+        url = reverse('listing-list')
+        etag = self.client.get(url)['ETag']
+        self.assertNotModified(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.listing.deactivate()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 0)
+
+    def test_list_has_no_last_modified(self):
+        # MAX(updated_at) по странице не меняется, когда строка уходит из списка: If-Modified-Since не дал бы 200
+        response = self.client.get(reverse('listing-list'))
+        self.assertNotIn('Last-Modified', response)
+        response = self.client.get(reverse('listing-list'), HTTP_IF_MODIFIED_SINCE='Fri, 01 Jan 2100 00:00:00 GMT')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_booking_list_changes_with_listing_title(self):
+        self.client.force_authenticate(user=self.guest)
+        url = reverse('user-bookings-list')
+        etag = self.client.get(url)['ETag']
+
+        self.listing.title = 'Renamed listing'
+        self.listing.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'][0]['listing_title'], 'Renamed listing')
+
+    def test_listing_list_changes_with_facets(self):
+        other = Listing.objects.create(
+            owner=self.owner, title='Second listing', description='Description', location='Berlin',
+            address='Address', price=100, rooms=2, status=ListingStatusChoices.ACTIVE
+        )
+        url = reverse('listing-list')
+        with patch.object(EstimatedCountPagination, 'page_size', 1):
+            etag = self.client.get(url, {'facets': 'location'})['ETag']
+
+            # Строка второй страницы меняет фасеты, первая страница остается прежней
+            self.listing.location = 'Munich'
+            self.listing.save()
+            cache.clear()  # Фасеты кешируются на LISTING_FACETS_CACHE_TIMEOUT
+            response = self.client.get(url, {'facets': 'location'}, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row['id'] for row in response.data['results']], [other.id])
+        self.assertIn({'value': 'Munich', 'count': 1}, response.data['facets']['location'])
+
+    def test_list_etag_depends_on_query_string(self):
+        url = reverse('listing-list')
+        etag = self.client.get(url)['ETag']
+        response = self.client.get(url, {'rooms': 2}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_user_detail_and_list(self):
+        self.client.force_authenticate(user=self.admin)
+        for url in (reverse('user-detail', kwargs={'pk': self.guest.pk}), reverse('user-list')):
+            etag = self.client.get(url)['ETag']
+            self.assertNotModified(url, HTTP_IF_NONE_MATCH=etag)
+
+    def test_review_detail(self):
+        review = Review.objects.create(listing=self.listing, reviewer=self.guest, rating=5)
+        url = reverse('review-detail', kwargs={'id': review.id})
+        etag = self.client.get(url)['ETag']
+        self.assertNotModified(url, HTTP_IF_NONE_MATCH=etag)
+
+        review.apply_shadow_ban()
+        self.client.force_authenticate(user=self.guest)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_200_OK)
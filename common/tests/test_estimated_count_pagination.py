@@ -0,0 +1,91 @@
+from unittest.mock import patch
+from django.core.cache import cache
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from apps.listings.models import Listing
+from apps.listings.choices import ListingStatusChoices
+from apps.users.models import User
+from common.pagination import EstimatedCountPagination, EstimatedCountPaginator
+
+ESTIMATE_PATH = 'common.pagination.estimated_count_pagination.estimate_table_rows'
+
+
+class TestEstimatedCountPagination(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_user(
+            username='admin', email='admin@example.com', password='password123', is_staff=True
+        )
+        for i in range(3):
+            Listing.objects.create(
+                owner=self.admin,
+                title=f'Listing {i}',
+                description='Description',
+                location='Berlin',
+                address='Address',
+                price=100,
+                rooms=2,
+                status=ListingStatusChoices.ACTIVE
+            )
+        self.client.force_authenticate(user=self.admin)
+
+    def test_exact_count_below_threshold(self):
+        response = self.client.get(reverse('user-list'))
+        self.assertEqual(response.data['count'], 1)
+        self.assertFalse(response.data['approximate'])
+
+    @override_settings(PAGINATION_ESTIMATE_THRESHOLD=1000)
+    def test_unfiltered_list_uses_estimate(self):
+        with patch(ESTIMATE_PATH, return_value=1200000):
+            response = self.client.get(reverse('listing-list'))
+        self.assertEqual(response.data['count'], 1200000)
+        self.assertTrue(response.data['approximate'])
+        self.assertEqual(len(response.data['results']), 3)
+
+    @override_settings(PAGINATION_ESTIMATE_THRESHOLD=1000)
+    def test_filtered_list_uses_exact_count(self):
+        with patch(ESTIMATE_PATH, return_value=1200000) as estimate:
+            response = self.client.get(reverse('listing-list'), {'search': 'Listing 1'})
+        estimate.assert_not_called()
+        self.assertEqual(response.data['count'], 1)
+        self.assertFalse(response.data['approximate'])
+
+    @override_settings(PAGINATION_ESTIMATE_THRESHOLD=2)
+    def test_large_exact_count_is_cached(self):
+        url = reverse('listing-list')
+        self.client.get(url, {'rooms': 2})
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {'rooms': 2})
+        self.assertEqual(response.data['count'], 3)
+        self.assertFalse(any('COUNT(' in query['sql'] for query in queries.captured_queries))
+        self.assertTrue(response.data['approximate'])
+
+    @override_settings(PAGINATION_ESTIMATE_THRESHOLD=1)
+    def test_low_estimate_does_not_hide_tail_pages(self):
+        with patch(ESTIMATE_PATH, return_value=1), patch.object(EstimatedCountPagination, 'page_size', 1):
+            response = self.client.get(reverse('listing-list'), {'page': 3})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertIsNone(response.data['next'])
+
+    @override_settings(PAGINATION_ESTIMATE_THRESHOLD=1000)
+    def test_high_estimate_does_not_link_empty_pages(self):
+        url = reverse('listing-list')
+        with patch(ESTIMATE_PATH, return_value=1200000), patch.object(EstimatedCountPagination, 'page_size', 2):
+            first = self.client.get(url)
+            last = self.client.get(url, {'page': 2})
+            beyond = self.client.get(url, {'page': 3})
+
+        self.assertIsNotNone(first.data['next'])
+        self.assertEqual(len(last.data['results']), 1)
+        self.assertIsNone(last.data['next'])
+        self.assertEqual(beyond.status_code, 404)
+
+    def test_empty_queryset(self):
+        paginator = EstimatedCountPaginator(Listing.objects.none().order_by('id'), 10)
+        self.assertEqual(paginator.count, 0)
+        self.assertEqual(list(paginator.page(1)), [])
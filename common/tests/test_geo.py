@@ -0,0 +1,26 @@
+import unittest
+from common.utils.geo import bounding_box, geohash_cover, geohash_encode, haversine_km
+
+
+class TestGeo(unittest.TestCase):
+
+    def test_geohash_encode(self):
+        self.assertEqual(geohash_encode(57.64911, 10.40744, 11), 'u4pruydqqvj')
+        self.assertEqual(len(geohash_encode(0, 0)), 12)
+
+    def test_geohash_cover_contains_points_inside_bbox(self):
+        cells = geohash_cover(52.3, 13.0, 52.7, 13.8)
+        self.assertLessEqual(len(cells), 16)
+        for latitude, longitude in ((52.3, 13.0), (52.52, 13.405), (52.7, 13.8), (52.69, 13.01)):
+            geohash = geohash_encode(latitude, longitude)
+            self.assertTrue(any(geohash.startswith(cell) for cell in cells))
+
+    def test_bounding_box_contains_radius(self):
+        min_lat, min_lng, max_lat, max_lng = bounding_box(52.52, 13.405, 10)
+        self.assertAlmostEqual(haversine_km(52.52, 13.405, max_lat, 13.405), 10, places=3)
+        self.assertAlmostEqual(haversine_km(52.52, 13.405, min_lat, 13.405), 10, places=3)
+        self.assertGreater(haversine_km(52.52, 13.405, 52.52, max_lng), 10 - 0.1)
+
+    def test_haversine(self):
+        # Берлин — Мюнхен
+        self.assertAlmostEqual(haversine_km(52.52, 13.405, 48.137, 11.575), 504, delta=1)
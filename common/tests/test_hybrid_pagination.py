@@ -0,0 +1,76 @@
+from datetime import timedelta
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.bookings.models import Booking
+from apps.listings.models import Listing
+from apps.listings.choices import ListingStatusChoices
+from apps.users.models import User
+
+
+class TestHybridPagination(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            username='admin', email='admin@example.com', password='password123', is_staff=True
+        )
+        self.owner = User.objects.create_user(
+            username='owner', email='owner@example.com', password='password123', is_business_account=True
+        )
+        self.listing = Listing.objects.create(
+            owner=self.owner,
+            title='Test Listing',
+            description='Description',
+            location='Berlin',
+            address='Address',
+            price=100,
+            rooms=2,
+            status=ListingStatusChoices.ACTIVE
+        )
+        today = timezone.now().date()
+        for i in range(15):
+            User.objects.create_user(username=f'user{i:02d}', email=f'user{i:02d}@example.com', password='password123')
+            Booking.objects.create(
+                listing=self.listing,
+                user=self.admin,
+                start_date=today + timedelta(days=i * 3 + 1),
+                end_date=today + timedelta(days=i * 3 + 2),
+            )
+
+    def collect_cursor_pages(self, url):
+        ids = []
+        response = self.client.get(url, {'pagination': 'cursor'})
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn('count', response.data)
+            ids.extend(item['id'] for item in response.data['results'])
+            if not response.data['next']:
+                return ids
+            response = self.client.get(response.data['next'])
+
+    def test_page_mode_is_default(self):
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(reverse('owner-listing-bookings-list'))
+        self.assertEqual(response.data['count'], 15)
+
+    def test_cursor_mode_walks_all_bookings(self):
+        self.client.force_authenticate(user=self.admin)
+        ids = self.collect_cursor_pages(reverse('owner-listing-bookings-list'))
+        expected = list(Booking.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+        self.assertEqual(ids, expected)
+
+    def test_cursor_mode_users_ordered_by_email(self):
+        self.client.force_authenticate(user=self.admin)
+        ids = self.collect_cursor_pages(reverse('user-list'))
+        expected = list(User.objects.order_by('email').values_list('id', flat=True))
+        self.assertEqual(ids, expected)
+
+    def test_cursor_mode_skips_count_query(self):
+        self.client.force_authenticate(user=self.admin)
+        with self.assertNumQueries(1):
+            self.client.get(reverse('user-list'), {'pagination': 'cursor'})
+
+    def test_invalid_cursor(self):
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(reverse('user-list'), {'cursor': 'garbage'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,36 @@
+from django.test import SimpleTestCase
+from common.utils.lru_cache import LRUCache
+
+
+class TestLRUCache(SimpleTestCase):
+    def test_evicts_least_recently_used(self):
+        lru = LRUCache(maxsize=2, ttl=60)
+        lru.set('a', 1)
+        lru.set('b', 2)
+        self.assertEqual(lru.get('a'), 1)
+
+        lru.set('c', 3)
+        self.assertIsNone(lru.get('b'))
+        self.assertEqual((lru.get('a'), lru.get('c')), (1, 3))
+        self.assertEqual(len(lru), 2)
+
+    def test_expired_entries_are_missing(self):
+        lru = LRUCache(maxsize=2, ttl=0)
+        lru.set('a', 1)
+        self.assertEqual(lru.get('a', 'missing'), 'missing')
+        self.assertEqual(len(lru), 0)
+
+    def test_zero_size_disables_cache(self):
+        lru = LRUCache(maxsize=0, ttl=60)
+        lru.set('a', 1)
+        self.assertIsNone(lru.get('a'))
+
+    def test_pop_and_clear(self):
+        lru = LRUCache(maxsize=3, ttl=60)
+        lru.set('a', 1)
+        lru.set('b', 2)
+        lru.pop('a')
+        lru.pop('missing')
+        self.assertIsNone(lru.get('a'))
+        lru.clear()
+        self.assertEqual(len(lru), 0)
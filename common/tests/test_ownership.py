@@ -0,0 +1,29 @@
+from types import SimpleNamespace
+from django.contrib.auth.models import AnonymousUser
+from django.test import SimpleTestCase
+from common.utils.ownership import is_owner, owner_id_of
+
+
+class TestOwnership(SimpleTestCase):
+    def setUp(self):
+        self.user = SimpleNamespace(pk=7, is_authenticated=True)
+        self.booking = SimpleNamespace(user_id=3, listing=SimpleNamespace(owner_id=7))
+
+    def test_owner_id_of_follows_path(self):
+        self.assertEqual(owner_id_of(self.booking, 'user_id'), 3)
+        self.assertEqual(owner_id_of(self.booking, 'listing.owner_id'), 7)
+
+    def test_missing_relation(self):
+        self.assertIsNone(owner_id_of(SimpleNamespace(listing=None), 'listing.owner_id'))
+
+    def test_path_must_end_with_id(self):
+        with self.assertRaises(ValueError):
+            owner_id_of(self.booking, 'listing.owner')
+
+    def test_is_owner_matches_any_path(self):
+        self.assertFalse(is_owner(self.user, self.booking, 'user_id'))
+        self.assertTrue(is_owner(self.user, self.booking, 'user_id', 'listing.owner_id'))
+
+    def test_anonymous_is_never_owner(self):
+        self.assertFalse(is_owner(AnonymousUser(), SimpleNamespace(owner_id=None), 'owner_id'))
+        self.assertFalse(is_owner(None, self.booking, 'user_id'))
@@ -0,0 +1,24 @@
+import time
+from django.core.cache import cache
+from django.db import transaction
+
+
+def get_cache_version(key):
+    # Версия — метка времени, а не счетчик: после вытеснения ключа она не повторит старые значения
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_cache_versions(keys):
+    cache.set_many({key: time.time_ns() for key in keys}, timeout=None)
+
+
+def invalidate_cache_versions(keys):
+    # Версия повышается сразу и еще раз после коммита: читатель между ними мог закешировать
+    # еще не зафиксированные данные под новой версией
+    keys = list(keys)
+    bump_cache_versions(keys)
+    transaction.on_commit(lambda: bump_cache_versions(keys))
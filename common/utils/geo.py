@@ -0,0 +1,90 @@
+import math
+
+EARTH_RADIUS_KM = 6371.0088
+GEOHASH_ALPHABET = '0123456789bcdefghjkmnpqrstuvwxyz'
+GEOHASH_PRECISION = 12
+# Не больше стольких ячеек geohash на покрытие прямоугольника
+GEOHASH_MAX_COVER_CELLS = 16
+
+
+def geohash_encode(latitude, longitude, precision=GEOHASH_PRECISION):
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    latitude, longitude = float(latitude), float(longitude)
+
+    result = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(result) < precision:
+        # Четные биты кодируют долготу, нечетные — широту
+        value, value_range = (longitude, lng_range) if even else (latitude, lat_range)
+        middle = (value_range[0] + value_range[1]) / 2
+        if value >= middle:
+            bits = (bits << 1) | 1
+            value_range[0] = middle
+        else:
+            bits <<= 1
+            value_range[1] = middle
+        even = not even
+
+        bit_count += 1
+        if bit_count == 5:
+            result.append(GEOHASH_ALPHABET[bits])
+            bits = 0
+            bit_count = 0
+    return ''.join(result)
+
+
+def geohash_cell_size(precision):
+    # Размер ячейки в градусах (широта, долгота) для заданной длины geohash
+    lng_bits = math.ceil(precision * 5 / 2)
+    lat_bits = precision * 5 // 2
+    return 180.0 / 2 ** lat_bits, 360.0 / 2 ** lng_bits
+
+
+def geohash_cover(min_lat, min_lng, max_lat, max_lng, max_cells=GEOHASH_MAX_COVER_CELLS):
+    """
+    Возвращает набор префиксов geohash, покрывающих прямоугольник.
+
+    Берется самая длинная точность, при которой покрытие укладывается в max_cells ячеек.
+    """
+    best = set()
+    for precision in range(1, GEOHASH_PRECISION + 1):
+        lat_step, lng_step = geohash_cell_size(precision)
+        rows = math.floor(max_lat / lat_step) - math.floor(min_lat / lat_step) + 1
+        columns = math.floor(max_lng / lng_step) - math.floor(min_lng / lng_step) + 1
+        if rows * columns > max_cells:
+            break
+
+        cells = set()
+        for row in range(rows):
+            latitude = min(min_lat + row * lat_step, max_lat)
+            for column in range(columns):
+                longitude = min(min_lng + column * lng_step, max_lng)
+                cells.add(geohash_encode(latitude, longitude, precision))
+        # Углы прямоугольника могут попасть в ячейки, пропущенные шагом сетки
+        for latitude in (min_lat, max_lat):
+            for longitude in (min_lng, max_lng):
+                cells.add(geohash_encode(latitude, longitude, precision))
+        best = cells
+    return best
+
+
+def bounding_box(latitude, longitude, radius_km):
+    """Прямоугольник (min_lat, min_lng, max_lat, max_lng), описанный вокруг окружности радиуса radius_km."""
+    lat_delta = math.degrees(radius_km / EARTH_RADIUS_KM)
+    cos_lat = math.cos(math.radians(latitude))
+    lng_delta = 180.0 if cos_lat < 1e-9 else min(math.degrees(radius_km / (EARTH_RADIUS_KM * cos_lat)), 180.0)
+    return (
+        max(latitude - lat_delta, -90.0),
+        max(longitude - lng_delta, -180.0),
+        min(latitude + lat_delta, 90.0),
+        min(longitude + lng_delta, 180.0),
+    )
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    lat1, lng1, lat2, lng2 = map(math.radians, (float(lat1), float(lng1), float(lat2), float(lng2)))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
@@ -0,0 +1,23 @@
+def owner_id_of(obj, path):
+    """
+    Id пользователя, на которого ссылается obj по пути из атрибутов, например 'user_id' или 'listing.owner_id'.
+
+    Путь заканчивается колонкой *_id, поэтому связанный пользователь не загружается. Промежуточные объекты
+    (listing) должны быть выбраны тем же запросом через select_related.
+    """
+    *relations, id_attr = path.split('.')
+    if not id_attr.endswith('_id'):
+        raise ValueError(f'Ownership path must end with an *_id attribute: {path!r}.')
+
+    for relation in relations:
+        obj = getattr(obj, relation)
+        if obj is None:
+            return None
+    return getattr(obj, id_attr)
+
+
+def is_owner(user, obj, *paths):
+    """Проверяет, что user — один из пользователей, на которых ссылается obj по путям paths."""
+    if user is None or not user.is_authenticated:
+        return False
+    return any(owner_id_of(obj, path) == user.pk for path in paths)
@@ -0,0 +1,34 @@
+from unittest.mock import patch
+from urllib.parse import urlparse
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve
+
+
+class QueryBudgetTestMixin:
+    """
+    Миксин для APITestCase: проверяет, что страница списка укладывается в бюджет запросов
+    и что число запросов не зависит от размера страницы (нет N+1).
+    """
+
+    def assertQueryBudget(self, url, budget, page_sizes=(1, 10), data=None):
+        pagination_class = resolve(urlparse(url).path).func.view_class.pagination_class
+        query_counts = {}
+
+        for page_size in page_sizes:
+            with patch.object(pagination_class, 'page_size', page_size), \
+                    CaptureQueriesContext(connection) as context:
+                response = self.client.get(url, data)
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.data['results']), page_size,
+                             'Not enough rows to fill the page; create more test data.')
+            query_counts[page_size] = len(context)
+            self.assertLessEqual(
+                len(context), budget,
+                f'{url} issued {len(context)} queries with page size {page_size}, budget is {budget}:\n' +
+                '\n'.join(query['sql'] for query in context.captured_queries)
+            )
+
+        self.assertEqual(len(set(query_counts.values())), 1,
+                         f'Query count of {url} depends on page size: {query_counts}')
@@ -97,6 +97,14 @@ DATABASES = {
     }
 }
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# CACHE_URL selects the backend, e.g. redis://redis:6379/1 or pymemcache://memcached:11211; locmemcache:// by default.
+
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://'),
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -145,14 +153,14 @@ REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_FILTER_BACKENDS': ['django_filters.rest_framework.DjangoFilterBackend'],
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apps.users.authentication.ClaimsJWTAuthentication',
         'rest_framework.authentication.SessionAuthentication',
         'rest_framework.authentication.BasicAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'common.pagination.HybridPagination',
     'PAGE_SIZE': 10,
 }
 
@@ -162,4 +170,42 @@ SIMPLE_JWT = {
     'ROTATE_REFRESH_TOKENS': True,
     'BLACKLIST_AFTER_ROTATION': True,
     'AUTH_HEADER_TYPES': ('Bearer',),
+    # Tokens carry the status claim, so authenticated requests that only need the user id do not
+    # SELECT the user row; permission flags and username are read through the per-process user cache.
+    # Revocation markers live in CACHES['default'], which must be shared between processes (users.W001).
+    'TOKEN_OBTAIN_SERIALIZER': 'apps.users.serializers.UserTokenObtainPairSerializer',
+    'TOKEN_REFRESH_SERIALIZER': 'apps.users.serializers.UserTokenRefreshSerializer',
 }
+
+# Read listing occupancy from the denormalized ListingNight table.
+# The table is always maintained; run `manage.py rebuild_listing_nights` before enabling.
+USE_LISTING_NIGHTS = env.bool('USE_LISTING_NIGHTS', default=False)
+
+# How many times a booking reservation is retried after a MySQL deadlock or lock wait timeout.
+BOOKING_RESERVATION_RETRIES = env.int('BOOKING_RESERVATION_RETRIES', default=3)
+
+# Unfiltered staff lists above this many rows report MySQL's table row estimate instead of COUNT(*).
+# Exact counts at or above the threshold are cached for PAGINATION_COUNT_CACHE_TIMEOUT seconds.
+PAGINATION_ESTIMATE_THRESHOLD = env.int('PAGINATION_ESTIMATE_THRESHOLD', default=100000)
+PAGINATION_COUNT_CACHE_TIMEOUT = env.int('PAGINATION_COUNT_CACHE_TIMEOUT', default=60)
+
+# Without MySQL FULLTEXT (SQLite in tests) search ranks at most this many substring matches in memory.
+FULLTEXT_FALLBACK_MAX_ROWS = env.int('FULLTEXT_FALLBACK_MAX_ROWS', default=1000)
+
+# Seconds after which each process fully rebuilds its in-memory listing search index.
+# Changes made in the same process are applied immediately; 0 disables periodic rebuilds.
+LISTING_SEARCH_INDEX_TTL = env.int('LISTING_SEARCH_INDEX_TTL', default=300)
+
+# Listing list facets (?facets=): price histogram bucket width, number of most frequent locations
+# returned and cache lifetime in seconds.
+LISTING_PRICE_FACET_STEP = env.int('LISTING_PRICE_FACET_STEP', default=50)
+LISTING_LOCATION_FACET_LIMIT = env.int('LISTING_LOCATION_FACET_LIMIT', default=20)
+LISTING_FACETS_CACHE_TIMEOUT = env.int('LISTING_FACETS_CACHE_TIMEOUT', default=60)
+
+# Lifetime in seconds of the cached public listing detail; saves and admin actions invalidate it earlier.
+LISTING_DETAIL_CACHE_TIMEOUT = env.int('LISTING_DETAIL_CACHE_TIMEOUT', default=300)
+
+# Per-process LRU cache of users loaded by JWT authentication: max entries and lifetime in seconds.
+# Entries are also dropped when the user's version in the shared cache changes (saves, admin status actions).
+USER_CACHE_SIZE = env.int('USER_CACHE_SIZE', default=1000)
+USER_CACHE_TTL = env.int('USER_CACHE_TTL', default=60)